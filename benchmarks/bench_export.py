@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+"""
+benchmarks/bench_export.py
+
+Reports export throughput (sheets per second) for every vtm_export format,
+both cold (fresh characters, nothing cached) and warm (same characters again,
+served from the per-version render cache).
+
+Run from the repository root:
+    python -m benchmarks.bench_export
+    python -m benchmarks.bench_export --count 5000
+"""
+
+import argparse
+import io
+import sys
+import time
+
+import vtm_npc_logic
+from vtm_export import FORMATS, export_stream
+from benchmarks.bench_render import build_character, SHEET_SIZES
+
+def make_library(count: int) -> list:
+    sizes = list(SHEET_SIZES)
+    return [build_character(sizes[i % len(sizes)]) for i in range(count)]
+
+def time_export(characters: list, fmt: str) -> tuple[float, int]:
+    """Returns (sheets per second, bytes written) for one pass over characters."""
+    stream = io.StringIO()
+    start = time.perf_counter()
+    export_stream(iter(characters), stream, fmt)
+    elapsed = time.perf_counter() - start
+    return len(characters) / elapsed, stream.tell()
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sheet export throughput.")
+    parser.add_argument("--count", type=int, default=1000, help="characters per run (default: 1000)")
+    args = parser.parse_args(argv)
+
+    # Keep every sheet of the run in the cache so the warm pass measures hits
+    vtm_npc_logic.RENDER_CACHE_SIZE = max(vtm_npc_logic.RENDER_CACHE_SIZE, args.count * len(FORMATS))
+
+    print(f"{'format':<10}{'cold sheets/s':>15}{'warm sheets/s':>15}{'KiB':>10}")
+    for fmt in FORMATS:
+        characters = make_library(args.count)
+        cold, size = time_export(characters, fmt)
+        warm, _ = time_export(characters, fmt)
+        print(f"{fmt:<10}{cold:>15.0f}{warm:>15.0f}{size / 1024:>10.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+"""
+benchmarks/bench_render.py
+
+Renders MainView and FinalView on the headless screen backend across sheet
+sizes and terminal dimensions, reporting time per frame and addstr calls.
+Optionally writes or checks text snapshots to catch rendering regressions.
+
+Run from the repository root:
+    python -m benchmarks.bench_render
+    python -m benchmarks.bench_render --snapshots benchmarks/snapshots          # check
+    python -m benchmarks.bench_render --snapshots benchmarks/snapshots --update # rewrite
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from tui.headless import HeadlessScreen, headless_curses
+from vtm_npc_logic import VtMCharacter
+from vtm_data import ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST, DISCIPLINES_LIST, BACKGROUNDS_LIST
+
+# --- [CASES] ---
+TERMINAL_SIZES = [(40, 100), (50, 140), (80, 240)]
+
+# Sheet size -> (extra disciplines, extra backgrounds)
+SHEET_SIZES = {
+    "small":  (0, 0),
+    "medium": (6, 5),
+    "large":  (len(DISCIPLINES_LIST), len(BACKGROUNDS_LIST)),
+}
+
+def build_character(size: str) -> VtMCharacter:
+    """Builds a deterministic character with a given amount of col3 content."""
+    extra_discs, extra_bgs = SHEET_SIZES[size]
+    character = VtMCharacter("Bench Elder", "Tremere", 1200, 6)
+    for i, attr in enumerate(ATTRIBUTES_LIST):
+        character.set_initial_trait("attributes", attr, 1 + i % 3)
+    for i, abil in enumerate(ABILITIES_LIST):
+        character.set_initial_trait("abilities", abil, i % 4)
+    for virt in VIRTUES_LIST:
+        character.set_initial_trait("virtues", virt, 3)
+    character.set_initial_value("humanity", 6)
+    character.set_initial_value("willpower", 5)
+    for disc in DISCIPLINES_LIST[:extra_discs]:
+        character.set_initial_trait("disciplines", disc, 1)
+    for bg in BACKGROUNDS_LIST[:extra_bgs]:
+        character.set_initial_trait("backgrounds", bg, 2)
+    character.improve_trait("Discipline", "Thaumaturgy", 4)
+    character.improve_trait("Attribute", "Intelligence", 4)
+    return character
+
+# --- [MEASUREMENT] ---
+def bench_main_view(character, height: int, width: int, frames: int):
+    """Times MainView._draw_screen. Returns (seconds per frame, addstr per frame, screen)."""
+    from tui.main_view import MainView
+
+    screen = HeadlessScreen(height, width)
+    view = MainView(screen, character)
+    view.active_col = 2
+    cols = view._build_columns()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        view._draw_screen(*cols)
+    elapsed = time.perf_counter() - start
+    return elapsed / frames, screen.addstr_count / frames, screen
+
+def bench_final_view(character, height: int, width: int, frames: int):
+    """Times FinalView.show (one draw per call). Returns (seconds per frame, addstr per frame, screen)."""
+    from tui.final_view import FinalView
+
+    screen = HeadlessScreen(height, width)
+    view = FinalView(screen, character)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.feed("q")  # Any key other than E/S leaves the sheet
+        view.show()
+    elapsed = time.perf_counter() - start
+    return elapsed / frames, screen.addstr_count / frames, screen
+
+# --- [SNAPSHOTS] ---
+def check_snapshot(directory: str, case: str, text: str, update: bool) -> bool:
+    """Compares text against directory/case.txt. Writes it when missing or update is set."""
+    path = os.path.join(directory, f"{case}.txt")
+    if update or not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return True
+    with open(path, encoding="utf-8") as f:
+        return f.read() == text
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the headless sheet renderer.")
+    parser.add_argument("--frames", type=int, default=200, help="frames per case (default: 200)")
+    parser.add_argument("--snapshots", metavar="DIR", help="check rendered screens against text snapshots in DIR")
+    parser.add_argument("--update", action="store_true", help="rewrite snapshots instead of checking them")
+    args = parser.parse_args(argv)
+
+    views = {"main": bench_main_view, "final": bench_final_view}
+    failures = []
+
+    print(f"{'case':<28}{'ms/frame':>10}{'frames/s':>11}{'addstr':>9}")
+    with headless_curses():
+        for size in SHEET_SIZES:
+            character = build_character(size)
+            for height, width in TERMINAL_SIZES:
+                for view_name, bench in views.items():
+                    case = f"{view_name}-{size}-{height}x{width}"
+                    per_frame, calls, screen = bench(character, height, width, args.frames)
+                    print(f"{case:<28}{per_frame * 1000:>10.3f}{1 / per_frame:>11.0f}{calls:>9.0f}")
+                    if args.snapshots and not check_snapshot(args.snapshots, case, screen.dump_text(), args.update):
+                        failures.append(case)
+
+    if failures:
+        print(f"\nSnapshot mismatch: {', '.join(failures)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
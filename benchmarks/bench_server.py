@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""
+benchmarks/bench_server.py
+
+Local load test for vtm_server. Starts the API on a free loopback port, then
+runs concurrent keep-alive clients against a VTT-like request mix (sheet reads,
+state reads, trait raises and refunds) and reports requests/sec and latency
+percentiles per endpoint. Nothing leaves the machine and no saves are written.
+
+Run from the repository root:
+    python -m benchmarks.bench_server
+    python -m benchmarks.bench_server --clients 16 --requests 2000 --workers 16
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import vtm_server
+from tui.instrumentation import percentile
+
+def _request(conn, method: str, path: str, body: dict = None) -> dict:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    headers = {"Content-Type": "application/json"} if data else {}
+    conn.request(method, path, body=data, headers=headers)
+    response = conn.getresponse()
+    payload = json.loads(response.read())
+    if response.status >= 500:
+        raise RuntimeError(payload.get("message"))
+    return payload
+
+def _client(port: int, char_id: str, requests: int, latencies: dict, errors: list):
+    """One keep-alive client cycling through the request mix."""
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    path = f"/characters/{char_id}"
+    mix = (
+        ("sheet",   "GET",  f"{path}/sheet?format=text", None),
+        ("state",   "GET",  path, None),
+        ("improve", "POST", f"{path}/improve", {"category": "Attribute", "trait": "Strength", "value": 3}),
+        ("json",    "GET",  f"{path}/sheet?format=json", None),
+        ("improve", "POST", f"{path}/improve", {"category": "Attribute", "trait": "Strength", "value": 2}),
+    )
+    try:
+        for i in range(requests):
+            name, method, url, body = mix[i % len(mix)]
+            start = time.perf_counter()
+            _request(conn, method, url, body)
+            latencies[name].append((time.perf_counter() - start) * 1000)
+    except Exception as e:
+        errors.append(str(e))
+    finally:
+        conn.close()
+
+def run_load(clients: int, requests: int, workers: int) -> int:
+    server = vtm_server.start_in_thread(workers=workers)
+    port = server.server_port
+    try:
+        # One NPC per client, seeded like SetupView would
+        setup = http.client.HTTPConnection("127.0.0.1", port)
+        char_ids = []
+        for i in range(clients):
+            created = _request(setup, "POST", "/characters", {
+                "name": f"Load NPC {i}", "clan": "Brujah", "age": 150, "generation": 10,
+                "traits": {"attributes": {"Strength": 2, "Dexterity": 2}, "humanity": 6, "willpower": 4},
+            })
+            char_ids.append(created["id"])
+        setup.close()
+
+        per_client = [defaultdict(list) for _ in range(clients)]
+        errors: list = []
+        threads = [
+            threading.Thread(target=_client, args=(port, char_ids[i], requests, per_client[i], errors))
+            for i in range(clients)
+        ]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    merged = defaultdict(list)
+    for latencies in per_client:
+        for name, values in latencies.items():
+            merged[name].extend(values)
+    total = sum(len(v) for v in merged.values())
+
+    print(f"{clients} clients x {requests} requests, {workers} workers: "
+          f"{total} requests in {elapsed:.2f}s = {total / elapsed:.0f} req/s")
+    print(f"{'endpoint':<10}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, values in sorted(merged.items()) + [("all", [v for vs in merged.values() for v in vs])]:
+        print(f"{name:<10}{len(values):>8}{percentile(values, 50):>10.2f}{percentile(values, 90):>10.2f}"
+              f"{percentile(values, 99):>10.2f}{max(values, default=0):>10.2f}")
+    if errors:
+        print(f"{len(errors)} client(s) failed, first error: {errors[0]}")
+        return 1
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the HTTP API on loopback.")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent clients (default: 8)")
+    parser.add_argument("--requests", type=int, default=500, help="requests per client (default: 500)")
+    parser.add_argument("--workers", type=int, default=vtm_server.DEFAULT_WORKERS, help="server worker threads")
+    args = parser.parse_args(argv)
+    if args.clients > args.workers:
+        print("Note: keep-alive clients each hold a worker; extra clients queue until one frees up.")
+    return run_load(args.clients, args.requests, args.workers)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+benchmarks/bench_startup.py
+
+Measures cold start in fresh interpreters:
+  - import time of vtm_npc_tui from `python -X importtime`, with the slowest modules
+  - time to first frame: process spawn until the greeting screen's first
+    refresh(), drawn on the headless screen
+
+Fails when the median time to first frame exceeds the target.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 20 --target-ms 120
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_RUNS = 10
+DEFAULT_TARGET_MS = 100.0
+TOP_MODULES = 10
+
+# Runs in the child: start the real app on a headless screen and report the first refresh
+_FIRST_FRAME_SCRIPT = """
+import os, sys, time
+spawned = float(sys.argv[1])
+import vtm_npc_tui
+from tui.headless import HeadlessScreen, headless_curses
+
+class FirstFrameScreen(HeadlessScreen):
+    def refresh(self):
+        print(f"{(time.time() - spawned) * 1000:.3f}", flush=True)
+        os._exit(0)
+
+with headless_curses():
+    vtm_npc_tui.main(FirstFrameScreen(40, 120))
+"""
+
+def parse_importtime(stderr: str) -> dict:
+    """Returns {module: (self_us, cumulative_us)} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+def measure_import(runs: int) -> tuple:
+    """Returns (median vtm_npc_tui cumulative ms, modules of the last run)."""
+    totals, modules = [], {}
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import vtm_npc_tui"],
+                                capture_output=True, text=True, check=True)
+        modules = parse_importtime(result.stderr)
+        totals.append(modules["vtm_npc_tui"][1] / 1000)
+    return statistics.median(totals), modules
+
+def measure_first_frame(runs: int) -> list:
+    """Returns milliseconds from spawn to the first greeting frame, per run."""
+    times = []
+    for _ in range(runs):
+        spawned = time.time()
+        result = subprocess.run([sys.executable, "-c", _FIRST_FRAME_SCRIPT, str(spawned)],
+                                capture_output=True, text=True, check=True)
+        times.append(float(result.stdout.strip()))
+    return times
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold start time.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"fresh processes per measurement (default: {DEFAULT_RUNS})")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS,
+                        help=f"maximum median time to first frame (default: {DEFAULT_TARGET_MS:.0f})")
+    args = parser.parse_args(argv)
+
+    import_ms, modules = measure_import(args.runs)
+    print(f"import vtm_npc_tui: {import_ms:.1f} ms (median of {args.runs})")
+    print(f"\nSlowest modules (self time, last run):")
+    for name, (self_us, cumulative_us) in sorted(modules.items(), key=lambda m: -m[1][0])[:TOP_MODULES]:
+        print(f"  {name:<36}{self_us / 1000:>8.2f} ms{cumulative_us / 1000:>10.2f} ms cumulative")
+
+    frames = measure_first_frame(args.runs)
+    median = statistics.median(frames)
+    print(f"\nTime to first frame: median {median:.1f} ms, min {min(frames):.1f} ms, max {max(frames):.1f} ms "
+          f"(target {args.target_ms:.0f} ms)")
+    if median > args.target_ms:
+        print("Startup is over target.")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
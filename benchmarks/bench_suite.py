@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+"""
+benchmarks/bench_suite.py
+
+Benchmark suite for the logic, persistence and rendering hot paths:
+character construction, improve_trait/remove_trait, to_dict/from_dict round
+trips, save/load against libraries of 10, 1k and 50k files, and
+MainView._draw_screen on the headless screen.
+
+Each case runs several times. The best time per operation is compared against
+a stored baseline; a case regresses when it is slower than the baseline by more
+than its threshold (default 15%, overridable per case).
+
+Run from the repository root:
+    python -m benchmarks.bench_suite --save-baseline                # record benchmarks/baseline.json
+    python -m benchmarks.bench_suite                                 # compare against it
+    python -m benchmarks.bench_suite --only save_load --libraries 10,1000
+    python -m benchmarks.bench_suite --threshold 0.25 --threshold-for draw_screen=0.5
+"""
+
+import argparse
+import atexit
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Tuple
+
+from tui import save_manager
+from tui.headless import HeadlessScreen, headless_curses
+from vtm_npc_logic import VtMCharacter
+from benchmarks.bench_render import build_character
+
+# --- [CONSTANTS] ---
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_OUTPUT = "bench_results.json"
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_LIBRARIES = (10, 1000, 50000)
+SAVE_LOAD_SAMPLES = 200 # save + load pairs per library size
+
+# --- [CASES] ---
+# Each case runs one batch and returns (operations, seconds)
+def bench_construct(scale: int) -> Tuple[int, float]:
+    ops = 2000 * scale
+    start = time.perf_counter()
+    for i in range(ops):
+        VtMCharacter("Bench", "Brujah", 100 + i % 900, 6 + i % 8)
+    return ops, time.perf_counter() - start
+
+def bench_improve_trait(scale: int) -> Tuple[int, float]:
+    character = build_character("medium")
+    ops = 5000 * scale
+    start = time.perf_counter()
+    for i in range(ops):
+        # Alternating raise/refund keeps freebies available for the whole run
+        character.improve_trait("Ability", "Brawl", 4 if i % 2 == 0 else 3)
+    return ops, time.perf_counter() - start
+
+def bench_remove_trait(scale: int) -> Tuple[int, float]:
+    character = build_character("small")
+    ops = 2000 * scale
+    start = time.perf_counter()
+    for _ in range(ops):
+        character.improve_trait("Discipline", "Obfuscate", 1)
+        character.remove_trait("Discipline", "Obfuscate")
+    return ops, time.perf_counter() - start
+
+def bench_round_trip(scale: int) -> Tuple[int, float]:
+    character = build_character("large")
+    ops = 2000 * scale
+    start = time.perf_counter()
+    for _ in range(ops):
+        # Through JSON text, like a save file, so the copy shares nothing
+        VtMCharacter.from_dict(json.loads(json.dumps(character.to_dict())))
+    return ops, time.perf_counter() - start
+
+def bench_draw_screen(scale: int) -> Tuple[int, float]:
+    from tui.main_view import MainView
+
+    with headless_curses():
+        screen = HeadlessScreen(50, 140)
+        view = MainView(screen, build_character("large"))
+        view.active_col = 2
+        cols = view._build_columns()
+        ops = 200 * scale
+        start = time.perf_counter()
+        for _ in range(ops):
+            view._draw_screen(*cols)
+        return ops, time.perf_counter() - start
+
+def make_save_load_case(library_size: int) -> Callable[[int], Tuple[int, float]]:
+    """
+    Builds a case that loads, edits and saves sampled files inside a library of
+    library_size saves. The library is written once, on the first run.
+    """
+    directory = None
+
+    def bench(scale: int) -> Tuple[int, float]:
+        nonlocal directory
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="vtm-bench-")
+            atexit.register(shutil.rmtree, directory, True)
+            _populate_library(directory, library_size)
+
+        old_dir = save_manager.SAVES_DIR
+        try:
+            save_manager.SAVES_DIR = directory
+            rng = random.Random(library_size)
+            names = [f"npc_{rng.randrange(library_size):06d}" for _ in range(SAVE_LOAD_SAMPLES * scale)]
+            start = time.perf_counter()
+            for name in names:
+                success, character = save_manager.load_character(name)
+                # Toggle a dot so every save really writes
+                wits = character.attributes["Wits"]["new"]
+                character.improve_trait("Attribute", "Wits", 4 if wits != 4 else 3)
+                save_manager.save_character(character, name)
+            return 2 * len(names), time.perf_counter() - start
+        finally:
+            save_manager.SAVES_DIR = old_dir
+    return bench
+
+def _populate_library(directory: str, count: int):
+    """Writes count save files quickly (no fsync), all from one serialized template."""
+    template = build_character("medium").to_dict()
+    for i in range(count):
+        template["name"] = f"NPC {i}"
+        with open(os.path.join(directory, f"npc_{i:06d}.json"), "w") as f:
+            json.dump(template, f, indent=2)
+
+def build_cases(libraries) -> Dict[str, Callable[[int], Tuple[int, float]]]:
+    cases = {
+        "construct":     bench_construct,
+        "improve_trait": bench_improve_trait,
+        "remove_trait":  bench_remove_trait,
+        "round_trip":    bench_round_trip,
+        "draw_screen":   bench_draw_screen,
+    }
+    for size in libraries:
+        cases[f"save_load_{size}"] = make_save_load_case(size)
+    return cases
+
+# --- [RUNNING] ---
+def run_case(case: Callable[[int], Tuple[int, float]], repeat: int, scale: int) -> dict:
+    """Runs a case repeat times with GC paused (as timeit does). Times are microseconds per operation."""
+    per_op = []
+    ops = 0
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            ops, seconds = case(scale)
+        finally:
+            gc.enable()
+        per_op.append(seconds / ops * 1e6)
+    best = min(per_op)
+    return {
+        "ops": ops,
+        "best_us": round(best, 3),
+        "median_us": round(statistics.median(per_op), 3),
+        "ops_per_sec": round(1e6 / best, 1),
+    }
+
+def compare(results: dict, baseline: dict, threshold: float, overrides: Dict[str, float]) -> list:
+    """Returns (case, baseline_us, current_us, change) for every case slower than its threshold."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        change = current["best_us"] / base["best_us"] - 1
+        if change > overrides.get(name, threshold):
+            regressions.append((name, base["best_us"], current["best_us"], change))
+    return regressions
+
+# --- [MAIN] ---
+def _parse_overrides(items) -> Dict[str, float]:
+    overrides = {}
+    for item in items:
+        name, _, value = item.partition("=")
+        overrides[name] = float(value)
+    return overrides
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and compare against a baseline.")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case; the best counts (default: 5)")
+    parser.add_argument("--scale", type=int, default=1, help="multiplies the operations per run (default: 1)")
+    parser.add_argument("--libraries", default=",".join(map(str, DEFAULT_LIBRARIES)),
+                        help="library sizes for save/load cases (default: 10,1000,50000)")
+    parser.add_argument("--only", metavar="PREFIX", help="run only cases whose name starts with PREFIX")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help=f"results JSON (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help=f"baseline JSON (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--threshold-for", action="append", default=[], metavar="CASE=FRACTION",
+                        help="per-case threshold override, repeatable")
+    args = parser.parse_args(argv)
+
+    libraries = [int(n) for n in args.libraries.split(",") if n]
+    cases = build_cases(libraries)
+    if args.only:
+        cases = {name: case for name, case in cases.items() if name.startswith(args.only)}
+
+    results = {}
+    print(f"{'case':<20}{'best us/op':>12}{'median us/op':>14}{'ops/s':>12}")
+    for name, case in cases.items():
+        results[name] = run_case(case, args.repeat, args.scale)
+        r = results[name]
+        print(f"{name:<20}{r['best_us']:>12.2f}{r['median_us']:>14.2f}{r['ops_per_sec']:>12.0f}")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+            "scale": args.scale,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold, _parse_overrides(args.threshold_for))
+    if not regressions:
+        print(f"No regressions against {args.baseline}.")
+        return 0
+
+    print(f"\nRegressions against {args.baseline}:")
+    for name, base_us, current_us, change in regressions:
+        print(f"  {name:<20}{base_us:>10.2f} -> {current_us:>10.2f} us/op ({change:+.0%})")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@ import curses
 from . import utils
 from . import theme
 from vtm_npc_logic import VtMCharacter
-from .renderer import draw_character_sheet_columns, draw_sheet_container, SheetItem, build_col3_items
+from .renderer import draw_character_sheet_columns, draw_sheet_container, build_col3_items, build_model_items, compute_sheet_layout, clear_layout_cache, COL1_MODEL, COL2_MODEL
 
 class FinalView:
     def __init__(self, stdscr, character: VtMCharacter):
@@ -15,34 +15,22 @@ class FinalView:
         while True:
             self.stdscr.erase()
             h, w = self.stdscr.getmaxyx()
-            container_width = min(130, w - 2)
-            container_height = min(55, h - 6)
+            layout = compute_sheet_layout(h, w, "final")
 
             # Format freebie string
             freebie_str, freebie_state = self.character.get_freebie_display()
             freebie_color = theme.CLR_ERROR() if freebie_state == "empty" else theme.CLR_ACCENT()
 
-            layout = draw_sheet_container(
+            draw_sheet_container(
                 self.stdscr, self.character,
                 "FINAL CHARACTER SHEET",
                 freebie_str, freebie_color,
-                container_width, container_height
+                layout
             )
 
-            layout["max_rows"] = container_height - 8
-
             # Build item lists
-            from vtm_npc_logic import ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST
-
-            col1_items = [SheetItem("Header", "ATTRIBUTES")] + [
-                SheetItem("Attribute", a, self.character.get_trait_data("Attribute", a))
-                for a in ATTRIBUTES_LIST
-            ]
-            col2_items = [SheetItem("Header", "ABILITIES")] + [
-                SheetItem("Ability", a, self.character.get_trait_data("Ability", a))
-                for a in ABILITIES_LIST
-            ]
-
+            col1_items = build_model_items(COL1_MODEL, self.character)
+            col2_items = build_model_items(COL2_MODEL, self.character)
             col3_items = build_col3_items(self.character)
 
             draw_character_sheet_columns(
@@ -53,52 +41,82 @@ class FinalView:
             )
 
             # Export prompt
-            start_y = layout["container_start_y"]
+            footer_y = layout["footer_y"]
             start_x = layout["start_x"]
-            controls = "E: Export to Text | S: Save | Any other key: Exit"
-            self.stdscr.addstr(start_y + container_height - 2, start_x + (container_width - len(controls)) // 2, controls, theme.CLR_BORDER())
+            controls = "E: Export | S: Save | R: Dice Pools | Any other key: Exit"
+            self.stdscr.addstr(footer_y, start_x + (layout["container_width"] - len(controls)) // 2, controls, theme.CLR_BORDER())
             self.stdscr.refresh()
 
             key = self.stdscr.getch()
             if key == ord('e') or key == ord('E'):
-                self._export_character(start_y + container_height - 2, start_x + 2)
+                self._export_character(footer_y, start_x + 2)
             elif key == ord('s') or key == ord('S'):
-                self._save_character(start_y + container_height - 2, start_x + 2)
-            elif key != curses.KEY_RESIZE:
+                self._save_character(footer_y, start_x + 2)
+            elif key == ord('r') or key == ord('R'):
+                self._show_dice_pools()
+            elif key == curses.KEY_RESIZE:
+                clear_layout_cache()
+            else:
                 return
 
     def _export_character(self, prompt_y, prompt_x):
-        """Handles the logic for exporting character to a text file."""
+        """Handles exporting the character; the format follows the file extension."""
+        from vtm_export import export_file, FORMATS
+
         def dummy_redraw():
             pass 
             
         default_name = f"{self.character.name.replace(' ', '_').lower()}.txt"
+        extensions = " ".join(fmt.extension for fmt in FORMATS.values())
         
         self.stdscr.move(prompt_y, 0)
         self.stdscr.clrtoeol()
         
         try:
             # Wrapped in try/except InputCancelled
-            filename = utils.get_string_input(self.stdscr, f"Filename (default: {default_name}): ", prompt_y, prompt_x, dummy_redraw)
+            filename = utils.get_string_input(self.stdscr, f"Export as ({extensions}; default: {default_name}): ", prompt_y, prompt_x, dummy_redraw)
         except utils.InputCancelled:
             return # Cancel export and go back to sheet loop
         
         if not filename:
             filename = default_name
         
-        if not filename.endswith('.txt'):
+        if not any(filename.endswith(fmt.extension) for fmt in FORMATS.values()):
             filename += ".txt"
-            
-        try:
-            with open(filename, 'w') as f:
-                f.write(self.character.get_text_sheet())
-            utils.show_popup(self.stdscr, "Success", f"Character saved to {filename}", theme.CLR_ACCENT())
-        except Exception as e:
-            utils.show_popup(self.stdscr, "Error", f"Failed to save: {str(e)}", theme.CLR_ERROR())
+
+        success, msg = export_file([self.character], filename)
+        if success:
+            utils.show_popup(self.stdscr, "Success", msg, theme.CLR_ACCENT())
+        else:
+            utils.show_popup(self.stdscr, "Error", msg, theme.CLR_ERROR())
+
+    def _show_dice_pools(self):
+        """Pops up the combat pool statistics of this sheet (see vtm_dice.py)."""
+        from vtm_dice import readiness
+
+        lines = [f"{'Pool':<11}{'Dice':>5}{'Mean':>7}{'Success':>9}{'Botch':>7}"]
+        for r in readiness(self.character):
+            lines.append(f"{r.name:<11}{r.dice:>5}{r.expected:>7.2f}{r.p_success:>9.0%}{r.p_botch:>7.1%}")
+
+        h, w = self.stdscr.getmaxyx()
+        dialog_height = len(lines) + 5
+        dialog_width = 50
+        dialog_y = (h - dialog_height) // 2
+        dialog_x = (w - dialog_width) // 2
+
+        utils.draw_box(self.stdscr, dialog_y, dialog_x, dialog_height, dialog_width, "Dice Pools (difficulty 6)")
+        for i, line in enumerate(lines):
+            color = theme.CLR_ACCENT() if i == 0 else theme.CLR_TEXT()
+            self.stdscr.addstr(dialog_y + 2 + i, dialog_x + 4, line, color)
+
+        dismiss_msg = "Press any key to continue..."
+        self.stdscr.addstr(dialog_y + dialog_height - 2, dialog_x + (dialog_width - len(dismiss_msg)) // 2, dismiss_msg, theme.CLR_TEXT())
+        self.stdscr.refresh()
+        self.stdscr.getch()
 
     def _save_character(self, prompt_y, prompt_x):
         """Handles the logic for saving character to a JSON file."""
-        from .save_manager import save_character, default_save_name
+        from .save_manager import save_character, default_save_name, find_conflict
 
         def dummy_redraw():
             pass
@@ -121,7 +139,12 @@ class FinalView:
         if not filename:
             filename = default_name
 
-        success, msg = save_character(self.character, filename)
+        # Someone else saved over this file (or it holds another sheet): ask before overwriting
+        conflict = find_conflict(self.character, filename)
+        if conflict and not utils.show_confirmation_popup(self.stdscr, "Save Conflict", f"{conflict}\n\nOverwrite it anyway?"):
+            return
+
+        success, msg = save_character(self.character, filename, force=bool(conflict))
 
         if success:
             utils.show_popup(self.stdscr, "Saved", msg, theme.CLR_ACCENT())
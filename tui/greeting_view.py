@@ -2,7 +2,6 @@ import curses
 from typing import NamedTuple, Optional
 from . import utils
 from . import theme
-from .save_manager import list_saves, load_character, default_save_name
 from vtm_npc_logic import VtMCharacter
 
 # --- [VERSION] ---
@@ -86,37 +85,11 @@ class GreetingView:
 
     def _load_character_flow(self) -> Optional[GreetingResult]:
         """
-        Handles the load character sub-flow.
+        Handles the load character sub-flow through the library browser.
         Returns a GreetingResult on success, or None if cancelled.
         """
-        saves = list_saves()
-
-        def draw_load_screen():
-            h, w = self.stdscr.getmaxyx()
-            self.stdscr.erase()
-            container_width, container_height = 70, 14
-            start_x, start_y = (w - container_width) // 2, (h - container_height) // 2
-            utils.draw_box(self.stdscr, start_y, start_x, container_height, container_width, "Load Character")
-            if saves:
-                self.stdscr.addstr(start_y + 2, start_x + 2, "Select a save file or type a filename:", theme.CLR_TEXT())
-            else:
-                self.stdscr.addstr(start_y + 2, start_x + 2, "No saves found. Type a filename to load:", theme.CLR_TEXT())
-            return start_y, start_x, start_y + 4
-
-        try:
-            start_y, start_x, input_y = draw_load_screen()
-            filename = utils.get_file_selection_input(
-                self.stdscr, "File: ", input_y, start_x + 2,
-                saves, draw_load_screen
-            )
-        except utils.InputCancelled:
+        from .library_view import LibraryView # Imported on demand to keep startup fast
+        character = LibraryView(self.stdscr).run()
+        if character is None:
             return None
-
-        success, result = load_character(filename)
-
-        if success:
-            utils.show_popup(self.stdscr, "Loaded", f"Loaded '{result.name}' successfully!", theme.CLR_ACCENT())
-            return GreetingResult(mode="load", character=result)
-        else:
-            utils.show_popup(self.stdscr, "Error", result, theme.CLR_ERROR())
-            return None
\ No newline at end of file
+        return GreetingResult(mode="load", character=character)
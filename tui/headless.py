@@ -0,0 +1,159 @@
+"""
+tui/headless.py
+
+In-memory stand-in for a curses window, for benchmarking and snapshotting
+the renderer without a terminal. Implements the subset of the window API the
+views use and records every cell as a (char, attr) pair.
+
+Usage:
+    with headless_curses():
+        screen = HeadlessScreen(50, 140, keys=[24])
+        MainView(screen, character).run()
+        print(screen.dump_text())
+"""
+
+import contextlib
+import curses
+
+# --- [SCREEN] ---
+class HeadlessScreen:
+    """A fixed-size character/attribute grid that behaves like a curses window."""
+
+    def __init__(self, height: int = 50, width: int = 140, keys=None):
+        self.height = height
+        self.width = width
+        self.chars = [[" "] * width for _ in range(height)]
+        self.attrs = [[0] * width for _ in range(height)]
+        self.cursor = (0, 0)
+        self.keys = list(keys or [])
+        self.is_nodelay = False
+        self.refresh_count = 0
+        self.addstr_count = 0
+        self._current_attr = 0
+        self._background_attr = 0
+
+    # --- Output ---
+    def addstr(self, *args):
+        """addstr([y, x,] text[, attr]) with curses' wrapping and bounds errors."""
+        if len(args) >= 3 and not isinstance(args[0], str):
+            y, x, text = args[0], args[1], args[2]
+            attr = args[3] if len(args) > 3 else None
+        else:
+            y, x = self.cursor
+            text = args[0]
+            attr = args[1] if len(args) > 1 else None
+
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise curses.error("addstr() returned ERR")
+
+        self.addstr_count += 1
+        cell_attr = (self._current_attr if attr is None else attr) | self._background_attr
+        for ch in text:
+            if ch == "\n":
+                y, x = y + 1, 0
+            else:
+                self.chars[y][x] = ch
+                self.attrs[y][x] = cell_attr
+                x += 1
+                if x >= self.width:
+                    y, x = y + 1, 0
+            if y >= self.height:
+                # Real curses writes the last cell, then reports the overflow
+                self.cursor = (self.height - 1, self.width - 1)
+                raise curses.error("addstr() returned ERR")
+        self.cursor = (y, x)
+
+    def erase(self):
+        for y in range(self.height):
+            self.chars[y] = [" "] * self.width
+            self.attrs[y] = [self._background_attr] * self.width
+        self.cursor = (0, 0)
+
+    clear = erase
+
+    def clrtoeol(self):
+        y, x = self.cursor
+        for col in range(x, self.width):
+            self.chars[y][col] = " "
+            self.attrs[y][col] = self._background_attr
+
+    def move(self, y: int, x: int):
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise curses.error("wmove() returned ERR")
+        self.cursor = (y, x)
+
+    def attron(self, attr: int):
+        self._current_attr |= attr
+
+    def attroff(self, attr: int):
+        self._current_attr &= ~attr
+
+    def bkgd(self, ch, attr: int = 0):
+        self._background_attr = attr
+
+    def refresh(self):
+        self.refresh_count += 1
+
+    # --- Geometry / modes ---
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def resize(self, height: int, width: int):
+        """Simulates a terminal resize and queues KEY_RESIZE like curses does."""
+        self.height, self.width = height, width
+        self.chars = [[" "] * width for _ in range(height)]
+        self.attrs = [[0] * width for _ in range(height)]
+        self.keys.insert(0, curses.KEY_RESIZE)
+
+    def keypad(self, flag: bool):
+        pass
+
+    def nodelay(self, flag: bool):
+        self.is_nodelay = flag
+
+    def timeout(self, delay_ms: int):
+        self.is_nodelay = delay_ms >= 0
+
+    # --- Input ---
+    def getch(self) -> int:
+        """Pops the next scripted key. Returns -1 when empty in nodelay mode, Ctrl+X otherwise."""
+        if self.keys:
+            return self.keys.pop(0)
+        # A blocking read with no script left would hang a real loop; ask the view to quit
+        return -1 if self.is_nodelay else 24
+
+    def feed(self, *keys):
+        """Appends scripted key codes (ints or single-character strings)."""
+        self.keys.extend(ord(k) if isinstance(k, str) else k for k in keys)
+
+    # --- Inspection ---
+    def dump_text(self) -> str:
+        """Returns the screen as text, trailing whitespace stripped per line."""
+        return "\n".join("".join(row).rstrip() for row in self.chars)
+
+    def row_text(self, y: int) -> str:
+        return "".join(self.chars[y])
+
+    def find(self, text: str):
+        """Returns (y, x) of the first occurrence of text on screen, or None."""
+        for y in range(self.height):
+            x = self.row_text(y).find(text)
+            if x != -1:
+                return y, x
+        return None
+
+# --- [CURSES MODULE SHIMS] ---
+@contextlib.contextmanager
+def headless_curses():
+    """
+    Makes the module-level curses calls used by the views (color_pair, curs_set,
+    init_pair) work without initscr(), for the duration of the block.
+    """
+    originals = (curses.color_pair, curses.curs_set, curses.init_pair)
+    curses.color_pair = lambda pair_id: (pair_id << 8) & curses.A_COLOR
+    curses.curs_set = lambda visibility: 1
+    curses.init_pair = lambda pair_id, fg, bg: None
+    try:
+        yield
+    finally:
+        curses.color_pair, curses.curs_set, curses.init_pair = originals
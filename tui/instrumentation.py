@@ -0,0 +1,180 @@
+"""
+tui/instrumentation.py
+
+Opt-in frame timing for the interactive views.
+Enable with VTM_NPC_PERF=1 (or the P hotkey in MainView). When enabled, every frame
+records keypress-to-refresh latency, addstr call count, bytes passed to addstr and the
+time spent in named spans. A small p50/p95 overlay is drawn on screen and the full
+trace is written as CSV when the view closes (VTM_NPC_PERF_TRACE, default perf_trace.csv).
+"""
+
+import contextlib
+import csv
+import os
+import time
+from collections import deque
+from . import theme
+
+# --- [CONSTANTS] ---
+ENV_ENABLE = "VTM_NPC_PERF"
+ENV_TRACE_PATH = "VTM_NPC_PERF_TRACE"
+DEFAULT_TRACE_PATH = "perf_trace.csv"
+
+# Spans shown in the overlay and written to the CSV, in column order
+SPAN_NAMES = ("build_col3_items", "draw_character_sheet_columns", "improve_trait")
+
+OVERLAY_WINDOW = 200  # Frames used for the overlay percentiles
+
+_NULL_SPAN = contextlib.nullcontext()
+
+# Problems to print once curses has exited (the screen is gone by then)
+_exit_notices: list = []
+
+# --- [HELPERS] ---
+def env_enabled() -> bool:
+    """True when the instrumentation env var is set to a truthy value."""
+    return os.environ.get(ENV_ENABLE, "").lower() in ("1", "true", "yes", "on")
+
+def pop_exit_notices() -> list:
+    """Returns and clears the messages queued for after curses exits."""
+    notices = list(_exit_notices)
+    _exit_notices.clear()
+    return notices
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile. Returns 0.0 for an empty sequence."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+# --- [COUNTING SCREEN] ---
+class CountingScreen:
+    """Forwards everything to the real window, counting addstr calls and bytes."""
+
+    def __init__(self, stdscr, recorder: "PerfRecorder"):
+        self._stdscr = stdscr
+        self._recorder = recorder
+
+    def addstr(self, *args):
+        # addstr(y, x, text[, attr]) or addstr(text[, attr])
+        text = args[2] if len(args) >= 3 and isinstance(args[2], str) else args[0]
+        if isinstance(text, str):
+            self._recorder.count_output(text)
+        return self._stdscr.addstr(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._stdscr, name)
+
+# --- [RECORDER] ---
+class PerfRecorder:
+    """Collects per-frame metrics. All methods are cheap no-ops while disabled."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.rows: list = []
+        self._recent: deque = deque(maxlen=OVERLAY_WINDOW)
+        self._reset_frame()
+
+    def _reset_frame(self):
+        self._frame_start = time.perf_counter()
+        self._had_input = False
+        self._addstr_calls = 0
+        self._bytes = 0
+        self._spans = dict.fromkeys(SPAN_NAMES, 0.0)
+
+    def wrap(self, stdscr):
+        """Returns a counting proxy around stdscr (or stdscr itself if already wrapped)."""
+        if isinstance(stdscr, CountingScreen):
+            return stdscr
+        return CountingScreen(stdscr, self)
+
+    def count_output(self, text: str):
+        if self.enabled:
+            self._addstr_calls += 1
+            self._bytes += len(text.encode("utf-8"))
+
+    def span(self, name: str):
+        """Context manager timing a named span into the current frame."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._spans[name] = self._spans.get(name, 0.0) + (time.perf_counter() - start)
+
+    def begin_frame(self):
+        """Marks the moment input arrived; latency is measured from here to end_frame()."""
+        if self.enabled:
+            self._reset_frame()
+            self._had_input = True
+
+    def end_frame(self):
+        """Closes the frame right after refresh() and stores its row."""
+        if not self.enabled:
+            return
+        row = {
+            "frame":        len(self.rows),
+            "latency_ms":   round((time.perf_counter() - self._frame_start) * 1000, 3) if self._had_input else "",
+            "addstr_calls": self._addstr_calls,
+            "bytes":        self._bytes,
+        }
+        for name in SPAN_NAMES:
+            row[f"{name}_ms"] = round(self._spans.get(name, 0.0) * 1000, 3)
+        self.rows.append(row)
+        self._recent.append(row)
+        self._reset_frame()
+
+    def summary(self) -> list:
+        """Returns (label, p50, p95) tuples over the recent frames for the overlay."""
+        recent = list(self._recent)
+        metrics = [("latency ms", [r["latency_ms"] for r in recent if r["latency_ms"] != ""])]
+        metrics.append(("addstr", [r["addstr_calls"] for r in recent]))
+        metrics.append(("bytes", [r["bytes"] for r in recent]))
+        for name in SPAN_NAMES:
+            metrics.append((name, [r[f"{name}_ms"] for r in recent]))
+        return [(label, percentile(vals, 50), percentile(vals, 95)) for label, vals in metrics]
+
+    def draw_overlay(self, stdscr):
+        """Draws a compact p50/p95 table in the top-right corner."""
+        if not self.enabled:
+            return
+        h, w = stdscr.getmaxyx()
+        lines = [f"{'PERF':<28}{'p50':>8}{'p95':>8}"]
+        for label, p50, p95 in self.summary():
+            lines.append(f"{label[:28]:<28}{p50:>8.2f}{p95:>8.2f}")
+        width = len(lines[0])
+        x = max(0, w - width - 1)
+        for i, line in enumerate(lines):
+            if i >= h - 1:
+                break
+            stdscr.addstr(i, x, line[:w - x - 1], theme.CLR_BORDER() if i else theme.CLR_HIGHLIGHT())
+
+    def dump_csv_on_exit(self) -> str:
+        """
+        dump_csv() for a closing view: a trace that can't be written (read-only
+        folder, bad VTM_NPC_PERF_TRACE) is reported after curses exits instead
+        of interrupting the exit. Returns the path, or "" if nothing was written.
+        """
+        try:
+            return self.dump_csv()
+        except OSError as e:
+            _exit_notices.append(f"Performance trace not written: {e}")
+            return ""
+
+    def dump_csv(self, path: str = None) -> str:
+        """Writes all recorded frames to CSV. Returns the path, or "" if nothing was recorded."""
+        if not self.rows:
+            return ""
+        path = path or os.environ.get(ENV_TRACE_PATH, DEFAULT_TRACE_PATH)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(self.rows)
+        return path
@@ -0,0 +1,242 @@
+# --- [IMPORTS] ---
+import curses
+import queue
+from typing import Optional
+from . import utils
+from . import theme
+from . import runtime
+from .save_manager import (list_save_summaries, load_character, get_save_summary, refresh_library,
+                           add_library_listener, remove_library_listener)
+from .search import IncrementalFilter
+from vtm_npc_logic import VtMCharacter
+
+# Poll interval while a load runs in the background (ms)
+LOAD_POLL_MS = 50
+# How often the open browser picks up files added, changed or deleted in saves/ (ms)
+WATCH_POLL_MS = 500
+
+class LibraryView:
+    """
+    Scrollable browser over the saves/ library with type-to-filter search.
+    Only the visible window of rows is drawn, so large libraries stay fast.
+    Saves added, changed or deleted while it is open are applied one by one.
+    """
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        self.summaries = list_save_summaries()
+        self.search = IncrementalFilter(
+            self.summaries,
+            key=lambda s: f"{s.filename} {s.name} {s.clan}"
+        )
+        self.query = ""
+        self.matches = list(self.summaries)
+        self.selected = 0
+        self.scroll = 0
+        self.message = ""
+        # Filled by the library listener on whichever thread refreshes, drained on the UI thread
+        self._pending_events: "queue.SimpleQueue" = queue.SimpleQueue()
+
+    def run(self) -> Optional[VtMCharacter]:
+        """
+        Shows the browser until a save is loaded (returns the character)
+        or the user presses Esc (returns None).
+        Raises utils.QuitApplication on Ctrl+X.
+        """
+        add_library_listener(self._queue_events)
+        self.stdscr.timeout(WATCH_POLL_MS)
+        try:
+            return self._run_loop()
+        finally:
+            self.stdscr.timeout(-1)
+            remove_library_listener(self._queue_events)
+
+    def _run_loop(self) -> Optional[VtMCharacter]:
+        redraw = True
+        while True:
+            if redraw:
+                self._draw_screen()
+                self.stdscr.refresh()
+            key = self.stdscr.getch()
+            redraw = True
+
+            if key == -1: # Idle: pick up changes to saves/
+                if runtime.current() is None:
+                    refresh_library() # No app timer refreshing the index (e.g. headless)
+                redraw = self._apply_library_events()
+            elif key == 24: # Ctrl+X
+                raise utils.QuitApplication()
+            elif key == 27: # Esc
+                return None
+            elif key == curses.KEY_RESIZE:
+                self.stdscr.erase()
+
+            # --- Navigation ---
+            elif key == curses.KEY_UP:
+                self._move(-1)
+            elif key == curses.KEY_DOWN:
+                self._move(1)
+            elif key == curses.KEY_PPAGE:
+                self._move(-self._visible_rows())
+            elif key == curses.KEY_NPAGE:
+                self._move(self._visible_rows())
+
+            # --- Search ---
+            elif key in (curses.KEY_BACKSPACE, 127, 8):
+                self._set_query(self.query[:-1])
+            elif 32 <= key <= 126 and len(self.query) < 30:
+                self._set_query(self.query + chr(key))
+
+            elif key in (curses.KEY_ENTER, ord('\n')):
+                character = self._load_selected()
+                if character is not None:
+                    return character
+
+    # --- [STATE HELPERS] ---
+    def _queue_events(self, events: list):
+        for event in events:
+            self._pending_events.put(event)
+
+    def _apply_library_events(self) -> bool:
+        """Updates the list from pending watcher events. Returns True if anything changed."""
+        events = []
+        while True:
+            try:
+                events.append(self._pending_events.get_nowait())
+            except queue.Empty:
+                break
+        if not events:
+            return False
+        current = self.matches[self.selected].filename if self.matches else None
+
+        by_name = {s.filename: s for s in self.summaries}
+        for event in events:
+            old = by_name.pop(event.filename, None)
+            if old is not None:
+                self.search.remove(old)
+            summary = get_save_summary(event.filename)
+            if summary is not None:
+                by_name[event.filename] = summary
+                self.search.add(summary)
+
+        self.summaries = sorted(by_name.values(), key=lambda s: s.filename.lower())
+        self.matches = self.search.filter(self.query)
+        # Keep the highlight on the same save when it is still listed
+        names = [s.filename for s in self.matches]
+        self.selected = names.index(current) if current in names else min(self.selected, max(0, len(names) - 1))
+        return True
+
+    def _set_query(self, query: str):
+        self.query = query
+        self.matches = self.search.filter(query)
+        self.selected = 0
+        self.scroll = 0
+        self.message = ""
+
+    def _move(self, delta: int):
+        if not self.matches:
+            return
+        self.selected = max(0, min(len(self.matches) - 1, self.selected + delta))
+
+    def _layout(self):
+        h, w = self.stdscr.getmaxyx()
+        container_width = min(90, w - 2)
+        container_height = min(30, h - 2)
+        start_x, start_y = (w - container_width) // 2, (h - container_height) // 2
+        return start_y, start_x, container_height, container_width
+
+    def _visible_rows(self) -> int:
+        _, _, container_height, _ = self._layout()
+        return max(1, container_height - 9)
+
+    # --- [LOADING] ---
+    def _load_selected(self) -> Optional[VtMCharacter]:
+        """Loads the highlighted save (or the typed name if nothing matches) off the UI thread."""
+        if self.matches:
+            filename = self.matches[self.selected].filename
+        elif self.query:
+            filename = self.query.strip()
+        else:
+            return None
+
+        pending = runtime.run_background(load_character, filename)
+
+        # Keep the UI responsive while the file is read and parsed
+        self.stdscr.timeout(LOAD_POLL_MS)
+        try:
+            while not pending.done():
+                self.message = f"Loading '{filename}'..."
+                self._draw_screen()
+                self.stdscr.refresh()
+                key = self.stdscr.getch()
+                if key == 24:
+                    raise utils.QuitApplication()
+                elif key == 27:
+                    # Abandon the load; the worker finishes on its own and is ignored
+                    self.message = "Load cancelled."
+                    return None
+        finally:
+            self.stdscr.timeout(WATCH_POLL_MS)
+
+        success, loaded = pending.result()
+        if success:
+            utils.show_popup(self.stdscr, "Loaded", f"Loaded '{loaded.name}' successfully!", theme.CLR_ACCENT())
+            return loaded
+
+        self.message = ""
+        utils.show_popup(self.stdscr, "Error", loaded, theme.CLR_ERROR())
+        return None
+
+    # --- [DRAWING] ---
+    def _draw_screen(self):
+        self.stdscr.erase()
+        start_y, start_x, container_height, container_width = self._layout()
+        utils.draw_box(self.stdscr, start_y, start_x, container_height, container_width, "Load Character")
+
+        # Search line
+        prompt = "Search: "
+        self.stdscr.addstr(start_y + 2, start_x + 2, prompt, theme.CLR_ACCENT())
+        self.stdscr.addstr(start_y + 2, start_x + 2 + len(prompt), self.query, theme.CLR_HIGHLIGHT())
+
+        if self.summaries:
+            count_str = f"{len(self.matches)} of {len(self.summaries)} saves"
+        else:
+            count_str = "No saves found. Type a filename and press Enter to load it."
+        self.stdscr.addstr(start_y + 3, start_x + 2, count_str[:container_width - 4], theme.CLR_BORDER())
+
+        # Column widths: file and name share what is left after clan/age/gen
+        inner = container_width - 6
+        clan_w, age_w, gen_w = 20, 6, 4
+        text_w = max(8, (inner - clan_w - age_w - gen_w) // 2)
+
+        def fmt_row(filename, name, clan, age, gen):
+            return (f"{filename[:text_w - 1]:<{text_w}}{name[:text_w - 1]:<{text_w}}"
+                    f"{clan[:clan_w - 1]:<{clan_w}}{age:>{age_w}}{gen:>{gen_w}}")
+
+        header_y = start_y + 5
+        self.stdscr.addstr(header_y, start_x + 4, fmt_row("File", "Name", "Clan", "Age", "Gen"), theme.CLR_TITLE())
+
+        # Virtualized body: only the visible slice is formatted and drawn
+        visible = self._visible_rows()
+        if self.selected < self.scroll:
+            self.scroll = self.selected
+        elif self.selected >= self.scroll + visible:
+            self.scroll = self.selected - visible + 1
+
+        for i, summary in enumerate(self.matches[self.scroll:self.scroll + visible]):
+            idx = self.scroll + i
+            row = fmt_row(summary.filename, summary.name, summary.clan, str(summary.age), str(summary.generation))
+            if idx == self.selected:
+                self.stdscr.addstr(header_y + 1 + i, start_x + 2, theme.SYM_POINTER + row, theme.CLR_SELECTED())
+            else:
+                # Archived saves (compressed in saves/archive/) are dimmed
+                color = theme.CLR_BORDER() if summary.archived else theme.CLR_TEXT()
+                self.stdscr.addstr(header_y + 1 + i, start_x + 4, row, color)
+
+        # Footer
+        footer_y = start_y + container_height - 2
+        if self.message:
+            self.stdscr.addstr(footer_y, start_x + 2, self.message[:container_width - 4], theme.CLR_ACCENT())
+        else:
+            controls = "Type: Filter | ↑/↓/PgUp/PgDn: Navigate | Enter: Load | Esc: Back"
+            self.stdscr.addstr(footer_y, start_x + (container_width - len(controls)) // 2, controls, theme.CLR_ACCENT())
@@ -3,12 +3,19 @@ import curses
 from typing import List, Tuple
 from . import utils
 from . import theme
-from vtm_npc_logic import VtMCharacter, ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST, FREEBIE_COSTS, DISCIPLINES_LIST, BACKGROUNDS_LIST
+from . import tracing
+from .instrumentation import PerfRecorder, env_enabled
+from vtm_npc_logic import VtMCharacter, DISCIPLINES_LIST, BACKGROUNDS_LIST
 from .utils import QuitApplication
-from .renderer import draw_character_sheet_columns, draw_sheet_container, SheetItem, build_col3_items
+from .renderer import draw_character_sheet_columns, draw_sheet_container, draw_tab_strip, build_col3_items, build_model_items, compute_sheet_layout, clear_layout_cache, row_screen_y, COL1_MODEL, COL2_MODEL
+from .library_view import LibraryView
+from .session import Session
+
+# Keys merged by _coalesce_keys when held down
+REPEATABLE_KEYS = (curses.KEY_LEFT, curses.KEY_RIGHT, curses.KEY_UP, curses.KEY_DOWN)
 
 class MainView:
-    def __init__(self, stdscr, character: VtMCharacter):
+    def __init__(self, stdscr, character: VtMCharacter, session: Session = None):
         self.stdscr = stdscr
         self.character = character
         self.message = ""
@@ -18,10 +25,21 @@ class MainView:
         # 0=Attributes, 1=Abilities, 2=Everything else
         self.active_col = 0 
         self.active_row = 0
+
+        # --- [TABS] ---
+        # Every open character keeps its own cursor; the view swaps it in on switch
+        self.session = session or Session([character], theme.CLR_ACCENT())
+        self.session.open(character)
         
         # To track list sizes for boundary checking
         self.col_counts = [0, 0, 0]
 
+        # --- [INSTRUMENTATION] ---
+        # Opt-in via VTM_NPC_PERF=1 or the P hotkey
+        self.perf = PerfRecorder(enabled=env_enabled())
+        if self.perf.enabled:
+            self.stdscr = self.perf.wrap(self.stdscr)
+
     def move_selection(self, delta: int, items: list):
         """Moves cursor by delta, skipping Header and Spacer items."""
         new_row = self.active_row + delta
@@ -37,86 +55,218 @@ class MainView:
             self.active_row = new_row
 
     def run(self):
-        """Main interaction loop."""
-        while True:
-            # Build data lists
-            col1_items = self._get_col1_items()
-            col2_items = self._get_col2_items()
-            col3_items = self._get_col3_items()
-            
-            self.col_counts = [len(col1_items), len(col2_items), len(col3_items)]
-            if self.active_row >= self.col_counts[self.active_col]:
-                self.active_row = max(0, self.col_counts[self.active_col] - 1)
-
-            # Ensure cursor never lands on a Header/Spacer on initial load
-            current_list = [col1_items, col2_items, col3_items][self.active_col]
-            if current_list and current_list[self.active_row].category in ("Header", "Spacer"):
-                self.move_selection(1, current_list)
-
-            self._draw_screen(col1_items, col2_items, col3_items)
-            self.stdscr.refresh()
-            key = self.stdscr.getch()
-
-            if key == 24: # Ctrl+X
-                return 
-            elif key == curses.KEY_RESIZE:
-                self.stdscr.erase()
-            
-            # --- Navigation ---
-            elif key == curses.KEY_UP:
-                current_list = [col1_items, col2_items, col3_items][self.active_col]
-                self.move_selection(-1, current_list)
-                self.message = ""
-            elif key == curses.KEY_DOWN:
-                current_list = [col1_items, col2_items, col3_items][self.active_col]
-                self.move_selection(1, current_list)
-                self.message = ""
+        """Main interaction loop. Renders once per batch of queued key presses."""
+        try:
+            while True:
+                with tracing.span("MainView.draw"):
+                    col1_items, col2_items, col3_items = self._build_columns()
+                    self._draw_screen(col1_items, col2_items, col3_items)
+                    self.perf.draw_overlay(self.stdscr)
+                    self.stdscr.refresh()
+                self.perf.end_frame()
+
+                keys = utils.read_key_batch(self.stdscr, REPEATABLE_KEYS)
+                self.perf.begin_frame()
+                for event, value in self._coalesce_keys(keys):
+                    with tracing.span("MainView.event", event=event, value=value, batch=len(keys)):
+                        # Rebuild per event: a previous event may have added/removed a trait
+                        col1_items, col2_items, col3_items = self._build_columns()
+                        if not self._handle_event(event, value, col1_items, col2_items, col3_items):
+                            return
+                        # No-op unless the event changed the character (its version moved)
+                        self.session.current.history.record(self.character)
+        finally:
+            self.perf.dump_csv_on_exit()
+
+    def _build_columns(self):
+        """Builds the three column item lists and keeps the cursor on a selectable row."""
+        col1_items = self._get_col1_items()
+        col2_items = self._get_col2_items()
+        col3_items = self._get_col3_items()
+
+        self.col_counts = [len(col1_items), len(col2_items), len(col3_items)]
+        if self.active_row >= self.col_counts[self.active_col]:
+            self.active_row = max(0, self.col_counts[self.active_col] - 1)
+
+        # Ensure cursor never lands on a Header/Spacer on initial load
+        current_list = [col1_items, col2_items, col3_items][self.active_col]
+        if current_list and current_list[self.active_row].category in ("Header", "Spacer"):
+            self.move_selection(1, current_list)
+
+        return col1_items, col2_items, col3_items
+
+    @staticmethod
+    def _coalesce_keys(keys: list) -> List[Tuple[str, int]]:
+        """
+        Merges runs of repeated keys into net events.
+        Left/Right become ("modify", net_delta), Up/Down become ("move", net_delta),
+        everything else passes through as ("key", keycode).
+        """
+        steps = {
+            curses.KEY_LEFT: ("modify", -1), curses.KEY_RIGHT: ("modify", 1),
+            curses.KEY_UP: ("move", -1), curses.KEY_DOWN: ("move", 1),
+        }
+        events: List[Tuple[str, int]] = []
+        for key in keys:
+            if key in steps:
+                event, delta = steps[key]
+                if events and events[-1][0] == event:
+                    events[-1] = (event, events[-1][1] + delta)
+                else:
+                    events.append((event, delta))
+            else:
+                events.append(("key", key))
+        return events
+
+    def _handle_event(self, event: str, value: int, col1_items, col2_items, col3_items) -> bool:
+        """Applies one coalesced event. Returns False when the view should close."""
+        current_list = [col1_items, col2_items, col3_items][self.active_col]
+
+        # --- Navigation ---
+        if event == "move":
+            step = 1 if value > 0 else -1
+            for _ in range(abs(value)):
+                self.move_selection(step, current_list)
+            self.message = ""
+            return True
+
+        # --- Modification ---
+        # Arrow keys ('<' & '>'), net change of the whole batch
+        if event == "modify":
+            if value:
+                self._handle_modification(col1_items, col2_items, col3_items, value)
+            return True
+
+        key = value
+        if key == 24: # Ctrl+X
+            return False
+        elif key == curses.KEY_RESIZE:
+            clear_layout_cache()
+            self.stdscr.erase()
+
+        elif key == ord(' ') or key == 9:
+            self.active_col = (self.active_col + 1) % 3
+            self.active_row = 0
+            new_list = [col1_items, col2_items, col3_items][self.active_col]
+            if new_list and new_list[0].category in ("Header", "Spacer"):
+                self.move_selection(1, new_list)
+            self.message = ""
+
+        # --- Tabs ---
+        elif key == ord('['):
+            self._switch_tab(-1)
+        elif key == ord(']'):
+            self._switch_tab(1)
+        elif key in (ord('o'), ord('O')):
+            self._open_tab()
+        elif key in (ord('w'), ord('W')):
+            self._close_tab()
+
+        # --- Instrumentation toggle ---
+        elif key in (ord('p'), ord('P')):
+            self.perf.enabled = not self.perf.enabled
+            if self.perf.enabled:
+                self.stdscr = self.perf.wrap(self.stdscr)
+            self.message = f"Instrumentation {'on' if self.perf.enabled else 'off'}."
+            self.message_color = theme.CLR_TEXT()
 
-            elif key == ord(' ') or key == 9:
-                self.active_col = (self.active_col + 1) % 3
-                self.active_row = 0
-                new_list = [col1_items, col2_items, col3_items][self.active_col]
-                if new_list and new_list[0].category in ("Header", "Spacer"):
-                    self.move_selection(1, new_list)
-                self.message = ""
-            
-            # --- Modification ---
-            # Arrow keys ('<' & '>')
-            elif key == curses.KEY_LEFT:
-                self._handle_modification(col1_items, col2_items, col3_items, -1)
-            elif key == curses.KEY_RIGHT:
-                self._handle_modification(col1_items, col2_items, col3_items, 1)
-            # Direct numeric input (0-9)
-            elif 48 <= key <= 57:
-                val = key - 48
-                if val == 0: val = 10 # Shortcut: 0 sets value to 10
-                self._handle_numeric_input(col1_items, col2_items, col3_items, val)
-            
-            # --- Deletion key ---
-            elif key == curses.KEY_DC or key == ord('x'):
-                self._handle_deletion(col1_items, col2_items, col3_items)
-
-            elif key == ord('\n'):
-                self._handle_enter(col1_items, col2_items, col3_items)
+        # Direct numeric input (0-9)
+        elif 48 <= key <= 57:
+            val = key - 48
+            if val == 0: val = 10 # Shortcut: 0 sets value to 10
+            self._handle_numeric_input(col1_items, col2_items, col3_items, val)
+
+        # --- Experience ---
+        elif key in (ord('a'), ord('A')):
+            self._award_xp(col1_items, col2_items, col3_items)
+
+        # --- Auto-spend ---
+        elif key in (ord('f'), ord('F')):
+            self._auto_spend(col1_items, col2_items, col3_items)
+
+        # --- Undo / Redo ---
+        elif key in (ord('u'), ord('U')):
+            self._step_history(redo=False)
+        elif key in (ord('r'), ord('R')):
+            self._step_history(redo=True)
+
+        # --- Deletion key ---
+        elif key == curses.KEY_DC or key == ord('x'):
+            self._handle_deletion(col1_items, col2_items, col3_items)
+
+        elif key == ord('\n'):
+            self._handle_enter(col1_items, col2_items, col3_items)
+
+        return True
+
+    # --- [TAB HANDLERS] ---
+    @property
+    def characters(self) -> list:
+        """All characters open in this view, in tab order."""
+        return self.session.characters
+
+    def _store_tab(self):
+        tab = self.session.current
+        tab.active_col, tab.active_row = self.active_col, self.active_row
+        tab.message, tab.message_color = self.message, self.message_color
+
+    def _restore_tab(self):
+        tab = self.session.current
+        self.character = tab.character
+        self.active_col, self.active_row = tab.active_col, tab.active_row
+        self.message, self.message_color = tab.message, tab.message_color
+
+    def _switch_tab(self, delta: int):
+        if len(self.session.tabs) < 2:
+            return
+        self._store_tab()
+        self.session.cycle(delta)
+        self._restore_tab()
+
+    def _open_tab(self):
+        """Loads a save from the library browser into a new tab."""
+        self._store_tab()
+        try:
+            character = LibraryView(self.stdscr).run()
+        except QuitApplication:
+            character = None  # Ctrl+X in the browser only leaves the browser here
+        if character is None:
+            self.message = "Open cancelled."
+            self.message_color = theme.CLR_TEXT()
+            return
+        self.session.open(character)
+        self._restore_tab()
+
+    def _close_tab(self):
+        if not self.session.close():
+            self.message = "Can't close the last open character."
+            self.message_color = theme.CLR_ERROR()
+            return
+        self._restore_tab()
+
+    # --- [HISTORY HANDLERS] ---
+    def _step_history(self, redo: bool):
+        """Rewinds (or re-applies) the active character's last change."""
+        history = self.session.current.history
+        if redo:
+            success = history.redo(self.character)
+            self.message = "Redone." if success else "Nothing to redo."
+        else:
+            success = history.undo(self.character)
+            self.message = "Undone." if success else "Nothing to undo."
+        self.message_color = theme.CLR_TEXT() if success else theme.CLR_ERROR()
 
     # --- [DATA HELPERS] ---
-    # These generate the lists of (Category, Name) tuples for each column
+    # These generate the lists of SheetItems for each column from the shared column models
     def _get_col1_items(self) -> list:
-        items = [SheetItem("Header", "ATTRIBUTES")]
-        for attr in ATTRIBUTES_LIST:
-            data = self.character.get_trait_data("Attribute", attr)
-            items.append(SheetItem("Attribute", attr, data))
-        return items
+        return build_model_items(COL1_MODEL, self.character)
 
     def _get_col2_items(self) -> list:
-        items = [SheetItem("Header", "ABILITIES")]
-        for abil in ABILITIES_LIST:
-            data = self.character.get_trait_data("Ability", abil)
-            items.append(SheetItem("Ability", abil, data))
-        return items
+        return build_model_items(COL2_MODEL, self.character)
 
     def _get_col3_items(self) -> list:
-        return build_col3_items(self.character)
+        with self.perf.span("build_col3_items"):
+            return build_col3_items(self.character)
 
     # --- [LOGIC HANDLERS] ---
     def _handle_modification(self, c1, c2, c3, delta):
@@ -126,8 +276,9 @@ class MainView:
         if item.category in ("System", "Header", "Spacer"):
             return
 
-        target_val = item.data['new'] + delta
-        success, msg = self.character.improve_trait(item.category, item.name, target_val)
+        target_val = self._clamp_target(item, delta)
+        with self.perf.span("improve_trait"):
+            success, msg = self.character.improve_trait(item.category, item.name, target_val)
 
         if success:
             self.message = msg
@@ -139,6 +290,26 @@ class MainView:
             else:
                 self.message = ""
 
+    def _clamp_target(self, item, delta: int) -> int:
+        """
+        Stops a coalesced delta at the first bound a held key would have hit
+        (base value, generation limit, remaining points), so the batch still applies.
+        """
+        current = item.data['new']
+        if delta > 0:
+            limit = self.character.get_trait_limit(item.category)
+            high = self.character.affordable_rating(item.category, item.name, current, limit)
+            target = min(high, current + delta)
+            fits = target > current
+        else:
+            target = max(item.data['base'], current + delta)
+            fits = target < current
+
+        if not fits:
+            # Nothing fits: take a single step so improve_trait reports why
+            return current + (1 if delta > 0 else -1)
+        return target
+
     # --- Helper for Number Keys ---
     def _handle_numeric_input(self, c1, c2, c3, value):
         current_list = [c1, c2, c3][self.active_col]
@@ -147,7 +318,8 @@ class MainView:
         if item.category in ("System", "Header", "Spacer"):
             return
 
-        success, msg = self.character.improve_trait(item.category, item.name, value)
+        with self.perf.span("improve_trait"):
+            success, msg = self.character.improve_trait(item.category, item.name, value)
 
         if success:
             self.message = msg
@@ -176,34 +348,11 @@ class MainView:
             options = []
 
         h, w = self.stdscr.getmaxyx()
-        container_width = min(130, w - 2)
-        container_height = min(50, h - 2)
-
-        # Build freebie string (needed to call draw_sheet_container to get accurate layout)
-        freebie_str, freebie_state = self.character.get_freebie_display()
-        freebie_color = theme.CLR_ERROR() if freebie_state == "empty" else theme.CLR_ACCENT()
-
-        # Get the same layout dict _draw_screen uses so coordinates match exactly
-        layout = draw_sheet_container(
-            self.stdscr, self.character,
-            "VTM NPC Progression Tool",
-            freebie_str, freebie_color,
-            container_width, container_height
-        )
-        layout["max_rows"] = container_height - 7
+        layout = compute_sheet_layout(h, w, "main")
 
-        list_start_y = layout["start_y"]
-        col3_x = layout["cx3"]
-        max_rows = layout["max_rows"]
-
-        scroll_offset = 0
-        if self.active_col == 2:
-            if self.active_row >= max_rows:
-                scroll_offset = self.active_row - max_rows + 1
-
-        visual_row_index = self.active_row - scroll_offset
-        prompt_y = list_start_y + visual_row_index
-        prompt_x = col3_x
+        # Same layout _draw_screen uses, so the prompt lands exactly on the selected row
+        prompt_y = row_screen_y(layout, self.active_row, self.active_col == 2)
+        prompt_x = layout["cx3"]
 
         def redraw_func():
             self._draw_screen(c1, c2, c3)
@@ -232,10 +381,10 @@ class MainView:
             self.message_color = theme.CLR_ERROR()
             return
 
-        refund = (item.data['new'] - item.data['base']) * FREEBIE_COSTS.get(item.category, 0)
+        refund = self.character.trait_cost(item.category, item.name, item.data['base'], item.data['new'])
 
         self._draw_screen(c1, c2, c3)
-        msg = f"Are you sure you want to completely remove {item.name}?\n\nThis will refund {refund} Freebie Points."
+        msg = f"Are you sure you want to completely remove {item.name}?\n\nThis will refund {refund} {self.character.points_label}."
         confirm = utils.show_confirmation_popup(self.stdscr, "Confirm Deletion", msg, theme.CLR_ACCENT())
 
         if confirm:
@@ -248,41 +397,156 @@ class MainView:
             self.message = "Deletion cancelled."
             self.message_color = theme.CLR_TEXT()
 
+    def _award_xp(self, c1, c2, c3):
+        """Prompts for an XP award; the first one switches the character to XP progression."""
+        if not self.character.xp_mode:
+            msg = ("Start experience progression?\n\nEvery current rating becomes permanent and "
+                   "further changes are paid in XP.")
+            self._draw_screen(c1, c2, c3)
+            if not utils.show_confirmation_popup(self.stdscr, "Experience", msg, theme.CLR_ACCENT()):
+                self.message = "Cancelled"
+                self.message_color = theme.CLR_TEXT()
+                return
+
+        h, w = self.stdscr.getmaxyx()
+        layout = compute_sheet_layout(h, w, "main")
+        self.message = ""
+
+        def redraw_func():
+            self._draw_screen(c1, c2, c3)
+
+        try:
+            amount = utils.get_number_input(self.stdscr, "Award XP: ", layout["footer_y"], layout["start_x"] + 2,
+                                            1, 9999, redraw_func)
+        except utils.InputCancelled:
+            amount = None
+        if amount is None:
+            self.message = "Cancelled"
+            self.message_color = theme.CLR_TEXT()
+            return
+
+        success, self.message = self.character.award_xp(amount)
+        self.message_color = theme.CLR_ACCENT() if success else theme.CLR_ERROR()
+
+    def _auto_spend(self, c1, c2, c3):
+        """Picks a policy, previews the plan, and applies it as one change."""
+        from vtm_autospend import POLICIES, plan_spend, apply_plan
+
+        if self.character.is_free_mode:
+            self.message = "Free Mode has no points to spend."
+            self.message_color = theme.CLR_ERROR()
+            return
+
+        h, w = self.stdscr.getmaxyx()
+        layout = compute_sheet_layout(h, w, "main")
+        self.message = ""
+        self.is_inputting = True
+
+        def redraw_func():
+            self._draw_screen(c1, c2, c3)
+
+        try:
+            label = utils.get_selection_input(self.stdscr, "Auto-spend policy: ", layout["footer_y"], layout["start_x"] + 2,
+                                              list(POLICIES.values()), redraw_func)
+        except utils.InputCancelled:
+            label = None
+        finally:
+            self.is_inputting = False
+            curses.curs_set(0)
+        policy = next((key for key, name in POLICIES.items() if name == label), None)
+        if policy is None:
+            self.message = "Cancelled"
+            self.message_color = theme.CLR_TEXT()
+            return
+
+        with self.perf.span("plan_spend"):
+            plan = plan_spend(self.character, policy)
+        if not plan.changes:
+            self.message = f"Nothing affordable with {self.character.remaining_points} {self.character.points_label} left."
+            self.message_color = theme.CLR_ERROR()
+            return
+
+        self._draw_screen(c1, c2, c3)
+        preview = plan.format(limit=max(3, h - 16))
+        msg = f"Spend {plan.cost} {self.character.points_label} ({plan.remaining} left over):\n\n{preview}"
+        if utils.show_confirmation_popup(self.stdscr, POLICIES[policy], msg, theme.CLR_ACCENT()):
+            success, self.message = apply_plan(self.character, plan)
+            self.message_color = theme.CLR_ACCENT() if success else theme.CLR_ERROR()
+        else:
+            self.message = "Auto-spend cancelled."
+            self.message_color = theme.CLR_TEXT()
+
+    def _next_dot_hint(self, items) -> str:
+        """XP price of the selected trait's next dot, e.g. "Dominate 3->4: 15 XP"."""
+        if not items:
+            return ""
+        item = items[self.active_row]
+        if item.category in ("System", "Header", "Spacer"):
+            return ""
+        current = item.data['new']
+        if current >= self.character.get_trait_limit(item.category):
+            return f"{item.name}: at maximum"
+        cost = self.character.trait_cost(item.category, item.name, current, current + 1)
+        return f"{item.name} {current}->{current + 1}: {cost} XP"
+
+    @staticmethod
+    def _fit_controls(hints: List[str], last: str, width: int) -> str:
+        """Joins key hints for the footer, dropping trailing ones until they fit; last is always shown."""
+        hints = list(hints)
+        while hints and len(" | ".join(hints + [last])) > width:
+            hints.pop()
+        return " | ".join(hints + [last])
+
     # --- [DRAWING] ---
     def _draw_screen(self, col1, col2, col3):
         h, w = self.stdscr.getmaxyx()
         self.stdscr.erase()
 
-        container_width = min(130, w - 2)
-        container_height = min(50, h - 2)
+        layout = compute_sheet_layout(h, w, "main")
 
         # Format freebie string
         freebie_str, freebie_state = self.character.get_freebie_display()
         freebie_color = theme.CLR_ERROR() if freebie_state == "empty" else theme.CLR_ACCENT()
 
-        layout = draw_sheet_container(
+        draw_sheet_container(
             self.stdscr, self.character,
             "VTM NPC Progression Tool",
             freebie_str, freebie_color,
-            container_width, container_height
+            layout
         )
 
-        layout["max_rows"] = container_height - 7
-
-        draw_character_sheet_columns(
-            self.stdscr, self.character,
-            col1, col2, col3,
-            layout,
-            active_col=self.active_col,
-            active_row=self.active_row,
-            is_interactive=True
-        )
+        with self.perf.span("draw_character_sheet_columns"):
+            draw_character_sheet_columns(
+                self.stdscr, self.character,
+                col1, col2, col3,
+                layout,
+                active_col=self.active_col,
+                active_row=self.active_row,
+                is_interactive=True
+            )
+
+        if len(self.session.tabs) > 1:
+            draw_tab_strip(self.stdscr, layout, [tab.label for tab in self.session.tabs], self.session.active)
+
+        # XP price of the next dot, right-aligned on the points line under the name
+        if self.character.xp_mode:
+            hint = self._next_dot_hint([col1, col2, col3][self.active_col])[:layout["container_width"] // 2]
+            if hint:
+                hint_x = layout["start_x"] + layout["container_width"] - 2 - len(hint)
+                self.stdscr.addstr(layout["container_start_y"] + 3, hint_x, hint, theme.CLR_TEXT())
 
         # Footer
-        start_y = layout["container_start_y"]
+        footer_y = layout["footer_y"]
         start_x = layout["start_x"]
+        container_width = layout["container_width"]
         if self.message:
-            utils.draw_wrapped_text(self.stdscr, start_y + container_height - 2, start_x + 2, self.message, container_width - 4, self.message_color)
+            utils.draw_wrapped_text(self.stdscr, footer_y, start_x + 2, self.message, container_width - 4, self.message_color)
         else:
-            controls = "Arrows/0-9: Modify | Space: Next Col | Enter: Add | X: Delete Trait | Ctrl+X: Done"
-            self.stdscr.addstr(start_y + container_height - 2, start_x + (container_width - len(controls)) // 2, controls, theme.CLR_ACCENT())
\ No newline at end of file
+            if len(self.session.tabs) > 1:
+                hints = ["Arrows/0-9: Modify", "Space: Col", "Enter: Add", "X: Del", "[ ]: Tab", "O: Open", "W: Close",
+                         "U/R: Undo", "A: XP", "F: Fill"]
+            else:
+                hints = ["Arrows/0-9: Modify", "Space: Col", "Enter: Add", "X: Del", "O: Open Tab",
+                         "U/R: Undo/Redo", "A: XP", "F: Fill"]
+            controls = self._fit_controls(hints, "^X: Done", container_width - 4)
+            self.stdscr.addstr(footer_y, start_x + max(0, (container_width - len(controls)) // 2), controls[:container_width - 2], theme.CLR_ACCENT())
@@ -6,9 +6,11 @@ Used by both MainView (interactive) and FinalView (static).
 """
 
 import curses
+import functools
 from . import theme
 from . import utils
 from typing import NamedTuple
+from vtm_data import ATTRIBUTES_LIST, ABILITIES_LIST
 
 # --- [SHEET ITEM] ---
 class SheetItem(NamedTuple):
@@ -16,6 +18,19 @@ class SheetItem(NamedTuple):
     name: str
     data: dict = {}
 
+# --- [COLUMN MODELS] ---
+# Fixed (category, name) rows for cols 1 and 2, shared by every view and tab
+COL1_MODEL = (("Header", "ATTRIBUTES"),) + tuple(("Attribute", a) for a in ATTRIBUTES_LIST)
+COL2_MODEL = (("Header", "ABILITIES"),) + tuple(("Ability", a) for a in ABILITIES_LIST)
+
+def build_model_items(model: tuple, character) -> list:
+    """Resolves a column model against a character's trait data."""
+    return [
+        SheetItem(category, name) if category == "Header"
+        else SheetItem(category, name, character.get_trait_data(category, name))
+        for category, name in model
+    ]
+
 # --- [COL3 BUILDER] ---
 def build_col3_items(character) -> list:
     """
@@ -50,6 +65,12 @@ def build_col3_items(character) -> list:
 
     return items
 
+# --- [GLYPH CACHE] ---
+@functools.lru_cache(maxsize=2048)
+def _padded_name(name: str, max_name_len: int) -> str:
+    """Truncated, left-aligned trait name. Cached: names and widths repeat every frame."""
+    return f"{name[:max_name_len]:<{max_name_len}}"
+
 # --- [SINGLE TRAIT ROW] ---
 def draw_trait_row(stdscr, y: int, x: int, name: str, data: dict, width: int, is_selected: bool = False, is_modified: bool = False, is_interactive: bool = False):
     """
@@ -62,8 +83,7 @@ def draw_trait_row(stdscr, y: int, x: int, name: str, data: dict, width: int, is
       - Modified traits show [base]→[new] in CLR_ACCENT
       - Unmodified traits show [val] in CLR_TEXT
     """
-    max_name_len = width - 9
-    name_part = f"{name[:max_name_len]:<{max_name_len}}"
+    name_part = _padded_name(name, width - 9)
 
     if is_selected:
         val_str = f"[{data['new']}]"
@@ -127,19 +147,75 @@ def draw_column(stdscr, start_y: int, start_x: int, width: int, items: list, col
 
         draw_trait_row(stdscr, row_y, start_x + 2, item.name, item.data, width, is_selected, is_modified, is_interactive)
 
+# --- [LAYOUT] ---
+# Container sizing per view: (max container height, vertical margin, header+footer rows)
+SHEET_PROFILES = {
+    "main":  (50, 2, 7),
+    "final": (55, 6, 8),
+}
+
+_layout_cache: dict = {}
+
+def compute_sheet_layout(h: int, w: int, profile: str = "main") -> dict:
+    """
+    Pure layout calculation for the character sheet container and its 3 columns.
+    Results are cached per (h, w, profile); treat the returned dict as read-only.
+    """
+    cache_key = (h, w, profile)
+    layout = _layout_cache.get(cache_key)
+    if layout is not None:
+        return layout
+
+    max_height, margin, reserved_rows = SHEET_PROFILES[profile]
+    container_width = min(130, w - 2)
+    container_height = min(max_height, h - margin)
+    start_x = (w - container_width) // 2
+    start_y = (h - container_height) // 2
+
+    col_width = (container_width - 4) // 3
+    cx1 = start_x + 2
+    cx2 = cx1 + col_width + 1
+    cx3 = cx2 + col_width + 1
+
+    layout = {
+        "start_x":           start_x,
+        "start_y":           start_y + 5,  # Below the 3 header lines + gap
+        "cx1":               cx1,
+        "cx2":               cx2,
+        "cx3":               cx3,
+        "col_width":         col_width,
+        "max_rows":          container_height - reserved_rows,
+        "container_width":   container_width,
+        "container_height":  container_height,
+        "container_start_y": start_y,
+        "footer_y":          start_y + container_height - 2,
+    }
+    _layout_cache[cache_key] = layout
+    return layout
+
+def clear_layout_cache():
+    """Drops all cached layouts. Call on KEY_RESIZE."""
+    _layout_cache.clear()
+
+def row_screen_y(layout: dict, row: int, is_active_col: bool = True) -> int:
+    """Returns the screen y of a column row, accounting for the same scrolling draw_column applies."""
+    scroll_offset = 0
+    if is_active_col and row >= layout["max_rows"]:
+        scroll_offset = row - layout["max_rows"] + 1
+    return layout["start_y"] + row - scroll_offset
+
 # --- [CONTAINER + HEADER] ---
-def draw_sheet_container(stdscr, character, title: str, freebie_str: str, freebie_color, container_width: int, container_height: int) -> dict:
+def draw_sheet_container(stdscr, character, title: str, freebie_str: str, freebie_color, layout: dict):
     """
-    Draws the outer box, character header block, and freebie line.
-    Returns a layout dict ready to pass to draw_character_sheet_columns().
+    Draws the outer box, character header block, and freebie line
+    at the positions given by a layout from compute_sheet_layout().
 
     Caller is responsible for formatting freebie_str and freebie_color.
     """
-    h, w = stdscr.getmaxyx()
-    start_x = (w - container_width) // 2
-    start_y = (h - container_height) // 2
+    start_x = layout["start_x"]
+    start_y = layout["container_start_y"]
 
-    utils.draw_box(stdscr, start_y, start_x, container_height, container_width, title)
+    utils.draw_box(stdscr, start_y, start_x, layout["container_height"], layout["container_width"], title)
 
     # Line 1: Name + Clan
     header_y = start_y + 1
@@ -155,40 +231,28 @@ def draw_sheet_container(stdscr, character, title: str, freebie_str: str, freebi
     header_y += 1
     stdscr.addstr(header_y, start_x + 2, freebie_str, freebie_color)
 
-    # Layout calculations for the sheet body
-    col_width = (container_width - 4) // 3
-    cx1 = start_x + 2
-    cx2 = cx1 + col_width + 1
-    cx3 = cx2 + col_width + 1
-    content_y = header_y + 2
-
-    return {
-        "start_x":           start_x,
-        "start_y":           content_y,
-        "cx1":               cx1,
-        "cx2":               cx2,
-        "cx3":               cx3,
-        "col_width":         col_width,
-        "container_height":  container_height,
-        "container_start_y": start_y,
-    }
+# --- [TAB STRIP] ---
+def draw_tab_strip(stdscr, layout: dict, labels: list, active: int):
+    """Draws open-tab labels on the line above the container (skipped if there is no room)."""
+    y = layout["container_start_y"] - 1
+    if y < 0:
+        return
+    x = layout["start_x"] + 1
+    end_x = layout["start_x"] + layout["container_width"] - 1
+    for i, label in enumerate(labels):
+        text = f" {i + 1}:{label[:16]} "
+        if x + len(text) > end_x:
+            stdscr.addstr(y, x, "…", theme.CLR_BORDER())
+            break
+        stdscr.addstr(y, x, text, theme.CLR_SELECTED() if i == active else theme.CLR_BORDER())
+        x += len(text) + 1
 
 # --- [FULL 3-COLUMN SHEET] ---
 def draw_character_sheet_columns(stdscr, character, col1_items: list, col2_items: list, col3_items: list, layout: dict, active_col: int = 0, active_row: int = 0, is_interactive: bool = False):
     """
     Draws the full 3-column character sheet body.
 
-    layout dict expects:
-        {
-            "start_y":           int,
-            "cx1":               int,
-            "cx2":               int,
-            "cx3":               int,
-            "col_width":         int,
-            "max_rows":          int,
-            "container_height":  int,
-            "container_start_y": int,
-        }
+    layout is the dict returned by compute_sheet_layout().
 
     Items must be pre-resolved SheetItems (carrying their own data).
     """
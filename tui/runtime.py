@@ -0,0 +1,173 @@
+"""
+tui/runtime.py
+
+asyncio runtime for the TUI. The views keep their simple "draw, then getch"
+loops; the screen they receive is wrapped in an AsyncScreen whose getch()
+waits for input in short ticks and runs the event loop in between. That lets
+background tasks, periodic timers and executor jobs make progress while a view
+is waiting for a key, and their completion callbacks run on the UI thread.
+
+The asyncio event loop (and the asyncio import, the largest part of startup)
+is only created once something is scheduled on it. Executor jobs without a
+completion callback don't need it.
+
+Usage:
+    runtime = AsyncRuntime()
+    stdscr = AsyncScreen(stdscr, runtime)
+    runtime.every(2.0, lambda: runtime.run_in_executor(refresh_library))
+    runtime.run_in_executor(list_save_summaries, on_done=cache_index)
+"""
+
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Optional
+
+# --- [CONSTANTS] ---
+TICK_MS = 30      # How long getch waits before giving the loop a turn
+MAX_WORKERS = 4   # Executor threads for blocking work (file I/O, bulk jobs)
+
+_active_runtime: Optional["AsyncRuntime"] = None
+
+# --- [RUNTIME] ---
+class AsyncRuntime:
+    """Owns the event loop and executor. All loop work runs on the UI thread inside pump()."""
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vtm-bg")
+        self._loop = None
+        self._tasks: set = set()
+
+    @property
+    def loop(self):
+        """The event loop, created (and asyncio imported) on first use."""
+        if self._loop is None:
+            import asyncio
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(self.executor)
+        return self._loop
+
+    # --- Scheduling ---
+    def spawn(self, coro) -> "asyncio.Task":
+        """Schedules a coroutine on the loop. It advances whenever the UI is waiting for input."""
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def every(self, interval: float, callback: Callable[[], None]) -> "asyncio.Task":
+        """Calls callback on the UI thread every interval seconds until shutdown."""
+        import asyncio
+
+        async def periodic():
+            while True:
+                await asyncio.sleep(interval)
+                callback()
+        return self.spawn(periodic())
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        """Calls callback once on the UI thread after delay seconds."""
+        return self.loop.call_later(delay, callback)
+
+    def run_in_executor(self, fn: Callable, *args, on_done: Callable = None) -> concurrent.futures.Future:
+        """
+        Runs blocking fn(*args) on a worker thread. If given, on_done(result) is
+        posted back and runs on the UI thread during the next pump().
+        """
+        future = self.executor.submit(fn, *args)
+        if on_done is not None:
+            loop = self.loop # Created here on the UI thread, not lazily from the worker
+            def post(done):
+                if not done.cancelled() and done.exception() is None:
+                    loop.call_soon_threadsafe(on_done, done.result())
+            future.add_done_callback(post)
+        return future
+
+    # --- Driving ---
+    def pump(self):
+        """Runs one iteration of the loop: ready callbacks, due timers, posted results."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+
+    def shutdown(self):
+        """Cancels pending tasks and stops accepting executor work."""
+        if self._loop is not None:
+            import asyncio
+            for task in list(self._tasks):
+                task.cancel()
+            if self._tasks:
+                self._loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+            self._loop.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+# --- [SCREEN WRAPPER] ---
+class AsyncScreen:
+    """
+    Forwards everything to the real window, except that getch() keeps the
+    event loop running while it waits. nodelay()/timeout() set by a view are
+    honored: the wait ends when a key arrives or the view's delay elapses.
+    """
+
+    def __init__(self, stdscr, runtime: AsyncRuntime, tick_ms: int = TICK_MS):
+        self._stdscr = stdscr
+        self._runtime = runtime
+        self._tick_ms = tick_ms
+        self._delay_ms = -1  # What the view asked for: -1 blocks, 0 polls, >0 waits up to N ms
+
+    def nodelay(self, flag: bool):
+        self._delay_ms = 0 if flag else -1
+
+    def timeout(self, delay_ms: int):
+        self._delay_ms = delay_ms
+
+    def getch(self) -> int:
+        self._runtime.pump()
+        if self._delay_ms == 0:
+            self._stdscr.timeout(0)
+            return self._stdscr.getch()
+
+        deadline = None if self._delay_ms < 0 else time.monotonic() + self._delay_ms / 1000
+        while True:
+            wait_ms = self._tick_ms
+            if deadline is not None:
+                wait_ms = max(0, min(wait_ms, int((deadline - time.monotonic()) * 1000)))
+            self._stdscr.timeout(wait_ms)
+            key = self._stdscr.getch()
+            if key != -1:
+                return key
+            self._runtime.pump()
+            if deadline is not None and time.monotonic() >= deadline:
+                return -1
+
+    def __getattr__(self, name):
+        return getattr(self._stdscr, name)
+
+# --- [MODULE HELPERS] ---
+def install(runtime: Optional[AsyncRuntime]):
+    """Registers the app-wide runtime (or clears it with None)."""
+    global _active_runtime
+    _active_runtime = runtime
+
+def current() -> Optional[AsyncRuntime]:
+    """Returns the app-wide runtime, or None when running without one (e.g. headless)."""
+    return _active_runtime
+
+def run_background(fn: Callable, *args) -> concurrent.futures.Future:
+    """
+    Runs fn(*args) off the UI thread and returns a Future. Uses the runtime's
+    executor when one is installed, otherwise a one-off daemon thread.
+    """
+    runtime = current()
+    if runtime is not None:
+        return runtime.run_in_executor(fn, *args)
+
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    def work():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    threading.Thread(target=work, daemon=True).start()
+    return future
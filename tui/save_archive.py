@@ -0,0 +1,154 @@
+"""
+tui/save_archive.py
+
+Compressed bundles for cold saves. Each save is compressed on its own, so one
+member can be read back without touching the rest of the bundle.
+
+Bundle layout:
+    MAGIC | dictionary | member | member | ... | index | footer
+  - dictionary: with the "zlib" codec, a sample of the archived saves that primes
+    every member's compressor (zlib zdict). Saves repeat the same keys and trait
+    names, so a small sheet compresses almost to its ratings.
+  - index: zlib-compressed JSON, {filename: offset, length, crc32, size, mtime,
+    header}. "header" holds the summary fields, revision and content hash, so
+    the library can list archived saves without decompressing them.
+  - footer: index offset, index length, MAGIC.
+
+Usage:
+    data = build_bundle(members, codec="zlib")
+    reader = BundleReader(path)
+    payload = json.loads(reader.read("some_npc"))
+"""
+
+import json
+import lzma
+import struct
+import zlib
+from typing import Dict, List, NamedTuple, Tuple
+
+# --- [CONSTANTS] ---
+MAGIC = b"VTMARCH1"
+BUNDLE_SUFFIX = ".vtma"
+CODECS = ("zlib", "lzma")
+DICT_SIZE = 16 * 1024      # Bytes of sample saves kept as the zlib dictionary
+_FOOTER = struct.Struct("<QQ8s")  # index offset, index length, MAGIC
+
+# Save fields copied into the index (summary, plus what save_manager needs for conflict checks)
+HEADER_FIELDS = ("name", "clan", "age", "generation", "revision", "content_hash")
+
+class BundleError(ValueError):
+    """The file is not a readable bundle, or a member failed its checksum."""
+
+class ArchiveMember(NamedTuple):
+    filename: str   # Without extension
+    offset: int
+    length: int     # Compressed bytes
+    crc32: int      # Of the uncompressed payload
+    size: int       # Bytes the save took on disk before archiving
+    mtime: float
+    header: dict
+
+# --- [CODECS] ---
+def _compressor(codec: str, zdict: bytes):
+    if codec == "zlib":
+        return lambda data: _deflate(data, zdict)
+    if codec == "lzma":
+        return lambda data: lzma.compress(data, preset=9 | lzma.PRESET_EXTREME)
+    raise ValueError(f"Unknown codec '{codec}' (choose from: {', '.join(CODECS)}).")
+
+def _deflate(data: bytes, zdict: bytes) -> bytes:
+    # Raw deflate: the stream header and checksum would be repeated per member
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS, **({"zdict": zdict} if zdict else {}))
+    return compressor.compress(data) + compressor.flush()
+
+def _inflate(data: bytes, zdict: bytes) -> bytes:
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS, **({"zdict": zdict} if zdict else {}))
+    return decompressor.decompress(data) + decompressor.flush()
+
+def _sample_dictionary(payloads: List[bytes]) -> bytes:
+    """The tail of the first saves; zlib favours the end of the dictionary for matches."""
+    sample = b""
+    for payload in payloads:
+        sample += payload
+        if len(sample) >= DICT_SIZE:
+            break
+    return sample[-DICT_SIZE:]
+
+# --- [WRITING] ---
+def build_bundle(members: List[Tuple[str, bytes, int, float]], codec: str = "zlib") -> bytes:
+    """
+    Returns the bytes of a bundle holding members, given as
+    (filename, payload, original size, mtime). Payloads are save files' JSON.
+    """
+    payloads = [payload for _, payload, _, _ in members]
+    zdict = _sample_dictionary(payloads) if codec == "zlib" else b""
+    compress = _compressor(codec, zdict)
+
+    stored_dict = zlib.compress(zdict, 9) if zdict else b""
+    chunks = [MAGIC, stored_dict]
+    offset = len(MAGIC) + len(stored_dict)
+    index = {}
+    for filename, payload, size, mtime in members:
+        data = json.loads(payload)
+        blob = compress(payload)
+        index[filename] = {
+            "offset": offset, "length": len(blob), "crc32": zlib.crc32(payload),
+            "size": size, "mtime": mtime,
+            "header": {field: data.get(field) for field in HEADER_FIELDS},
+        }
+        chunks.append(blob)
+        offset += len(blob)
+
+    index_blob = zlib.compress(json.dumps({
+        "codec": codec,
+        "dict": [len(MAGIC), len(stored_dict)],
+        "members": index,
+    }, separators=(",", ":")).encode("utf-8"), 9)
+    chunks.append(index_blob)
+    chunks.append(_FOOTER.pack(offset, len(index_blob), MAGIC))
+    return b"".join(chunks)
+
+# --- [READING] ---
+class BundleReader:
+    """Reads a bundle's index once; read() then decompresses single members on demand."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            if f.tell() < len(MAGIC) + _FOOTER.size:
+                raise BundleError(f"'{path}' is too short to be a save bundle.")
+            f.seek(-_FOOTER.size, 2)
+            index_offset, index_length, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+            if magic != MAGIC:
+                raise BundleError(f"'{path}' is not a save bundle.")
+            f.seek(index_offset)
+            try:
+                index = json.loads(zlib.decompress(f.read(index_length)))
+            except (zlib.error, ValueError) as e:
+                raise BundleError(f"'{path}' has a damaged index: {e}")
+            dict_offset, dict_length = index["dict"]
+            f.seek(dict_offset)
+            self._zdict = zlib.decompress(f.read(dict_length)) if dict_length else b""
+
+        self.codec = index["codec"]
+        if self.codec not in CODECS:
+            raise BundleError(f"'{path}' uses unknown codec '{self.codec}'.")
+        self.members: Dict[str, ArchiveMember] = {
+            filename: ArchiveMember(filename, m["offset"], m["length"], m["crc32"], m["size"], m["mtime"], m["header"])
+            for filename, m in index["members"].items()
+        }
+
+    def read(self, filename: str) -> bytes:
+        """Returns one member's save JSON. Raises KeyError for unknown members."""
+        member = self.members[filename]
+        with open(self.path, "rb") as f:
+            f.seek(member.offset)
+            blob = f.read(member.length)
+        try:
+            payload = _inflate(blob, self._zdict) if self.codec == "zlib" else lzma.decompress(blob)
+        except (zlib.error, lzma.LZMAError) as e:
+            raise BundleError(f"'{filename}' in '{self.path}' is damaged: {e}")
+        if zlib.crc32(payload) != member.crc32:
+            raise BundleError(f"'{filename}' in '{self.path}' failed its checksum.")
+        return payload
@@ -3,52 +3,312 @@ tui/save_manager.py
 
 Handles all save/load file I/O for VtMCharacter objects.
 Views call these functions directly — no JSON logic leaks into the UI layer.
+
+Saves are safe to share between several running copies (e.g. a network-mounted
+saves/ folder). Every file carries a revision counter and a content hash; a
+save is refused when the file changed on disk since this character was loaded
+or last saved (optimistic concurrency). Writes go to a temp file that is
+renamed into place. Only the revision re-check and the rename run under the
+lock: a short advisory fcntl lock on one byte of saves/.lock picked by the
+save's name, so saves of different files don't wait for each other.
+
+Saves untouched for a while can be moved into compressed bundles in
+saves/archive/ (archive_saves(), see save_archive.py). Archived saves stay
+listed, and load_character() reads them back transparently; saving one again
+writes a normal file, which takes precedence over the archived copy.
 """
 
+import hashlib
 import json
 import os
+import threading
+import time
+import zlib
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from vtm_npc_logic import VtMCharacter
+from . import tracing
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None
 
 # --- [CONSTANTS] ---
 SAVES_DIR = "saves"
+ARCHIVE_SUBDIR = "archive" # Bundles of cold saves, inside SAVES_DIR
+ARCHIVE_AFTER_DAYS = 90.0
+
+LOCK_FILENAME = ".lock"     # One advisory lock file per saves folder
+LOCK_SLOTS = 1 << 20        # Bytes of it locked by filename hash; a collision only shares a lock
+SAVE_ATTEMPTS = 3           # Optimistic tries of a save; the last one holds the lock throughout
+
+# Bookkeeping keys stored next to the character data in every save file
+META_KEYS = ("revision", "content_hash")
+
+# --- [SUMMARY TYPE] ---
+class SaveSummary(NamedTuple):
+    filename: str  # Without extension
+    name: str
+    clan: str
+    age: int
+    generation: int
+    mtime: float
+    archived: bool = False # Only in a bundle under saves/archive/
+
+# filename -> SaveSummary, kept current by a watcher on SAVES_DIR (see save_watcher.py)
+_summary_cache: dict = {}
+_sorted_summaries: Optional[list] = None # Sorted view of _summary_cache, None after a change
+_sorted_archive: Optional[dict] = None   # The _archive_index _sorted_summaries was built with
+_watcher = None
+_watched_dir: Optional[str] = None
+_index_lock = threading.Lock()
+_library_listeners: list = []
+
+# filename -> (BundleReader, ArchiveMember) for the newest bundle holding it.
+# Rebuilt when the archive folder's mtime changes (a bundle was added or removed).
+_archive_index: dict = {}
+_archive_stamp: Optional[Tuple[str, int]] = None
+_archive_lock = threading.Lock()
+
+# (character uid, path) -> (revision, content hash) last loaded or saved by this process.
+# A save only proceeds while the file on disk still has that revision.
+# Entries are dropped by forget_character() when a character is closed.
+_base_revisions: dict = {}
+
+# fcntl locks are per process, so threads (e.g. the API server) also need these. Striped by lock slot.
+_thread_locks = [threading.Lock() for _ in range(64)]
+
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+_UMASK = _read_umask() # Read once: umask() can only be read by setting it
 
 # --- [HELPERS] ---
 def _ensure_saves_dir():
     """Creates the saves/ directory if it doesn't exist."""
     os.makedirs(SAVES_DIR, exist_ok=True)
 
-def _build_path(filename: str) -> str:
-    """Returns a full path inside saves/ for a given filename."""
+def _build_path(filename: str, saves_dir: Optional[str] = None) -> str:
+    """
+    Returns a full path inside saves/ (or saves_dir) for a given filename.
+    Raises ValueError for names that resolve outside it (e.g. "../x").
+    """
+    saves_dir = SAVES_DIR if saves_dir is None else saves_dir
     if not filename.endswith(".json"):
         filename += ".json"
-    return os.path.join(SAVES_DIR, filename)
+    path = os.path.join(saves_dir, filename)
+    root = os.path.realpath(saves_dir)
+    if os.path.dirname(os.path.realpath(path)) != root:
+        raise ValueError(f"'{filename}' is not a name inside {saves_dir}/.")
+    return path
+
+def _content_hash(payload: dict) -> str:
+    """Stable hash of a character's data (bookkeeping keys excluded)."""
+    data = {k: v for k, v in payload.items() if k not in META_KEYS}
+    return hashlib.sha256(json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+def _read_revision(path: str) -> Tuple[int, Optional[str]]:
+    """
+    Returns (revision, content hash) of the file at path, or (0, None) if it doesn't exist.
+    Files written before revisions existed count as revision 0. A save that only
+    exists in the archive reports the archived revision, so numbering continues.
+    """
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        archived = _find_archived(os.path.basename(path)[:-5])
+        if archived is None:
+            return 0, None
+        header = archived[1].header
+        return int(header.get("revision") or 0), header.get("content_hash")
+    except ValueError:
+        return 0, None  # Corrupted: nothing worth protecting
+    return int(data.get("revision", 0)), data.get("content_hash") or _content_hash(data)
+
+@contextmanager
+def _locked(path: str):
+    """
+    Holds an exclusive advisory lock for path: one byte of the folder's .lock
+    file, at an offset hashed from the filename. The save itself gets replaced,
+    so it can't carry the lock, and no per-save lock files pile up.
+    """
+    directory, name = os.path.split(path)
+    slot = zlib.crc32(name.encode("utf-8")) % LOCK_SLOTS
+    with _thread_locks[zlib.crc32(os.path.realpath(path).encode("utf-8")) % len(_thread_locks)]:
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(directory or ".", LOCK_FILENAME), 'a') as lock_file:
+            fcntl.lockf(lock_file, fcntl.LOCK_EX, 1, slot, os.SEEK_SET)
+            try:
+                yield
+            finally:
+                fcntl.lockf(lock_file, fcntl.LOCK_UN, 1, slot, os.SEEK_SET)
+
+def _write_temp(path: str, text) -> str:
+    """
+    Writes text (str, or bytes for bundles) to a synced temp file next to path,
+    with path's permissions (or the umask default for a new file), and returns
+    its name. The temp name doesn't end in .json, so library scans never see it.
+    """
+    import tempfile # Deferred: only needed once something is saved
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".json.tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(text, bytes) else 'w') as f:
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), mode) # mkstemp creates 0600; shared folders need the usual mode
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _discard_temp(tmp_path)
+        raise
+    return tmp_path
+
+def _discard_temp(tmp_path: str):
+    try:
+        os.remove(tmp_path)
+    except OSError:
+        pass
+
+def _write_atomic(path: str, text):
+    """Writes text to a temp file, then renames it over path."""
+    tmp_path = _write_temp(path, text)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        _discard_temp(tmp_path)
+        raise
 
 # --- [PUBLIC API] ---
-def save_character(character: VtMCharacter, filename: str) -> tuple[bool, str]:
+def find_conflict(character: VtMCharacter, filename: str) -> Optional[str]:
+    """
+    Returns a description of why saving to filename would overwrite someone
+    else's work, or None if the save is safe. Lock-free pre-check for the UI;
+    save_character() repeats the check under the lock.
+    """
+    try:
+        path = _build_path(filename)
+        revision, content_hash = _read_revision(path)
+    except (OSError, ValueError):
+        return None
+    return _describe_conflict(character, path, revision, content_hash)
+
+def _describe_conflict(character: VtMCharacter, path: str, revision: int, content_hash: Optional[str]) -> Optional[str]:
+    if content_hash is None:
+        return None
+    base = _base_revisions.get((character.uid, path))
+    if base is None:
+        return f"'{path}' already exists and holds a different character sheet."
+    if base[0] != revision:
+        return f"'{path}' was changed elsewhere (revision {base[0]} -> {revision}) since it was loaded."
+    return None
+
+def save_character(character: VtMCharacter, filename: str, force: bool = False) -> tuple[bool, str]:
     """
     Saves a character to saves/{filename}.json.
-    Returns (success, message).
+    Refuses to overwrite a file that changed since this character last loaded
+    or saved it, unless force is set. Returns (success, message).
     """
+    with tracing.span("save", file=filename):
+        return _save_character(character, filename, force)
+
+def _save_character(character: VtMCharacter, filename: str, force: bool) -> tuple[bool, str]:
     try:
         _ensure_saves_dir()
         path = _build_path(filename)
-        with open(path, 'w') as f:
-            json.dump(character.to_dict(), f, indent=2)
-        return True, f"Character saved to {path}"
+        payload = character.to_dict()
+        content_hash = _content_hash(payload)
+
+        for _ in range(SAVE_ATTEMPTS - 1):
+            result = _save_attempt(character, path, payload, content_hash, force, locked=False)
+            if result is not None:
+                return result
+        # Still racing other writers: hold the lock for the whole last attempt, so the save can't starve
+        with _locked(path):
+            return _save_attempt(character, path, payload, content_hash, force, locked=True)
     except Exception as e:
         return False, f"Failed to save: {str(e)}"
 
-def load_character(filename: str) -> tuple[bool, str | VtMCharacter]:
+def _save_attempt(character: VtMCharacter, path: str, payload: dict, content_hash: str, force: bool,
+                  locked: bool) -> Optional[tuple[bool, str]]:
+    """
+    One save of character to path. Unless the caller holds the lock (locked),
+    the check and the temp file write run unlocked, and the lock only covers
+    the re-check and rename. Returns (success, message), or None when the file
+    changed between the check and the lock.
+    """
+    revision, disk_hash = _read_revision(path)
+    if disk_hash == content_hash:
+        _base_revisions[(character.uid, path)] = (revision, disk_hash)
+        return True, f"Character already saved in {path}"
+
+    conflict = None if force else _describe_conflict(character, path, revision, disk_hash)
+    if conflict:
+        return False, f"Save conflict: {conflict}"
+
+    tmp_path = _write_temp(path, json.dumps({"revision": revision + 1, "content_hash": content_hash, **payload}, indent=2))
+    try:
+        with (nullcontext() if locked else _locked(path)), tracing.span("save.locked"):
+            if not locked and _read_revision(path) != (revision, disk_hash):
+                return None # Someone saved meanwhile: check again against their revision
+            # Remembered before the rename, so a watcher that sees the new file
+            # already knows it as this character's own revision
+            key = (character.uid, path)
+            previous = _base_revisions.get(key)
+            _base_revisions[key] = (revision + 1, content_hash)
+            try:
+                os.replace(tmp_path, path)
+            except BaseException:
+                if previous is None:
+                    _base_revisions.pop(key, None)
+                else:
+                    _base_revisions[key] = previous
+                raise
+            tmp_path = None
+    finally:
+        if tmp_path is not None:
+            _discard_temp(tmp_path)
+    return True, f"Character saved to {path} (revision {revision + 1})"
+
+def forget_character(character: VtMCharacter):
+    """Drops the revisions remembered for character's saves. Call when it is closed or evicted."""
+    for key in list(_base_revisions):
+        if key[0] == character.uid:
+            _base_revisions.pop(key, None)
+
+def load_character(filename: str, saves_dir: Optional[str] = None) -> tuple[bool, str | VtMCharacter]:
     """
-    Loads a character from saves/{filename}.json.
+    Loads a character from saves/{filename}.json, or from saves_dir when given.
     Returns (success, VtMCharacter) on success.
     Returns (False, error_message) on failure.
     """
+    with tracing.span("load", file=filename):
+        return _load_character(filename, saves_dir)
+
+def _load_character(filename: str, saves_dir: Optional[str]) -> tuple[bool, str | VtMCharacter]:
     try:
-        path = _build_path(filename)
-        with open(path, 'r') as f:
-            data = json.load(f)
+        path = _build_path(filename, saves_dir)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            archived = _find_archived(filename, saves_dir)
+            if archived is None:
+                raise
+            reader, member = archived
+            with tracing.span("load.archived", bundle=os.path.basename(reader.path)):
+                data = json.loads(reader.read(member.filename))
         character = VtMCharacter.from_dict(data)
+        _base_revisions[(character.uid, path)] = (int(data.get("revision", 0)), data.get("content_hash") or _content_hash(data))
         return True, character
     except FileNotFoundError:
         return False, f"Save file '{filename}' not found."
@@ -59,9 +319,15 @@ def load_character(filename: str) -> tuple[bool, str | VtMCharacter]:
 
 def list_saves() -> list[str]:
     """
-    Returns a list of save filenames (without extension) found in saves/.
-    Returns an empty list if the directory doesn't exist or is empty.
+    Returns a list of save filenames (without extension) found in saves/,
+    archived saves included. Returns an empty list if there are none.
     """
+    loose = _list_loose_saves()
+    present = set(loose)
+    return loose + [name for name in _archived_index() if name not in present]
+
+def _list_loose_saves() -> list[str]:
+    """Save filenames stored as plain .json files (not archived)."""
     if not os.path.exists(SAVES_DIR):
         return []
     return [
@@ -69,6 +335,232 @@ def list_saves() -> list[str]:
         if f.endswith(".json")
     ]
 
+def iter_characters(filenames: list[str] = None):
+    """
+    Lazily yields (filename, VtMCharacter) for the given saves (default: all saves),
+    loading one file at a time. Files that fail to load are skipped.
+    """
+    for filename in (sorted(list_saves()) if filenames is None else filenames):
+        success, result = load_character(filename)
+        if success:
+            yield filename, result
+
 def default_save_name(character: VtMCharacter) -> str:
     """Returns a sanitized default filename for a character."""
-    return character.name.replace(" ", "_").lower()
\ No newline at end of file
+    name = character.name.replace(" ", "_")
+    for sep in (os.sep, os.altsep):
+        if sep:
+            name = name.replace(sep, "_")
+    return name.lower()
+
+def list_save_summaries() -> list[SaveSummary]:
+    """
+    Returns a SaveSummary (name, clan, age, generation) for every save in saves/,
+    sorted by filename. The first call scans the folder and starts watching it;
+    later calls only re-read the files the watcher reports as added or changed.
+    Unreadable files are listed with placeholder metadata so they can still be picked.
+    Archived saves are listed from their bundle index (archived=True).
+    """
+    global _sorted_summaries, _sorted_archive
+    refresh_library()
+    archived = _archived_index()
+    with _index_lock:
+        if _sorted_summaries is None or _sorted_archive is not archived:
+            summaries = list(_summary_cache.values())
+            summaries += [_archived_summary(member) for name, (_, member) in archived.items() if name not in _summary_cache]
+            _sorted_summaries = sorted(summaries, key=lambda s: s.filename.lower())
+            _sorted_archive = archived
+        return list(_sorted_summaries)
+
+def get_save_summary(filename: str) -> Optional[SaveSummary]:
+    """The indexed summary of one save (as of the last refresh), or None."""
+    summary = _summary_cache.get(filename)
+    if summary is None:
+        archived = _find_archived(filename)
+        if archived is not None:
+            return _archived_summary(archived[1])
+    return summary
+
+def refresh_library() -> list:
+    """
+    Applies the watcher's pending events to the summary index and passes them
+    to every library listener. Returns the events (save_watcher.SaveEvent).
+    """
+    global _watcher, _watched_dir, _sorted_summaries
+    from .save_watcher import watch_saves, DELETED
+
+    with _index_lock:
+        if _watcher is None or _watched_dir != SAVES_DIR:
+            # Full scan on first use, or after SAVES_DIR was repointed. A missing
+            # folder gets a polling watcher, which reports its files once it appears.
+            if _watcher is not None:
+                _watcher.close()
+            _watcher, _watched_dir = watch_saves(SAVES_DIR), SAVES_DIR
+            _summary_cache.clear()
+            for name in _watcher.names:
+                filename = name[:-5]
+                _summary_cache[filename] = _stat_summary(os.path.join(SAVES_DIR, name), filename)
+            _sorted_summaries = None
+            events = []
+        else:
+            events = _watcher.poll()
+            for event in events:
+                if event.kind == DELETED:
+                    _summary_cache.pop(event.filename, None)
+                else:
+                    _summary_cache[event.filename] = _stat_summary(event.path, event.filename)
+            if events:
+                _sorted_summaries = None
+        listeners = list(_library_listeners)
+
+    if events:
+        for listener in listeners:
+            listener(events)
+    return events
+
+def add_library_listener(listener):
+    """Registers listener(events), called by refresh_library() whenever saves change."""
+    with _index_lock:
+        _library_listeners.append(listener)
+
+def remove_library_listener(listener):
+    with _index_lock:
+        if listener in _library_listeners:
+            _library_listeners.remove(listener)
+
+# --- [ARCHIVE] ---
+class ArchiveResult(NamedTuple):
+    bundle: str            # Path of the bundle written
+    archived: List[str]    # Filenames moved into it
+    kept: List[str]        # Changed while archiving; left as normal files
+    original_bytes: int    # Size of the archived save files (kept ones excluded)
+    bundle_bytes: int
+
+def _archive_dir(saves_dir: Optional[str] = None) -> str:
+    return os.path.join(SAVES_DIR if saves_dir is None else saves_dir, ARCHIVE_SUBDIR)
+
+def _archived_index(saves_dir: Optional[str] = None) -> Dict[str, tuple]:
+    """
+    {filename: (BundleReader, ArchiveMember)} over every bundle in saves/archive/
+    (or saves_dir/archive/).
+    Bundles are named by creation time and sequence, so a later bundle's copy of
+    a save wins.
+    Only re-read when the folder's mtime changes.
+    """
+    global _archive_index, _archive_stamp
+    from .save_archive import BundleReader, BundleError, BUNDLE_SUFFIX
+
+    directory = _archive_dir(saves_dir)
+    try:
+        stamp = (directory, os.stat(directory).st_mtime_ns)
+    except OSError:
+        stamp = (directory, 0)
+    with _archive_lock:
+        if stamp == _archive_stamp:
+            return _archive_index
+        index = {}
+        if stamp[1]:
+            names = [name for name in os.listdir(directory) if name.endswith(BUNDLE_SUFFIX)]
+            # Compared without the suffix, so "bundle-<time>" sorts before its "-000" successors
+            for name in sorted(names, key=lambda name: name[:-len(BUNDLE_SUFFIX)]):
+                try:
+                    reader = BundleReader(os.path.join(directory, name))
+                except (OSError, BundleError):
+                    continue # Damaged bundles are skipped, not fatal to the library
+                for filename, member in reader.members.items():
+                    index[filename] = (reader, member)
+        _archive_index, _archive_stamp = index, stamp
+        return index
+
+def _find_archived(filename: str, saves_dir: Optional[str] = None) -> Optional[tuple]:
+    return _archived_index(saves_dir).get(filename)
+
+def _archived_summary(member) -> SaveSummary:
+    header = member.header
+    return SaveSummary(member.filename, header.get("name") or "?", header.get("clan") or "?",
+                       header.get("age") or 0, header.get("generation") or 0, member.mtime, archived=True)
+
+def archive_saves(older_than_days: float = ARCHIVE_AFTER_DAYS, codec: str = "zlib",
+                  now: Optional[float] = None) -> tuple[bool, str | ArchiveResult]:
+    """
+    Moves every save not modified for older_than_days into one new compressed
+    bundle in saves/archive/, then deletes the original files. A file saved
+    again while the bundle was being written is kept as it is.
+    Returns (True, ArchiveResult), or (False, message) when nothing was archived.
+    """
+    with tracing.span("archive", codec=codec):
+        return _archive_saves(older_than_days, codec, time.time() if now is None else now)
+
+def _archive_saves(older_than_days: float, codec: str, now: float) -> tuple[bool, str | ArchiveResult]:
+    from .save_archive import build_bundle, BUNDLE_SUFFIX, CODECS
+    if codec not in CODECS:
+        return False, f"Unknown codec '{codec}' (choose from: {', '.join(CODECS)})."
+
+    cutoff = now - older_than_days * 86400
+    members, stamps, sizes = [], {}, {}
+    for filename in sorted(_list_loose_saves()):
+        try:
+            path = _build_path(filename)
+        except ValueError:
+            continue # A link pointing out of saves/
+        with _locked(path):
+            try:
+                st = os.stat(path)
+                if st.st_mtime > cutoff:
+                    continue
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                payload = json.dumps(json.loads(raw), separators=(",", ":")).encode("utf-8")
+            except (OSError, ValueError):
+                continue # Missing or unreadable: leave it where it is
+        members.append((filename, payload, len(raw), st.st_mtime))
+        stamps[filename] = (st.st_mtime_ns, st.st_size)
+        sizes[filename] = len(raw)
+    if not members:
+        return False, f"No saves older than {older_than_days:g} days."
+
+    try:
+        os.makedirs(_archive_dir(), exist_ok=True)
+        base = os.path.join(_archive_dir(), time.strftime("bundle-%Y%m%d-%H%M%S", time.localtime(now)))
+        # Zero-padded sequence, so bundles from the same second still sort in creation order
+        sequence = 0
+        while os.path.exists(f"{base}-{sequence:03d}{BUNDLE_SUFFIX}"):
+            sequence += 1
+        bundle_path = f"{base}-{sequence:03d}{BUNDLE_SUFFIX}"
+        data = build_bundle(members, codec)
+        _write_atomic(bundle_path, data)
+    except Exception as e:
+        return False, f"Failed to archive: {str(e)}"
+
+    archived, kept = [], []
+    for filename, _, _, _ in members:
+        path = _build_path(filename)
+        with _locked(path):
+            try:
+                st = os.stat(path)
+                if (st.st_mtime_ns, st.st_size) != stamps[filename]:
+                    kept.append(filename) # Saved meanwhile: the file stays newer than its archived copy
+                    continue
+                os.remove(path)
+            except OSError:
+                pass # Already gone
+        archived.append(filename)
+
+    return True, ArchiveResult(bundle_path, archived, kept, sum(sizes[filename] for filename in archived), len(data))
+
+def _stat_summary(path: str, filename: str) -> SaveSummary:
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = 0.0
+    return _read_summary(path, filename, mtime)
+
+def _read_summary(path: str, filename: str, mtime: float) -> SaveSummary:
+    """Parses a save file and keeps only its summary fields (name, clan, age, generation)."""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return SaveSummary(filename, data.get("name", "?"), data.get("clan", "?"),
+                           data.get("age", 0), data.get("generation", 0), mtime)
+    except (OSError, ValueError, AttributeError):
+        return SaveSummary(filename, "(unreadable)", "?", 0, 0, mtime)
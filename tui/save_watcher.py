@@ -0,0 +1,206 @@
+"""
+tui/save_watcher.py
+
+Watches the saves/ folder and reports what changed since the last poll as
+SaveEvent("added" | "changed" | "deleted", filename, path) records, so indexes
+built over the library can be updated file by file instead of rescanned.
+
+Two backends with the same poll()/close() interface:
+  - InotifyWatcher: Linux inotify through ctypes. poll() only reads the
+    pending kernel events; it never touches the directory.
+  - PollingWatcher: compares an (mtime, size) snapshot taken with os.scandir.
+    Used where inotify isn't available, and when the directory doesn't exist yet.
+
+Events are coalesced per poll: a file written several times shows up as one
+"changed", and a file created then deleted between polls not at all. Only
+*.json files count (temp files from atomic saves and .lock files are ignored).
+
+Usage:
+    watcher = watch_saves("saves")
+    for event in watcher.poll():
+        ...
+"""
+
+import os
+import struct
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# --- [CONSTANTS] ---
+ADDED, CHANGED, DELETED = "added", "changed", "deleted"
+SAVE_SUFFIX = ".json"
+
+# inotify flags (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_DELETE      = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF   = 0x00000800
+IN_Q_OVERFLOW  = 0x00004000
+IN_IGNORED     = 0x00008000
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII") # wd, mask, cookie, len
+READ_SIZE = 64 * 1024
+
+class SaveEvent(NamedTuple):
+    kind: str      # ADDED, CHANGED or DELETED
+    filename: str  # Without extension
+    path: str
+
+# --- [HELPERS] ---
+def _is_save(name: str) -> bool:
+    return name.endswith(SAVE_SUFFIX) and not name.startswith(".")
+
+def _scan(directory: str) -> Dict[str, Tuple[int, int]]:
+    """Returns {file name: (mtime_ns, size)} for every save in directory."""
+    found = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if _is_save(entry.name):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue # Removed mid-scan
+                    found[entry.name] = (st.st_mtime_ns, st.st_size)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return found
+
+def _diff(directory: str, before: Dict[str, Tuple[int, int]], after: Dict[str, Tuple[int, int]]) -> List[SaveEvent]:
+    events = []
+    for name, stamp in after.items():
+        old = before.get(name)
+        if old is None:
+            events.append(SaveEvent(ADDED, name[:-len(SAVE_SUFFIX)], os.path.join(directory, name)))
+        elif old != stamp:
+            events.append(SaveEvent(CHANGED, name[:-len(SAVE_SUFFIX)], os.path.join(directory, name)))
+    for name in before:
+        if name not in after:
+            events.append(SaveEvent(DELETED, name[:-len(SAVE_SUFFIX)], os.path.join(directory, name)))
+    return events
+
+# --- [POLLING BACKEND] ---
+class PollingWatcher:
+    """Detects changes by re-scanning the directory's mtimes and sizes on every poll()."""
+
+    def __init__(self, directory: str, snapshot: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.directory = directory
+        self._snapshot = _scan(directory) if snapshot is None else snapshot
+
+    @property
+    def names(self) -> Set[str]:
+        return set(self._snapshot)
+
+    def poll(self) -> List[SaveEvent]:
+        current = _scan(self.directory)
+        events = _diff(self.directory, self._snapshot, current)
+        self._snapshot = current
+        return events
+
+    def close(self):
+        pass
+
+# --- [INOTIFY BACKEND] ---
+class InotifyWatcher:
+    """
+    Reads inotify events for the directory. Raises OSError from the constructor
+    when inotify is unavailable or the directory can't be watched.
+    """
+
+    def __init__(self, directory: str):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.directory = directory
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"cannot watch {directory}")
+        # Watch first, then scan, so nothing written in between is missed
+        self._snapshot = _scan(directory)
+        self._fallback: Optional[PollingWatcher] = None
+
+    @property
+    def names(self) -> Set[str]:
+        return set(self._snapshot)
+
+    def poll(self) -> List[SaveEvent]:
+        if self._fallback is not None:
+            return self._fallback.poll()
+
+        touched: Dict[str, None] = {} # Ordered set of names seen in this batch
+        rescan = False
+        while True:
+            try:
+                data = os.read(self._fd, READ_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(sys.getfilesystemencoding(), "replace")
+                offset += length
+                if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    rescan = True
+                elif _is_save(name):
+                    touched[name] = None
+
+        if rescan:
+            return self._rescan()
+        return self._apply(touched)
+
+    def _apply(self, names: Iterable[str]) -> List[SaveEvent]:
+        """Stats only the files named in the events and compares them with the snapshot."""
+        before, after = {}, {}
+        for name in names:
+            if name in self._snapshot:
+                before[name] = self._snapshot[name]
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                self._snapshot.pop(name, None)
+                continue
+            after[name] = self._snapshot[name] = (st.st_mtime_ns, st.st_size)
+        events = _diff(self.directory, before, after)
+        # A rewrite with the same mtime and size is still a change inotify saw
+        return events + [SaveEvent(CHANGED, n[:-len(SAVE_SUFFIX)], os.path.join(self.directory, n))
+                         for n in after if n in before and before[n] == after[n]]
+
+    def _rescan(self) -> List[SaveEvent]:
+        """Queue overflow or the directory itself went away: diff a full scan, then fall back to polling if unwatched."""
+        current = _scan(self.directory)
+        events = _diff(self.directory, self._snapshot, current)
+        self._snapshot = current
+        if not os.path.isdir(self.directory):
+            self.close()
+            self._fallback = PollingWatcher(self.directory, current)
+        return events
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+# --- [FACTORY] ---
+def watch_saves(directory: str, polling: bool = False):
+    """Returns an inotify watcher for directory when possible, else a polling one."""
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory)
+        except OSError:
+            pass # Missing directory, no inotify, or out of watches
+    return PollingWatcher(directory)
@@ -0,0 +1,169 @@
+"""
+tui/search.py
+
+Incremental fuzzy matching for list filtering, and trie-backed type-ahead
+completion for selection inputs. Scoring is case-insensitive: prefix matches
+rank above substring matches, which rank above scattered (subsequence) matches.
+"""
+
+import functools
+import heapq
+from typing import Callable, List, Optional, Sequence
+
+# --- [SCORING] ---
+def fuzzy_score(query: str, text: str) -> Optional[int]:
+    """
+    Returns a match score (higher is better) or None if query is not a
+    subsequence of text. Both arguments are expected to be lowercase.
+    """
+    if not query:
+        return 0
+    pos = text.find(query)
+    if pos == 0:
+        return 3000 - len(text)
+    if pos > 0:
+        return 2000 - pos
+
+    # Subsequence match, rewarding consecutive characters
+    score = 1000
+    last = -1
+    for ch in query:
+        found = text.find(ch, last + 1)
+        if found == -1:
+            return None
+        if found != last + 1:
+            score -= found - last
+        last = found
+    return score
+
+# --- [INCREMENTAL FILTER] ---
+class IncrementalFilter:
+    """
+    Filters a fixed list of items by a growing/shrinking query.
+    When the new query extends the previous one, only the previous
+    result set is re-scored instead of the full list.
+    """
+
+    def __init__(self, items: Sequence, key: Callable[[object], str] = str):
+        self.items = list(items)
+        self._key = key
+        self._keys = [key(item).lower() for item in self.items]
+        self._query = ""
+        self._matches: List[int] = list(range(len(self.items)))  # Indices into items
+
+    # --- Incremental updates (no rescoring of the other items) ---
+    def add(self, item):
+        """Appends item; it joins the current matches if it fits the last query."""
+        self.items.append(item)
+        self._keys.append(self._key(item).lower())
+        if fuzzy_score(self._query, self._keys[-1]) is not None:
+            self._matches.append(len(self.items) - 1)
+
+    def remove(self, item):
+        """Removes item (compared by ==) if present."""
+        try:
+            idx = self.items.index(item)
+        except ValueError:
+            return
+        del self.items[idx]
+        del self._keys[idx]
+        self._matches = [i if i < idx else i - 1 for i in self._matches if i != idx]
+
+    def filter(self, query: str) -> list:
+        """Returns the items matching query, best match first."""
+        query = query.lower()
+        if query.startswith(self._query):
+            candidates = self._matches
+        else:
+            candidates = range(len(self.items))
+
+        scored = []
+        for idx in candidates:
+            score = fuzzy_score(query, self._keys[idx])
+            if score is not None:
+                scored.append((-score, idx))
+
+        if query:
+            scored.sort()  # Empty query keeps the original order
+        self._matches = [idx for _, idx in scored]
+        self._query = query
+        return [self.items[idx] for idx in self._matches]
+
+# --- [PREFIX TRIE] ---
+_IDS = None  # Trie node key holding the option indices reachable through that node
+
+class PrefixTrie:
+    """
+    Character trie over a list of options. Every word start inside an option
+    is indexed too, so "set" completes "Followers Of Set".
+    Lookup cost depends on the prefix length, not on the number of options.
+    """
+
+    def __init__(self, options: Sequence[str]):
+        self._root: dict = {}
+        for idx, option in enumerate(options):
+            lowered = option.lower()
+            starts = [0] + [i + 1 for i, ch in enumerate(lowered) if ch in " _-" and i + 1 < len(lowered)]
+            for start in starts:
+                node = self._root
+                for ch in lowered[start:]:
+                    node = node.setdefault(ch, {})
+                    ids = node.setdefault(_IDS, [])
+                    # Suffixes of one option are inserted back to back, so duplicates are adjacent
+                    if not ids or ids[-1] != idx:
+                        ids.append(idx)
+
+    def lookup(self, prefix: str) -> List[int]:
+        """Returns the indices of options containing a word that starts with prefix."""
+        node = self._root
+        for ch in prefix.lower():
+            node = node.get(ch)
+            if node is None:
+                return []
+        return node.get(_IDS, [])
+
+# --- [TYPE-AHEAD MATCHER] ---
+class TypeAheadMatcher:
+    """
+    Ranked completion over a fixed option list: whole-option prefix matches first,
+    then word-start matches (both from the trie), then fuzzy subsequence matches.
+    """
+
+    def __init__(self, options: Sequence[str]):
+        self.options = list(options)
+        self._lowered = [opt.lower() for opt in self.options]
+        self._trie = PrefixTrie(self.options)
+
+    def match(self, query: str, limit: int = 8) -> List[str]:
+        """Returns up to limit options for query, best first. Empty query returns []."""
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        hits = self._trie.lookup(query)
+        results = heapq.nsmallest(limit, hits, key=lambda i: (not self._lowered[i].startswith(query), len(self._lowered[i]), i))
+
+        if len(results) < limit:
+            # Fall back to fuzzy matches for typos and abbreviations ("thma" -> "Thaumaturgy")
+            seen = set(hits)
+            fuzzy = []
+            for i, text in enumerate(self._lowered):
+                if i in seen:
+                    continue
+                score = fuzzy_score(query, text)
+                if score is not None:
+                    fuzzy.append((-score, i))
+            fuzzy.sort()
+            results.extend(i for _, i in fuzzy[:limit - len(results)])
+
+        return [self.options[i] for i in results]
+
+MATCHER_CACHE_SIZE = 32 # Option lists kept built; the app only has a handful
+
+@functools.lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _build_matcher(options: tuple) -> TypeAheadMatcher:
+    return TypeAheadMatcher(options)
+
+def get_matcher(options: Sequence[str]) -> TypeAheadMatcher:
+    """Returns a prebuilt matcher for an option list, building it on first use."""
+    return _build_matcher(tuple(options))
@@ -0,0 +1,73 @@
+"""
+tui/session.py
+
+Keeps several characters open at once for MainView's tabs.
+Each tab only stores its character and a few cursor fields; column models,
+layouts and formatted glyphs live in shared module-level caches in renderer.py.
+"""
+
+from typing import List
+from vtm_npc_logic import VtMCharacter
+from vtm_snapshot import SnapshotHistory
+from .save_manager import forget_character
+
+# --- [TAB STATE] ---
+class TabState:
+    """Per-tab view state. Slotted so 20+ open tabs stay cheap."""
+    __slots__ = ("character", "active_col", "active_row", "message", "message_color", "history")
+
+    def __init__(self, character: VtMCharacter, message_color=0):
+        self.character = character
+        # Undo/redo timeline; snapshots share unchanged traits, so each edit costs little
+        self.history = SnapshotHistory()
+        self.history.record(character)
+        self.active_col = 0
+        self.active_row = 0
+        self.message = ""
+        self.message_color = message_color
+
+    @property
+    def label(self) -> str:
+        return self.character.name
+
+# --- [SESSION] ---
+class Session:
+    """An ordered set of open tabs with one active tab."""
+
+    def __init__(self, characters: List[VtMCharacter] = (), message_color=0):
+        self._message_color = message_color
+        self.tabs: List[TabState] = [TabState(c, message_color) for c in characters]
+        self.active = 0
+
+    @property
+    def current(self) -> TabState:
+        return self.tabs[self.active]
+
+    @property
+    def characters(self) -> List[VtMCharacter]:
+        return [tab.character for tab in self.tabs]
+
+    def open(self, character: VtMCharacter) -> TabState:
+        """Opens a character in a new tab (or focuses it if already open) and makes it active."""
+        for i, tab in enumerate(self.tabs):
+            if tab.character is character:
+                self.active = i
+                return tab
+        self.tabs.append(TabState(character, self._message_color))
+        self.active = len(self.tabs) - 1
+        return self.current
+
+    def close(self, index: int = None) -> bool:
+        """Closes a tab (default: the active one). The last tab can't be closed."""
+        index = self.active if index is None else index
+        if len(self.tabs) <= 1:
+            return False
+        forget_character(self.tabs.pop(index).character)
+        if index < self.active:
+            self.active -= 1
+        self.active = min(self.active, len(self.tabs) - 1)
+        return True
+
+    def cycle(self, delta: int):
+        """Moves the active tab by delta, wrapping around."""
+        self.active = (self.active + delta) % len(self.tabs)
@@ -4,21 +4,30 @@ from typing import Dict, Any, Optional
 from . import utils
 from .utils import QuitApplication, safe_input, InputCancelled
 from . import theme
+from . import tracing
 from vtm_npc_logic import VtMCharacter, ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST
 from vtm_data import CLAN_DATA
+from vtm_templates import TEMPLATES, BLANK_TEMPLATE, get_template, apply_template
 
 class SetupView:
     def __init__(self, stdscr):
         self.stdscr = stdscr
+        self.template = None # Archetype picked during identity setup, if any
 
     def run(self, is_free_mode: bool) -> Optional[VtMCharacter]:
-        character = self._setup_character(is_free_mode)
+        with tracing.span("SetupView.step", step="identity"):
+            character = self._setup_character(is_free_mode)
         if not character:
             return None
         
-        if is_free_mode:
+        if self.template is not None:
+            # One pass over the precomputed ratings instead of the wizard
+            with tracing.span("SetupView.step", step="template", template=self.template.name):
+                apply_template(character, self.template)
+        elif is_free_mode:
             # Skip the wizard and just initialize everything to 0
-            self._fill_blank_traits(character)
+            with tracing.span("SetupView.step", step="blank_traits"):
+                self._fill_blank_traits(character)
         else:
             self._setup_initial_traits(character)
             
@@ -26,27 +35,27 @@ class SetupView:
 
     def _fill_blank_traits(self, character: VtMCharacter):
         """Silently populates the character with 0s for Free Mode."""
-        for attr in ATTRIBUTES_LIST:
-            character.set_initial_trait("attributes", attr, 0)
-            
-        for abil in ABILITIES_LIST:
-            character.set_initial_trait("abilities", abil, 0)
-            
-        for virt in VIRTUES_LIST:
-            character.set_initial_trait("virtues", virt, 0)
+        apply_template(character, BLANK_TEMPLATE)
 
     def _setup_character(self, is_free_mode: bool) -> Optional[VtMCharacter]:
         clan_list = sorted(list(CLAN_DATA.keys()))
+        # First option keeps the usual path: the wizard, or blank traits in Free Mode
+        archetype_list = ["Blank" if is_free_mode else "Custom"] + list(TEMPLATES)
 
         prompts = [
             ("Character Name", None, None, None),
             ("Clan", clan_list, None, None),
             ("Age (0-5600+)", None, 0, 10000),
-            ("Generation (2-16)", None, 2, 16)
+            ("Generation (2-16)", None, 2, 16),
+            ("Archetype", archetype_list, None, None)
         ]
         entered_info: Dict[str, Any] = {}
 
         def draw_setup_screen():
+            with tracing.span("SetupView.draw", step="identity"):
+                return _draw_setup_screen()
+
+        def _draw_setup_screen():
             h, w = self.stdscr.getmaxyx()
             self.stdscr.erase()
             container_width, container_height = 70, 18
@@ -78,6 +87,9 @@ class SetupView:
             entered_info["Age (0-5600+)"], entered_info["Generation (2-16)"],
             is_free_mode=is_free_mode
         )
+        self.template = get_template(entered_info["Archetype"])
+        if self.template is BLANK_TEMPLATE:
+            self.template = None
 
         h, w = self.stdscr.getmaxyx()
         container_width, container_height = 70, 18
@@ -91,7 +103,8 @@ class SetupView:
         freebie_msg = "Freebie Points: Unlimited" if is_free_mode else f"Character created with {character.total_freebies} Freebie Points!"
         self.stdscr.addstr(list_y + 1, start_x + 2, freebie_msg, theme.CLR_ACCENT())
 
-        prompt_msg = "Press any key to enter character sheet..." if is_free_mode else "Press any key to set initial traits..."
+        skip_wizard = is_free_mode or self.template is not None
+        prompt_msg = "Press any key to enter character sheet..." if skip_wizard else "Press any key to set initial traits..."
         self.stdscr.addstr(list_y + 3, start_x + 2, prompt_msg, theme.CLR_BORDER())
 
         self.stdscr.refresh()
@@ -106,6 +119,10 @@ class SetupView:
             entered_items: Dict[str, Any] = {}
 
             def draw_loop_screen(current_item_name=None):
+                with tracing.span("SetupView.draw", step=title_text):
+                    return _draw_loop_screen(current_item_name)
+
+            def _draw_loop_screen(current_item_name=None):
                 h, w = self.stdscr.getmaxyx()
                 self.stdscr.erase()
                 container_width, container_height = 60, min(40, h - 4)
@@ -150,14 +167,20 @@ class SetupView:
 
             return entered_items
 
-        run_setup_loop("Attributes", ATTRIBUTES_LIST, 1, 10)
-        run_setup_loop("Abilities", ABILITIES_LIST, 0, 10)
+        with tracing.span("SetupView.step", step="Attributes"):
+            run_setup_loop("Attributes", ATTRIBUTES_LIST, 1, 10)
+        with tracing.span("SetupView.step", step="Abilities"):
+            run_setup_loop("Abilities", ABILITIES_LIST, 0, 10)
 
         entered_virtues: Dict[str, Any] = {}
         humanity = None
         willpower = None
 
         def draw_virtues_screen():
+            with tracing.span("SetupView.draw", step="Virtues"):
+                return _draw_virtues_screen()
+
+        def _draw_virtues_screen():
             h, w = self.stdscr.getmaxyx()
             self.stdscr.erase()
             container_width, container_height = 60, 20
@@ -179,16 +202,17 @@ class SetupView:
                 list_y += 1
             return start_y, start_x, list_y
 
-        for virtue in VIRTUES_LIST:
-            _, start_x, list_y = draw_virtues_screen()
-            val = safe_input(utils.get_number_input, self.stdscr, f"{virtue}: ", list_y, start_x + 2, 1, 10, draw_virtues_screen)
-            entered_virtues[virtue] = val
-            character.set_initial_trait("virtues", virtue, val)
+        with tracing.span("SetupView.step", step="Virtues"):
+            for virtue in VIRTUES_LIST:
+                _, start_x, list_y = draw_virtues_screen()
+                val = safe_input(utils.get_number_input, self.stdscr, f"{virtue}: ", list_y, start_x + 2, 1, 10, draw_virtues_screen)
+                entered_virtues[virtue] = val
+                character.set_initial_trait("virtues", virtue, val)
 
-        _, start_x, list_y = draw_virtues_screen()
-        humanity = safe_input(utils.get_number_input, self.stdscr, "Humanity/Path: ", list_y, start_x + 2, 1, 10, draw_virtues_screen)
-        character.set_initial_value("humanity", humanity)
+            _, start_x, list_y = draw_virtues_screen()
+            humanity = safe_input(utils.get_number_input, self.stdscr, "Humanity/Path: ", list_y, start_x + 2, 1, 10, draw_virtues_screen)
+            character.set_initial_value("humanity", humanity)
 
-        _, start_x, list_y = draw_virtues_screen()
-        willpower = safe_input(utils.get_number_input, self.stdscr, "Willpower: ", list_y, start_x + 2, 1, 10, draw_virtues_screen)
-        character.set_initial_value("willpower", willpower)
\ No newline at end of file
+            _, start_x, list_y = draw_virtues_screen()
+            willpower = safe_input(utils.get_number_input, self.stdscr, "Willpower: ", list_y, start_x + 2, 1, 10, draw_virtues_screen)
+            character.set_initial_value("willpower", willpower)
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+tui/tracing.py
+
+Session-wide tracing for reproducing "it's laggy" reports. Views and save/load
+wrap their work in tracing.span(...); each finished span becomes one
+tab-separated line in a rotating trace file:
+
+    <ms since start>  <duration ms>  <depth>  <span name>  <key=value,...>
+
+Optional extras for the same session:
+  - a cProfile capture of the UI thread (.prof, open with pstats or snakeviz)
+  - a sampled call-stack dump of the UI thread in folded format
+    ("frame;frame;frame count"), ready for flamegraph tools
+
+Enable with --trace/--profile/--sample-ms on vtm_npc_tui.py, or the env vars
+below. While disabled, span() returns a shared no-op context manager.
+
+(For the live per-frame overlay of MainView see instrumentation.py.)
+"""
+
+import contextlib
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+# --- [CONSTANTS] ---
+ENV_TRACE = "VTM_NPC_TRACE"               # "1" for the default path, or a file path
+ENV_PROFILE = "VTM_NPC_PROFILE"           # cProfile output path
+ENV_SAMPLE_MS = "VTM_NPC_TRACE_SAMPLE_MS"  # Stack sampling interval in ms
+DEFAULT_TRACE_PATH = "vtm_trace.log"
+
+TRACE_MAX_BYTES = 1 << 20 # Rotate after 1 MiB...
+TRACE_BACKUPS = 3         # ...keeping vtm_trace.log.1 to .3
+MAX_STACK_DEPTH = 48
+
+_NULL_SPAN = contextlib.nullcontext()
+
+# --- [TRACER] ---
+class Tracer:
+    """
+    Writes finished spans to a size-rotated trace file. Lines are buffered and
+    flushed when a top-level span ends. Safe to use from worker threads.
+    """
+
+    def __init__(self, path: str, max_bytes: int = TRACE_MAX_BYTES, backups: int = TRACE_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._origin = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._write(f"# vtm-npc trace pid={os.getpid()} start={time.strftime('%Y-%m-%dT%H:%M:%S')}\n", flush=True)
+
+    @contextlib.contextmanager
+    def span(self, name: str, fields: dict):
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._local.depth = depth
+            thread = threading.current_thread()
+            if thread is not threading.main_thread():
+                fields = {**fields, "thread": thread.name}
+            extra = ",".join(f"{k}={v}" for k, v in fields.items())
+            self._write(f"{(start - self._origin) * 1000:.1f}\t{(end - start) * 1000:.3f}\t{depth}\t{name}\t{extra}\n",
+                        flush=depth == 0)
+
+    def _write(self, line: str, flush: bool):
+        with self._lock:
+            if self._file is None:
+                return
+            if self._size + len(line) > self.max_bytes:
+                self._rotate()
+            self._file.write(line)
+            self._size += len(line)
+            if flush:
+                self._file.flush()
+
+    def _rotate(self):
+        """Shifts path -> path.1 -> ... -> path.N (dropping the oldest) and starts a new file."""
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._size = 0
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+# --- [STACK SAMPLER] ---
+class StackSampler:
+    """Samples one thread's call stack at a fixed interval and counts identical stacks."""
+
+    def __init__(self, interval_ms: int, thread_id: int = None):
+        self.interval = interval_ms / 1000
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="vtm-stack-sampler")
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def stop(self, path: str) -> str:
+        """Stops sampling and writes folded stacks to path (most frequent first)."""
+        self._stop.set()
+        self._thread.join()
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+# --- [MODULE STATE] ---
+_tracer: Optional[Tracer] = None
+_profiler: Optional[cProfile.Profile] = None
+_profile_path: Optional[str] = None
+_sampler: Optional[StackSampler] = None
+
+def span(name: str, **fields):
+    """Context manager recording a named span. A shared no-op while tracing is off."""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(name, fields)
+
+def enabled() -> bool:
+    return _tracer is not None
+
+def configure(trace: Optional[str] = None, profile: Optional[str] = None, sample_ms: Optional[int] = None):
+    """
+    Starts tracing for this session. Each argument falls back to its env var;
+    trace may be a path or "1"/"true" for the default path. Call shutdown() on exit.
+    """
+    global _tracer, _profiler, _profile_path, _sampler
+    trace = trace or os.environ.get(ENV_TRACE, "")
+    profile = profile or os.environ.get(ENV_PROFILE, "")
+    sample_ms = sample_ms or int(os.environ.get(ENV_SAMPLE_MS, "0") or 0)
+
+    if trace.lower() in ("", "0", "false", "no", "off"):
+        trace = ""
+    elif trace.lower() in ("1", "true", "yes", "on"):
+        trace = DEFAULT_TRACE_PATH
+    if (sample_ms or profile) and not trace:
+        trace = DEFAULT_TRACE_PATH # Extras are written next to the trace
+
+    if trace and _tracer is None:
+        _tracer = Tracer(trace)
+    if sample_ms and _sampler is None:
+        _sampler = StackSampler(sample_ms)
+        _sampler.start()
+    if profile and _profiler is None:
+        _profile_path = profile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+def shutdown() -> list:
+    """Stops tracing, profiling and sampling. Returns the paths written."""
+    global _tracer, _profiler, _sampler
+    written = []
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(_profile_path)
+        written.append(_profile_path)
+        _profiler = None
+    if _sampler is not None:
+        written.append(_sampler.stop(_tracer.path + ".stacks"))
+        _sampler = None
+    if _tracer is not None:
+        written.append(_tracer.path)
+        _tracer.close()
+        _tracer = None
+    return written
@@ -2,6 +2,7 @@
 import curses
 import textwrap
 from . import theme
+from . import search
 
 # --- [DRAWING HELPERS] ---
 def draw_box(stdscr, y, x, height, width, title=""):
@@ -95,6 +96,28 @@ class InputCancelled(Exception):
     """Used when the user cancels an input (via ESC)"""
     pass
 
+def read_key_batch(stdscr, repeatable_keys=()) -> list:
+    """
+    Blocks for one key press, then drains queued repeatable keys (e.g. held arrows)
+    without blocking. Lets auto-repeat be handled as one batch instead of one redraw per event.
+    Draining stops after the first other key, so keys typed ahead for a prompt it opens stay queued.
+    """
+    keys = [stdscr.getch()]
+    if keys[0] not in repeatable_keys:
+        return keys
+    stdscr.nodelay(True)
+    try:
+        while True:
+            key = stdscr.getch()
+            if key == -1:
+                break
+            keys.append(key)
+            if key not in repeatable_keys:
+                break
+    finally:
+        stdscr.nodelay(False)
+    return keys
+
 def get_string_input(stdscr, prompt: str, y: int, x: int, current_screen_func, *args, **kwargs) -> str:
     curses.curs_set(1)
     input_str = ""
@@ -132,11 +155,16 @@ def get_number_input(stdscr, prompt: str, y: int, x: int, min_val: int, max_val:
         return None
 
 # --- Selection + Manual Input ---
+MAX_CANDIDATES = 6 # Type-ahead suggestions shown inline
+INPUT_AREA_WIDTH = 40 # Cleared input area; suggestions stay inside it
+
 def get_selection_input(stdscr, prompt: str, y: int, x: int, options: list, current_screen_func, *args, **kwargs) -> str:
     """
-    Allows user to select from a list using arrows OR type manually.
+    Allows user to select from a list using arrows OR type to search it.
     - Arrows (Up/Down/Left/Right): Cycle through options.
-    - Typing: Switches to manual input mode.
+    - Typing: Switches to type-ahead mode; the best matches are shown inline
+      and arrows cycle through them. Enter picks the highlighted match, or
+      keeps the typed text if nothing matches.
     - Backspace (on empty buffer): Reverts to selection mode.
     """
     curses.curs_set(0) # Start hidden (Selection mode)
@@ -145,6 +173,10 @@ def get_selection_input(stdscr, prompt: str, y: int, x: int, options: list, curr
     manual_buffer = ""
     selection_index = 0
     input_x_start = x + len(prompt)
+
+    matcher = search.get_matcher(options)
+    candidates = []
+    candidate_index = 0
     
     while True:
         # Redraw background to prevent trails
@@ -153,12 +185,13 @@ def get_selection_input(stdscr, prompt: str, y: int, x: int, options: list, curr
         stdscr.addstr(y, x, prompt, theme.CLR_ACCENT())
         
         # Clear the area where input goes
-        stdscr.addstr(y, input_x_start, " " * 40)
+        stdscr.addstr(y, input_x_start, " " * INPUT_AREA_WIDTH)
         
         if is_manual:
             curses.curs_set(1)
             display_str = f"{theme.SYM_SELECTED_L}{manual_buffer}{theme.SYM_SELECTED_R}"
             stdscr.addstr(y, input_x_start, display_str, theme.CLR_HIGHLIGHT())
+            _draw_candidates(stdscr, y, input_x_start + len(display_str) + 1, input_x_start + INPUT_AREA_WIDTH, candidates, candidate_index)
             # Move cursor to immediately after the text, but before the right bracket
             stdscr.move(y, input_x_start + len(theme.SYM_SELECTED_L) + len(manual_buffer))
         else:
@@ -180,15 +213,23 @@ def get_selection_input(stdscr, prompt: str, y: int, x: int, options: list, curr
         elif key in (curses.KEY_ENTER, ord('\n')):
             curses.curs_set(0)
             if is_manual:
+                if candidates:
+                    return candidates[candidate_index]
                 return manual_buffer.strip()
             return options[selection_index]
 
-        # Navigation (Cycles options if not manual, ignored if manual)
+        # Navigation (Cycles options, or the type-ahead matches if manual)
         elif key in (curses.KEY_UP, curses.KEY_RIGHT): 
-            if not is_manual:
+            if is_manual:
+                if candidates:
+                    candidate_index = (candidate_index + 1) % len(candidates)
+            else:
                 selection_index = (selection_index + 1) % len(options)
         elif key in (curses.KEY_DOWN, curses.KEY_LEFT):
-            if not is_manual:
+            if is_manual:
+                if candidates:
+                    candidate_index = (candidate_index - 1 + len(candidates)) % len(candidates)
+            else:
                 selection_index = (selection_index - 1 + len(options)) % len(options)
 
         # Backspace handling
@@ -198,6 +239,8 @@ def get_selection_input(stdscr, prompt: str, y: int, x: int, options: list, curr
                 # If buffer empty, revert to list mode
                 if not manual_buffer:
                     is_manual = False
+                candidates = matcher.match(manual_buffer, MAX_CANDIDATES)
+                candidate_index = 0
         
         # Typing (Switches to Manual)
         elif 32 <= key <= 126:
@@ -207,6 +250,25 @@ def get_selection_input(stdscr, prompt: str, y: int, x: int, options: list, curr
             
             if len(manual_buffer) < 30:
                 manual_buffer += chr(key)
+            candidates = matcher.match(manual_buffer, MAX_CANDIDATES)
+            candidate_index = 0
+
+def _draw_candidates(stdscr, y: int, x: int, end_x: int, candidates: list, active: int):
+    """Draws type-ahead matches on one line, stopping before end_x or the screen edge."""
+    end_x = min(end_x, stdscr.getmaxyx()[1] - 1)
+    if not candidates:
+        hint = "(no match, kept as typed)"
+        if x < end_x:
+            stdscr.addstr(y, x, hint[:end_x - x], theme.CLR_BORDER())
+        return
+
+    for i, candidate in enumerate(candidates):
+        text = candidate if i == 0 else f" | {candidate}"
+        if x + len(text) > end_x:
+            break
+        style = theme.CLR_HIGHLIGHT() if i == active else theme.CLR_BORDER()
+        stdscr.addstr(y, x, text, style)
+        x += len(text)
 
 def safe_input(prompt_fn, *args, **kwargs):
     """
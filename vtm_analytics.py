@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+
+"""
+vtm_analytics.py
+
+Flattens the whole saves/ library into one column per trait and metadata field
+for aggregate analysis (e.g. Potence across Brujah, freebies spent by generation).
+
+Columns are stored as dense NumPy arrays in a .npz file, or as CSV when the path
+ends in .csv or NumPy isn't installed. Re-running sync_library() only parses saves
+that are new or whose mtime changed, and drops rows for deleted saves.
+
+Command line:
+    python vtm_analytics.py                                   # sync library.npz
+    python vtm_analytics.py --hist disc.Potence --where clan=Brujah
+    python vtm_analytics.py --group-by generation --value spent_freebies --agg mean
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: CSV storage still works without it
+    np = None
+
+from vtm_data import ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST, DISCIPLINES_LIST, BACKGROUNDS_LIST
+from tui.save_manager import SAVES_DIR
+
+# --- [COLUMNS] ---
+DEFAULT_PATH = "library.npz"
+
+# Metadata columns; "filename", "name" and "clan" are strings, the rest integers
+STRING_COLUMNS = ("filename", "name", "clan")
+META_COLUMNS = STRING_COLUMNS + ("age", "generation", "is_free_mode", "spent_freebies", "mtime_ns")
+
+# Trait columns are "<prefix>.<trait name>" holding the current ("new") rating
+TRAIT_PREFIXES = {
+    "attributes": "attr", "abilities": "abil", "disciplines": "disc",
+    "backgrounds": "bg", "virtues": "virt",
+}
+
+BASE_COLUMNS = (
+    list(META_COLUMNS)
+    + [f"attr.{a}" for a in ATTRIBUTES_LIST] + [f"abil.{a}" for a in ABILITIES_LIST]
+    + [f"disc.{d}" for d in DISCIPLINES_LIST] + [f"bg.{b}" for b in BACKGROUNDS_LIST]
+    + [f"virt.{v}" for v in VIRTUES_LIST] + ["humanity", "willpower"]
+)
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for .npz storage and queries (pip install numpy); use a .csv path otherwise.")
+
+# --- [ROW EXTRACTION] ---
+def flatten_save(data: dict, filename: str, mtime_ns: int) -> dict:
+    """Turns one save dict into a flat {column: value} row."""
+    row = {
+        "filename":       filename,
+        "name":           data.get("name", ""),
+        "clan":           data.get("clan", ""),
+        "age":            int(data.get("age", 0)),
+        "generation":     int(data.get("generation", 0)),
+        "is_free_mode":   int(bool(data.get("is_free_mode", False))),
+        "spent_freebies": int(data.get("spent_freebies", 0)),
+        "mtime_ns":       mtime_ns,
+        "humanity":       int(data.get("humanity", {}).get("new", 0)),
+        "willpower":      int(data.get("willpower", {}).get("new", 0)),
+    }
+    for category, prefix in TRAIT_PREFIXES.items():
+        for trait, val in data.get(category, {}).items():
+            row[f"{prefix}.{trait}"] = int(val.get("new", 0))
+    return row
+
+def _scan_saves(saves_dir: str) -> Dict[str, Tuple[str, int]]:
+    """Returns {filename: (path, mtime_ns)} for every .json save."""
+    found = {}
+    if not os.path.isdir(saves_dir):
+        return found
+    with os.scandir(saves_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                found[entry.name[:-5]] = (entry.path, entry.stat().st_mtime_ns)
+    return found
+
+# --- [TABLE] ---
+class LibraryTable:
+    """Column store of the library: {column name: 1-D array}, one row per save."""
+
+    def __init__(self, columns: dict):
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["filename"]) if "filename" in self.columns else 0
+
+    # --- Conversion ---
+    @classmethod
+    def from_rows(cls, rows: list) -> "LibraryTable":
+        """Builds dense columns from row dicts. Missing traits become 0."""
+        names = list(BASE_COLUMNS)
+        known = set(names)
+        for row in rows:
+            for col in row:
+                if col not in known:
+                    known.add(col)
+                    names.append(col)
+
+        columns = {}
+        for col in names:
+            if col in STRING_COLUMNS:
+                values = [row.get(col, "") for row in rows]
+                columns[col] = np.array(values, dtype=str) if np is not None else values
+            else:
+                values = [row.get(col, 0) for row in rows]
+                columns[col] = np.array(values, dtype=np.int64) if np is not None else values
+        return cls(columns)
+
+    def rows(self) -> list:
+        """Returns the table as row dicts (used for incremental merges)."""
+        names = list(self.columns)
+        as_lists = {col: (vals.tolist() if np is not None else list(vals)) for col, vals in self.columns.items()}
+        return [{col: as_lists[col][i] for col in names} for i in range(len(self))]
+
+    # --- Storage ---
+    def save(self, path: str):
+        if path.endswith(".csv"):
+            names = list(self.columns)
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(names)
+                writer.writerows(zip(*(self.columns[col] for col in names)))
+        else:
+            _require_numpy()
+            np.savez_compressed(path, **self.columns)
+
+    @classmethod
+    def load(cls, path: str) -> "LibraryTable":
+        if path.endswith(".csv"):
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                rows = [
+                    {col: (val if col in STRING_COLUMNS else int(val)) for col, val in row.items()}
+                    for row in reader
+                ]
+            return cls.from_rows(rows)
+        _require_numpy()
+        with np.load(path, allow_pickle=False) as archive:
+            return cls({col: archive[col] for col in archive.files})
+
+    # --- Queries (vectorized; need NumPy) ---
+    def mask(self, **equals) -> "np.ndarray":
+        """Boolean row mask where every given column equals its value, e.g. mask(clan="Brujah")."""
+        _require_numpy()
+        selected = np.ones(len(self), dtype=bool)
+        for col, value in equals.items():
+            column = self.columns[col]
+            if col not in STRING_COLUMNS:
+                value = int(value)
+            selected &= column == value
+        return selected
+
+    def histogram(self, column: str, where=None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Returns (ratings, counts) for an integer column, optionally under a row mask."""
+        _require_numpy()
+        values = self.columns[column]
+        if where is not None:
+            values = values[where]
+        if len(values) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        offset = int(values.min())
+        counts = np.bincount(values - offset)
+        ratings = np.arange(offset, offset + len(counts))
+        present = counts > 0
+        return ratings[present], counts[present]
+
+    def group_by(self, key: str, value: str, agg: str = "mean", where=None) -> dict:
+        """
+        Aggregates value per distinct key: agg is one of count, sum, mean, min, max.
+        Returns {key: aggregate}.
+        """
+        _require_numpy()
+        keys = self.columns[key]
+        values = self.columns[value].astype(np.float64)
+        if where is not None:
+            keys, values = keys[where], values[where]
+        if len(keys) == 0:
+            return {}
+
+        groups, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(groups))
+        if agg == "count":
+            result = counts
+        elif agg in ("sum", "mean"):
+            sums = np.bincount(inverse, weights=values, minlength=len(groups))
+            result = sums if agg == "sum" else sums / counts
+        elif agg in ("min", "max"):
+            order = np.argsort(inverse, kind="stable")
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            reducer = np.minimum if agg == "min" else np.maximum
+            result = reducer.reduceat(values[order], starts)
+        else:
+            raise ValueError(f"Unknown aggregate '{agg}'.")
+        return dict(zip(groups.tolist(), result.tolist()))
+
+# --- [SYNC] ---
+def sync_library(path: str = DEFAULT_PATH, saves_dir: str = SAVES_DIR) -> Tuple[LibraryTable, dict]:
+    """
+    Brings the stored table at path up to date with saves_dir. Only new or
+    modified saves are parsed; unchanged rows are reused from the previous run.
+    Returns (table, report) where report counts added/changed/removed/unchanged/failed.
+    A save that can no longer be read loses its row (failed, and removed if it
+    had one), so the stored table always matches the one returned.
+    """
+    if np is None and not path.endswith(".csv"):
+        path = os.path.splitext(path)[0] + ".csv"
+
+    previous = {}
+    if os.path.exists(path):
+        previous = {row["filename"]: row for row in LibraryTable.load(path).rows()}
+
+    report = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "failed": 0, "path": path}
+    current = _scan_saves(saves_dir)
+    rows = []
+    for filename, (save_path, mtime_ns) in sorted(current.items()):
+        old = previous.get(filename)
+        if old is not None and old["mtime_ns"] == mtime_ns:
+            rows.append(old)
+            report["unchanged"] += 1
+            continue
+        try:
+            with open(save_path, "r") as f:
+                rows.append(flatten_save(json.load(f), filename, mtime_ns))
+        except (OSError, ValueError, AttributeError, TypeError):
+            report["failed"] += 1
+            if old is not None:
+                report["removed"] += 1
+            continue
+        report["changed" if old is not None else "added"] += 1
+    report["removed"] += len(set(previous) - set(current))
+
+    table = LibraryTable.from_rows(rows)
+    if report["added"] or report["changed"] or report["removed"] or not os.path.exists(path):
+        table.save(path)
+    return table, report
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Columnar analytics over the saves library.")
+    parser.add_argument("-o", "--output", default=DEFAULT_PATH, help=f"table path, .npz or .csv (default: {DEFAULT_PATH})")
+    parser.add_argument("--saves", default=SAVES_DIR, help=f"saves directory (default: {SAVES_DIR})")
+    parser.add_argument("--where", action="append", default=[], metavar="COL=VALUE", help="row filter, repeatable")
+    parser.add_argument("--hist", metavar="COLUMN", help="print a rating histogram of COLUMN")
+    parser.add_argument("--group-by", metavar="KEY", help="group rows by KEY (use with --value)")
+    parser.add_argument("--value", metavar="COLUMN", help="column aggregated by --group-by")
+    parser.add_argument("--agg", default="mean", choices=["count", "sum", "mean", "min", "max"])
+    args = parser.parse_args(argv)
+
+    table, report = sync_library(args.output, args.saves)
+    print(f"{report['path']}: {len(table)} saves "
+          f"(+{report['added']} ~{report['changed']} -{report['removed']}, {report['failed']} unreadable)")
+
+    if not (args.hist or args.group_by):
+        return 0
+    if np is None:
+        print("Queries need NumPy (pip install numpy); the CSV table above is up to date.", file=sys.stderr)
+        return 1
+
+    where = None
+    if args.where:
+        where = table.mask(**dict(item.split("=", 1) for item in args.where))
+
+    if args.hist:
+        for rating, count in zip(*table.histogram(args.hist, where)):
+            print(f"{rating:>3} {count:>6} {'#' * min(60, int(count))}")
+    if args.group_by:
+        for key, value in table.group_by(args.group_by, args.value or "spent_freebies", args.agg, where).items():
+            print(f"{key!s:<24} {value:>10.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+"""
+vtm_archive.py
+
+Moves cold saves (not modified for a number of days) out of saves/ into
+compressed bundles in saves/archive/, and reports what that saves on disk and
+costs in load time.
+
+Archived saves keep working everywhere: the library browser lists them,
+load_character() decompresses just the one member it needs, and saving one
+again writes a normal file (see tui/save_archive.py for the bundle format).
+
+The report times load_character() on a sample of archived saves against the
+same saves written back as plain files in a temporary folder, so the difference
+is the bundle lookup and decompression alone.
+
+Command line:
+    python vtm_archive.py                          # archive saves older than 90 days
+    python vtm_archive.py --days 30 --codec lzma
+    python vtm_archive.py --report
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import NamedTuple, Optional
+
+from tui import save_manager
+from tui.save_archive import CODECS
+
+# --- [CONSTANTS] ---
+REPORT_SAMPLE = 50   # Saves timed per report
+REPORT_REPEAT = 5    # Loads per save; the fastest counts
+
+# --- [REPORT] ---
+class ArchiveReport(NamedTuple):
+    bundles: int
+    members: int           # Archived saves (newest copy of each)
+    original_bytes: int    # What they took as plain files
+    archived_bytes: int    # Size of the bundles
+    loose_ms: float        # Mean load_character() time from a plain file
+    archived_ms: float     # Mean load_character() time from a bundle
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.archived_bytes
+
+    @property
+    def ratio(self) -> float:
+        return self.original_bytes / self.archived_bytes if self.archived_bytes else 0.0
+
+    def format(self) -> str:
+        if not self.members:
+            return "Nothing archived."
+        return "\n".join([
+            f"{self.members} saves in {self.bundles} bundles",
+            f"Plain files: {self.original_bytes / 1024:.1f} KiB, bundles: {self.archived_bytes / 1024:.1f} KiB "
+            f"({self.ratio:.1f}x, {self.saved_bytes / 1024:.1f} KiB saved)",
+            f"Load latency: {self.loose_ms:.3f} ms plain, {self.archived_ms:.3f} ms archived "
+            f"({self.archived_ms - self.loose_ms:+.3f} ms per load)",
+        ])
+
+def _time_loads(filenames, repeat: int, saves_dir: Optional[str] = None) -> float:
+    """Mean over filenames of the fastest of repeat load_character() calls (from saves_dir if given), in ms."""
+    total = 0.0
+    for filename in filenames:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            success, _ = save_manager.load_character(filename, saves_dir)
+            elapsed = time.perf_counter() - start
+            if not success:
+                break
+            best = elapsed if best is None else min(best, elapsed)
+        total += best or 0.0
+    return total / len(filenames) * 1000 if filenames else 0.0
+
+def build_report(sample: int = REPORT_SAMPLE, repeat: int = REPORT_REPEAT, seed: Optional[int] = 0) -> ArchiveReport:
+    """Sizes of every bundle in saves/archive/, and load latency over a random sample of archived saves."""
+    index = save_manager._archived_index()
+    bundles = {reader.path for reader, _ in index.values()}
+    original = sum(member.size for _, member in index.values())
+    archived = sum(os.path.getsize(path) for path in bundles)
+
+    names = sorted(index)
+    names = random.Random(seed).sample(names, min(sample, len(names)))
+    archived_ms = _time_loads(names, repeat)
+
+    # The same saves as plain files, in a scratch saves folder with no archive
+    scratch = tempfile.mkdtemp(prefix="vtm_archive_")
+    try:
+        for name in names:
+            reader, member = index[name]
+            with open(os.path.join(scratch, name + ".json"), "w") as f:
+                f.write(json.dumps(json.loads(reader.read(member.filename)), indent=2))
+        loose_ms = _time_loads(names, repeat, scratch)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    return ArchiveReport(len(bundles), len(index), original, archived, loose_ms, archived_ms)
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Archive cold saves into compressed bundles.")
+    parser.add_argument("--days", type=float, default=save_manager.ARCHIVE_AFTER_DAYS,
+                        help=f"archive saves not modified for this many days (default: {save_manager.ARCHIVE_AFTER_DAYS:g})")
+    parser.add_argument("--codec", choices=CODECS, default="zlib", help="compression (default: zlib)")
+    parser.add_argument("--saves", default=save_manager.SAVES_DIR, help=f"saves directory (default: {save_manager.SAVES_DIR})")
+    parser.add_argument("--report", action="store_true", help="only report space saved and load latency")
+    parser.add_argument("--sample", type=int, default=REPORT_SAMPLE, help=f"saves timed by --report (default: {REPORT_SAMPLE})")
+    args = parser.parse_args(argv)
+    save_manager.SAVES_DIR = args.saves
+
+    if args.report:
+        print(build_report(args.sample).format())
+        return 0
+
+    start = time.perf_counter()
+    success, result = save_manager.archive_saves(args.days, args.codec)
+    elapsed = time.perf_counter() - start
+    if not success:
+        print(result)
+        return 0 if result.startswith("No saves") else 1
+
+    print(f"Archived {len(result.archived)} saves into {result.bundle} in {elapsed:.2f}s")
+    print(f"{result.original_bytes / 1024:.1f} KiB -> {result.bundle_bytes / 1024:.1f} KiB "
+          f"({result.original_bytes / max(result.bundle_bytes, 1):.1f}x)")
+    for filename in result.kept:
+        print(f"Kept {filename}: saved again while archiving")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+"""
+vtm_autospend.py
+
+Spends a character's remaining points (freebies, or XP in experience mode) in
+one go, dot by dot, under a policy:
+
+  - clan:       in-clan disciplines first, lowest rating first, then balanced
+  - balanced:   always the lowest-rated trait, so dots spread across the sheet
+  - specialist: the highest-rated attributes, abilities and disciplines first,
+                pushed to the generation limit, then balanced
+
+Candidates sit in a heap keyed by the policy, so each dot is one pop and one
+push, with prices from the character's cumulative cost tables. Remaining points
+only go down and a trait's next dot only gets dearer, so a trait that can't be
+afforded once is dropped for good. An elder's 750 points plan in a few
+milliseconds. Ties are broken by a seeded RNG, so a seed always gives the same
+plan for the same sheet.
+
+plan_spend() doesn't touch the character; apply_plan() applies the whole plan
+as one change (one version bump), and refuses if the character changed since
+the plan was made.
+
+Command line:
+    python vtm_autospend.py saves/some_npc.json --policy clan --seed 7
+    python vtm_autospend.py saves/some_npc.json --policy specialist --save
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from typing import List, NamedTuple, Optional, Tuple
+
+from vtm_data import CLAN_DATA
+from vtm_npc_logic import VtMCharacter
+
+# --- [POLICIES] ---
+POLICIES = {
+    "clan":       "Clan disciplines first",
+    "balanced":   "Balanced",
+    "specialist": "Specialist",
+}
+SPECIALIST_CATEGORIES = ("Attribute", "Ability", "Discipline")
+
+# Character pool -> improve_trait category, in sheet order
+TRAIT_POOLS = (
+    ("attributes", "Attribute"), ("abilities", "Ability"), ("disciplines", "Discipline"),
+    ("backgrounds", "Background"), ("virtues", "Virtue"),
+)
+SINGLE_VALUES = (("humanity", "Humanity"), ("willpower", "Willpower"))
+
+# --- [PLAN TYPES] ---
+class SpendChange(NamedTuple):
+    category: str
+    trait: str
+    old: int
+    new: int
+    cost: int
+
+class SpendPlan(NamedTuple):
+    policy: str
+    seed: int
+    version: int               # Character version the plan was made against
+    changes: List[SpendChange] # One per raised trait, in sheet order
+    cost: int
+    remaining: int             # Points left over (nothing affordable)
+
+    def format(self, limit: Optional[int] = None) -> str:
+        """One line per raised trait; with limit, the rest are summarised."""
+        shown = self.changes if limit is None else self.changes[:limit]
+        lines = [f"{c.trait} {c.old}->{c.new} ({c.cost})" for c in shown]
+        if len(self.changes) > len(shown):
+            lines.append(f"... and {len(self.changes) - len(shown)} more")
+        return "\n".join(lines)
+
+def default_seed(character: VtMCharacter) -> int:
+    """Stable per-character seed, so the same sheet plans the same way across sessions."""
+    return zlib.crc32(character.name.encode("utf-8"))
+
+# --- [PLANNING] ---
+def _candidates(character: VtMCharacter) -> List[Tuple[str, str, int]]:
+    """(category, trait, rating) for every trait the planner may raise, in sheet order."""
+    found = []
+    for pool, category in TRAIT_POOLS:
+        for trait, data in getattr(character, pool).items():
+            found.append((category, trait, data["new"]))
+    for stat, category in SINGLE_VALUES:
+        found.append((category, category, getattr(character, stat)["new"]))
+    return found
+
+def _stages(character: VtMCharacter, policy: str):
+    """The policy as a list of (accepts(category, trait), priority(rating)) stages; lower priority first."""
+    balanced = (lambda category, trait: True, lambda rating: rating)
+    if policy == "balanced":
+        return [balanced]
+    if policy == "clan":
+        in_clan = set(CLAN_DATA.get(character.clan.title(), ()))
+        return [(lambda category, trait: category == "Discipline" and trait in in_clan, lambda rating: rating), balanced]
+    if policy == "specialist":
+        return [(lambda category, trait: category in SPECIALIST_CATEGORIES, lambda rating: -rating), balanced]
+    raise ValueError(f"Unknown policy '{policy}' (choose from: {', '.join(POLICIES)}).")
+
+def plan_spend(character: VtMCharacter, policy: str = "balanced", seed: Optional[int] = None) -> SpendPlan:
+    """Plans spending every remaining point under policy. Does not modify character."""
+    seed = default_seed(character) if seed is None else seed
+    if character.is_free_mode:
+        return SpendPlan(policy, seed, character.version, [], 0, 0)
+
+    rng = random.Random(seed)
+    candidates = _candidates(character)
+    ties = [rng.random() for _ in candidates]
+    ratings = [rating for _, _, rating in candidates]
+    tables = [character.cost_table(category, trait) for category, trait, _ in candidates]
+    limits = [character.get_trait_limit(category) for category, _, _ in candidates]
+    remaining = character.remaining_points
+
+    for accepts, priority in _stages(character, policy):
+        heap = [(priority(ratings[i]), ties[i], i) for i, (category, trait, _) in enumerate(candidates)
+                if accepts(category, trait) and ratings[i] < limits[i]]
+        heapq.heapify(heap)
+        while heap:
+            _, tie, i = heapq.heappop(heap)
+            rating = ratings[i]
+            price = tables[i][rating + 1] - tables[i][rating]
+            if price > remaining:
+                continue # Only gets dearer, and points only go down: drop it
+            ratings[i] = rating + 1
+            remaining -= price
+            if ratings[i] < limits[i]:
+                heapq.heappush(heap, (priority(ratings[i]), tie, i))
+
+    changes = []
+    for i, (category, trait, old) in enumerate(candidates):
+        if ratings[i] != old:
+            changes.append(SpendChange(category, trait, old, ratings[i], tables[i][ratings[i]] - tables[i][old]))
+    cost = sum(change.cost for change in changes)
+    return SpendPlan(policy, seed, character.version, changes, cost, remaining)
+
+# --- [APPLYING] ---
+def apply_plan(character: VtMCharacter, plan: SpendPlan) -> Tuple[bool, str]:
+    """Applies every change of plan at once (a single version bump). Returns (success, message)."""
+    if character.version != plan.version:
+        return False, "Character changed since the plan was made; plan again."
+    if not plan.changes:
+        return False, "Nothing affordable to spend on."
+
+    for change in plan.changes:
+        if change.category in ("Humanity", "Willpower"):
+            getattr(character, change.category.lower())["new"] = change.new
+        else:
+            character.get_trait_data(change.category, change.trait)["new"] = change.new
+    if character.xp_mode:
+        character.spent_xp += plan.cost
+    else:
+        character.spent_freebies += plan.cost
+    character.touch()
+    return True, f"Spent {plan.cost} {character.points_label} on {len(plan.changes)} traits ({POLICIES[plan.policy]})."
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Spend a saved character's remaining points under a policy.")
+    parser.add_argument("sheet", help="save file")
+    parser.add_argument("--policy", choices=POLICIES, default="balanced")
+    parser.add_argument("--seed", type=int, help="tie-break seed (default: derived from the name)")
+    parser.add_argument("--save", action="store_true", help="apply the plan and save the character back to its file")
+    args = parser.parse_args(argv)
+
+    with open(args.sheet, "r") as f:
+        character = VtMCharacter.from_dict(json.load(f))
+    start = time.perf_counter()
+    plan = plan_spend(character, args.policy, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(plan.format() or "Nothing affordable to spend on.")
+    print(f"\n{plan.cost} {character.points_label} planned, {plan.remaining} left, in {elapsed * 1000:.2f} ms (seed {plan.seed})")
+    if not args.save or not plan.changes:
+        return 0
+
+    from tui import save_manager
+    save_manager.SAVES_DIR = os.path.dirname(args.sheet) or "."
+    filename = os.path.basename(args.sheet)[:-5]
+    success, loaded = save_manager.load_character(filename) # Registers the revision, so the save is conflict-checked
+    if not success:
+        print(loaded)
+        return 1
+    success, message = apply_plan(loaded, plan_spend(loaded, args.policy, plan.seed))
+    if success:
+        success, message = save_manager.save_character(loaded, filename)
+    print(message)
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
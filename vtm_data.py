@@ -20,6 +20,13 @@ FREEBIE_COSTS = {
     "Attribute": 5, "Ability": 2, "Discipline": 7,
     "Background": 1, "Virtue": 2, "Humanity": 1, "Willpower": 1
 }
+# Experience costs: (first dot, multiplier). Every later dot costs current rating x multiplier.
+# V20 leaves Backgrounds to the Storyteller; current x 3 is the common house rule.
+XP_COSTS = {
+    "Attribute": (4, 4), "Ability": (3, 2),
+    "Discipline": (10, 5), "Caitiff Discipline": (10, 6), "Out-of-Clan Discipline": (10, 7),
+    "Background": (3, 3), "Virtue": (2, 2), "Humanity": (2, 2), "Willpower": (1, 1)
+}
 
 # --- [CHARACTER SHEETS LISTS] ---
 # Attributes
@@ -91,4 +98,71 @@ CLAN_DATA = {
     "Caitiff": [], # No In-Clan Disciplines
     "Pander": [], # No In-Clan Disciplines
     "Thin Blood": [] # No In-Clan Disciplines
-}
\ No newline at end of file
+}
+# --- [ARCHETYPE TEMPLATES] ---
+# Starting ratings as dense vectors, in the order of the lists above:
+#   attributes: Physical, Social, Mental (3 each)
+#   abilities:  Talents, Skills, Knowledges (10 each)
+#   virtues:    Conscience, Self-Control, Courage
+ARCHETYPE_DATA = {
+    "Enforcer": {
+        "description": "Muscle and intimidation for a domain or gang.",
+        "attributes": (4, 3, 3,  1, 2, 1,  3, 2, 2),
+        "abilities": (
+            2, 3, 0, 3, 0, 0, 3, 0, 2, 0,
+            0, 0, 2, 0, 2, 0, 3, 0, 1, 1,
+            0, 0, 0, 1, 0, 0, 0, 0, 0, 0,
+        ),
+        "virtues": (2, 3, 4), "humanity": 5, "willpower": 4,
+    },
+    "Gunman": {
+        "description": "Ranged killer, soldier or bodyguard.",
+        "attributes": (3, 4, 3,  1, 1, 1,  3, 2, 3),
+        "abilities": (
+            3, 3, 0, 2, 0, 0, 2, 1, 0, 0,
+            0, 1, 2, 0, 4, 0, 2, 0, 2, 2,
+            0, 0, 0, 1, 0, 2, 0, 0, 0, 1,
+        ),
+        "virtues": (2, 4, 3), "humanity": 5, "willpower": 5,
+    },
+    "Infiltrator": {
+        "description": "Thief, spy or assassin working unseen.",
+        "attributes": (2, 4, 2,  2, 3, 2,  3, 2, 3),
+        "abilities": (
+            3, 3, 1, 1, 0, 0, 0, 0, 2, 3,
+            0, 0, 1, 0, 1, 3, 1, 0, 3, 1,
+            0, 1, 0, 2, 0, 0, 0, 0, 0, 1,
+        ),
+        "virtues": (2, 4, 3), "humanity": 6, "willpower": 4,
+    },
+    "Socialite": {
+        "description": "Courtier, Harpy or scene queen.",
+        "attributes": (1, 2, 2,  4, 3, 4,  2, 2, 3),
+        "abilities": (
+            2, 0, 1, 0, 3, 3, 0, 2, 1, 3,
+            0, 0, 1, 3, 0, 0, 0, 2, 0, 0,
+            1, 0, 2, 0, 1, 0, 0, 2, 0, 0,
+        ),
+        "virtues": (3, 3, 2), "humanity": 7, "willpower": 4,
+    },
+    "Scholar": {
+        "description": "Researcher, archivist or occultist.",
+        "attributes": (1, 2, 2,  2, 1, 2,  3, 4, 3),
+        "abilities": (
+            2, 0, 2, 0, 1, 1, 0, 0, 0, 0,
+            0, 2, 0, 1, 0, 0, 0, 0, 0, 0,
+            3, 2, 1, 3, 1, 2, 3, 1, 2, 1,
+        ),
+        "virtues": (3, 4, 2), "humanity": 7, "willpower": 5,
+    },
+    "Mystic": {
+        "description": "Seer, cultist or hedge magician.",
+        "attributes": (1, 2, 2,  2, 2, 2,  4, 3, 3),
+        "abilities": (
+            2, 0, 4, 0, 3, 2, 1, 0, 0, 0,
+            2, 1, 0, 1, 0, 0, 0, 1, 1, 1,
+            2, 0, 0, 1, 0, 1, 4, 0, 0, 0,
+        ),
+        "virtues": (3, 4, 2), "humanity": 6, "willpower": 6,
+    },
+}
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+"""
+vtm_dice.py
+
+Dice-pool statistics for judging how dangerous an NPC is in a fight.
+
+A V20 pool (e.g. Dexterity + Firearms) rolls that many d10s against a
+difficulty. Each die at or above the difficulty is a success, each 1 cancels
+one success, and a roll with no successes but at least one 1 is a botch. With
+a specialty, 10s count as two successes.
+
+simulate() rolls pools with NumPy. Only the number of 1s, 10s and other
+successes matters, so every roll is a single multinomial draw, which keeps it
+at millions of rolls per second. The distribution depends only on (dice,
+difficulty, specialty), so library-wide runs simulate each distinct pool once.
+Without NumPy, exact_distribution() computes the same probabilities
+analytically.
+
+Results map net successes to probability; BOTCH (-1) is a botch and 0 a plain
+failure.
+
+Command line:
+    python vtm_dice.py saves/some_npc.json              # one sheet
+    python vtm_dice.py --library --sort Brawl           # every save, most dangerous first
+    python vtm_dice.py --pool 7 --difficulty 6 --trials 5000000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from math import factorial
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: exact_distribution() needs no NumPy
+    np = None
+
+from vtm_npc_logic import VtMCharacter
+
+# --- [CONSTANTS] ---
+BOTCH = -1
+DEFAULT_DIFFICULTY = 6
+DEFAULT_TRIALS = 200_000
+CHUNK_ROLLS = 1_000_000 # Multinomial draws per NumPy batch
+
+# Name -> (traits summed into the pool, difficulty). Traits are looked up in
+# attributes, abilities, then disciplines; a missing trait counts 0 dice.
+COMBAT_POOLS = {
+    "Brawl":     (("Dexterity", "Brawl"), 6),
+    "Melee":     (("Dexterity", "Melee"), 6),
+    "Firearms":  (("Dexterity", "Firearms"), 6),
+    "Dodge":     (("Dexterity", "Athletics"), 6),
+    "Soak":      (("Stamina", "Fortitude"), 6),
+    "Alertness": (("Perception", "Alertness"), 6),
+}
+
+# --- [RESULT TYPES] ---
+class PoolResult(NamedTuple):
+    name: str
+    traits: Tuple[str, ...]
+    dice: int
+    difficulty: int
+    distribution: Dict[int, float]  # Net successes (BOTCH = -1) -> probability
+
+    @property
+    def expected(self) -> float:
+        """Mean net successes (botches count as 0)."""
+        return sum(max(net, 0) * p for net, p in self.distribution.items())
+
+    @property
+    def p_success(self) -> float:
+        return sum(p for net, p in self.distribution.items() if net > 0)
+
+    @property
+    def p_botch(self) -> float:
+        return self.distribution.get(BOTCH, 0.0)
+
+def _face_probabilities(difficulty: int) -> Tuple[float, float, float, float]:
+    """P(one die is a 1, a 10, another success, anything else)."""
+    difficulty = min(max(difficulty, 2), 10)
+    p_mid = (10 - difficulty) / 10 # 2..9 at or above the difficulty
+    return 0.1, 0.1, p_mid, 1.0 - 0.2 - p_mid
+
+def _net(ones: int, tens: int, mid: int, specialty: bool) -> int:
+    successes = tens * (2 if specialty else 1) + mid
+    if successes == 0:
+        return BOTCH if ones else 0
+    return max(successes - ones, 0)
+
+# --- [SIMULATION] ---
+def simulate(dice: int, difficulty: int = DEFAULT_DIFFICULTY, trials: int = DEFAULT_TRIALS,
+             specialty: bool = False, rng=None) -> Dict[int, float]:
+    """Monte Carlo distribution of net successes for one pool (NumPy)."""
+    if np is None:
+        raise ImportError("NumPy is required for simulate() (pip install numpy); use exact_distribution() otherwise.")
+    if dice <= 0:
+        return {0: 1.0}
+    rng = rng or np.random.default_rng()
+    probabilities = _face_probabilities(difficulty)
+
+    counts = np.zeros(2 * dice + 2, dtype=np.int64) # Index = net + 1
+    remaining = trials
+    while remaining:
+        batch = min(remaining, CHUNK_ROLLS)
+        faces = rng.multinomial(dice, probabilities, size=batch) # Columns: ones, tens, mid, other
+        ones, tens, mid = faces[:, 0], faces[:, 1], faces[:, 2]
+        successes = tens * (2 if specialty else 1) + mid
+        net = np.maximum(successes - ones, 0)
+        net[(successes == 0) & (ones > 0)] = BOTCH
+        counts += np.bincount(net + 1, minlength=len(counts))
+        remaining -= batch
+
+    return {net - 1: count / trials for net, count in enumerate(counts.tolist()) if count}
+
+def exact_distribution(dice: int, difficulty: int = DEFAULT_DIFFICULTY, specialty: bool = False) -> Dict[int, float]:
+    """Exact distribution, summed over every (ones, tens, mid) split of the pool."""
+    if dice <= 0:
+        return {0: 1.0}
+    p_one, p_ten, p_mid, p_other = _face_probabilities(difficulty)
+    distribution: Dict[int, float] = {}
+    for ones in range(dice + 1):
+        for tens in range(dice - ones + 1):
+            for mid in range(dice - ones - tens + 1):
+                other = dice - ones - tens - mid
+                ways = factorial(dice) // (factorial(ones) * factorial(tens) * factorial(mid) * factorial(other))
+                p = ways * p_one ** ones * p_ten ** tens * p_mid ** mid * p_other ** other
+                net = _net(ones, tens, mid, specialty)
+                distribution[net] = distribution.get(net, 0.0) + p
+    return dict(sorted((net, p) for net, p in distribution.items() if p > 0))
+
+def pool_distribution(dice: int, difficulty: int, trials: int = DEFAULT_TRIALS, specialty: bool = False,
+                      rng=None, cache: Optional[dict] = None) -> Dict[int, float]:
+    """Simulates with NumPy when available, else computes exactly. Memoized in cache if given."""
+    key = (dice, difficulty, specialty)
+    if cache is not None and key in cache:
+        return cache[key]
+    if np is not None:
+        distribution = simulate(dice, difficulty, trials, specialty, rng)
+    else:
+        distribution = exact_distribution(dice, difficulty, specialty)
+    if cache is not None:
+        cache[key] = distribution
+    return distribution
+
+# --- [POOLS FROM SHEETS] ---
+def _rating(data: dict, trait: str) -> int:
+    for pool in ("attributes", "abilities", "disciplines"):
+        value = data.get(pool, {}).get(trait)
+        if value is not None:
+            return value["new"]
+    return 0
+
+def build_pools(sheet, pools: dict = COMBAT_POOLS) -> Dict[str, Tuple[Tuple[str, ...], int, int]]:
+    """Returns {pool name: (traits, dice, difficulty)} for a VtMCharacter or save dict."""
+    data = sheet.to_dict() if isinstance(sheet, VtMCharacter) else sheet
+    return {name: (traits, sum(_rating(data, t) for t in traits), difficulty)
+            for name, (traits, difficulty) in pools.items()}
+
+def readiness(sheet, pools: dict = COMBAT_POOLS, trials: int = DEFAULT_TRIALS,
+              rng=None, cache: Optional[dict] = None) -> List[PoolResult]:
+    """Success distributions for every pool of one sheet."""
+    cache = {} if cache is None else cache
+    return [PoolResult(name, traits, dice, difficulty, pool_distribution(dice, difficulty, trials, rng=rng, cache=cache))
+            for name, (traits, dice, difficulty) in build_pools(sheet, pools).items()]
+
+def library_readiness(saves_dir: str, pools: dict = COMBAT_POOLS, trials: int = DEFAULT_TRIALS,
+                      rng=None) -> Dict[str, List[PoolResult]]:
+    """
+    Readiness of every save in saves_dir, as {filename: results}. Sheets share
+    one distribution cache, so each distinct pool size is rolled only once.
+    """
+    results = {}
+    cache: dict = {}
+    if not os.path.isdir(saves_dir):
+        return results
+    with os.scandir(saves_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if not (entry.name.endswith(".json") and entry.is_file()):
+                continue
+            try:
+                with open(entry.path, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            results[entry.name[:-5]] = readiness(data, pools, trials, rng, cache)
+    return results
+
+# --- [MAIN] ---
+def _print_results(results: List[PoolResult]):
+    print(f"{'pool':<11}{'dice':>5}{'diff':>5}{'mean':>7}{'success':>9}{'botch':>7}  distribution")
+    for r in results:
+        dist = " ".join(f"{net if net != BOTCH else 'B'}:{p:.0%}" for net, p in r.distribution.items() if p >= 0.005)
+        print(f"{r.name:<11}{r.dice:>5}{r.difficulty:>5}{r.expected:>7.2f}{r.p_success:>9.0%}{r.p_botch:>7.1%}  {dist}")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="V20 dice-pool statistics for NPC sheets.")
+    parser.add_argument("sheet", nargs="?", help="save file to analyse")
+    parser.add_argument("--library", action="store_true", help="analyse every save in --saves")
+    parser.add_argument("--saves", default="saves", help="saves directory (default: saves)")
+    parser.add_argument("--sort", metavar="POOL", help="with --library, order by this pool's mean successes")
+    parser.add_argument("--pool", type=int, metavar="DICE", help="analyse a bare pool of DICE dice")
+    parser.add_argument("--difficulty", type=int, default=DEFAULT_DIFFICULTY)
+    parser.add_argument("--specialty", action="store_true", help="10s count double (with --pool)")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help=f"rolls per pool (default: {DEFAULT_TRIALS})")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible runs")
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(args.seed) if np is not None else None
+
+    if args.pool is not None:
+        start = time.perf_counter()
+        distribution = pool_distribution(args.pool, args.difficulty, args.trials, args.specialty, rng)
+        elapsed = time.perf_counter() - start
+        _print_results([PoolResult("pool", (), args.pool, args.difficulty, distribution)])
+        if np is not None:
+            print(f"\n{args.trials} rolls in {elapsed * 1000:.1f} ms ({args.trials / elapsed / 1e6:.1f}M rolls/s)")
+        else:
+            print("\n(exact; NumPy not installed)")
+        return 0
+
+    if args.library:
+        library = library_readiness(args.saves, trials=args.trials, rng=rng)
+        names = list(COMBAT_POOLS)
+        if args.sort:
+            if args.sort not in COMBAT_POOLS:
+                parser.error(f"--sort must be one of: {', '.join(names)}")
+            column = names.index(args.sort)
+            library = dict(sorted(library.items(), key=lambda item: -item[1][column].expected))
+        print(f"{'save':<28}" + "".join(f"{n:>10}" for n in names))
+        for filename, results in library.items():
+            print(f"{filename[:27]:<28}" + "".join(f"{r.expected:>10.2f}" for r in results))
+        return 0
+
+    if not args.sheet:
+        parser.error("give a save file, --library or --pool")
+    with open(args.sheet, "r") as f:
+        _print_results(readiness(json.load(f), trials=args.trials, rng=rng))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
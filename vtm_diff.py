@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+
+"""
+vtm_diff.py
+
+Diff and three-way merge for character sheets, for when two storytellers
+edit copies of the same NPC.
+
+  - diff_characters(a, b): per-trait base/new changes with their cost delta
+    (freebies, or XP for sheets in experience progression), plus changed
+    identity fields
+  - merge_characters(base, ours, theirs): takes every change made on only one
+    side, and reports traits both sides changed differently as conflicts
+  - diff_libraries(current_dir, backup_dir): diffs a whole saves/ folder against
+    a backup. Sheets are laid out as rows of one slot-indexed matrix, so finding
+    the changed saves and their cost deltas is a few array operations (NumPy);
+    without NumPy every pair is diffed one by one
+
+Inputs may be VtMCharacter objects or save dicts (from to_dict() or a save file).
+
+Command line:
+    python vtm_diff.py saves/old.json saves/new.json
+    python vtm_diff.py --merge base.json ours.json theirs.json -o merged.json
+    python vtm_diff.py --library saves_backup            # saves/ vs saves_backup/
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: only speeds up diff_libraries()
+    np = None
+
+from vtm_npc_logic import VtMCharacter, FREEBIE_TABLES, XP_TABLES, MAX_RATING, jump_cost, xp_cost_key
+
+# --- [CONSTANTS] ---
+# Trait pool -> cost table key, then single-value stats
+TRAIT_POOLS = {
+    "attributes": "Attribute", "abilities": "Ability", "disciplines": "Discipline",
+    "backgrounds": "Background", "virtues": "Virtue",
+}
+SINGLE_VALUES = {"humanity": "Humanity", "willpower": "Willpower"}
+
+# Identity fields compared and merged as plain values
+META_FIELDS = ("name", "clan", "age", "generation", "is_free_mode", "xp_mode", "total_xp")
+
+# Marks a slot the sheet doesn't have, in the library matrices
+ABSENT = -1
+
+# --- [RESULT TYPES] ---
+class TraitChange(NamedTuple):
+    category: str              # Pool name ("abilities") or stat ("humanity")
+    trait: str                 # Trait name; the stat name again for single values
+    old: Optional[Tuple[int, int]]  # (base, new), None when added
+    new: Optional[Tuple[int, int]]  # (base, new), None when removed
+    cost_delta: int            # Points spent on the trait, new minus old
+
+class CharacterDiff(NamedTuple):
+    fields: List[Tuple[str, object, object]]  # (field, old, new) identity changes
+    changes: List[TraitChange]
+    cost_delta: int            # Sum of the trait cost deltas
+    spent_delta: int           # spent_freebies (spent_xp in XP mode), new minus old
+    spent_field: str = "spent_freebies"
+
+    @property
+    def empty(self) -> bool:
+        return not self.fields and not self.changes and not self.spent_delta
+
+    @property
+    def points_label(self) -> str:
+        return "XP" if self.spent_field == "spent_xp" else "pts"
+
+    def format(self) -> str:
+        """Human-readable report, one line per change."""
+        if self.empty:
+            return "No differences."
+        lines = [f"{field:<20} {old!s} -> {new!s}" for field, old, new in self.fields]
+        points = self.points_label
+        for change in self.changes:
+            label = change.trait if change.trait == change.category else f"{change.category}.{change.trait}"
+            lines.append(f"{label:<28} {_format_value(change.old):>9} -> {_format_value(change.new):<9} "
+                         f"{change.cost_delta:+d} {points}")
+        unit = "XP" if self.spent_field == "spent_xp" else "Freebie"
+        lines.append(f"{unit} cost delta: {self.cost_delta:+d} ({self.spent_field} {self.spent_delta:+d})")
+        return "\n".join(lines)
+
+class MergeConflict(NamedTuple):
+    category: str              # Pool, stat, or "field" for identity fields
+    trait: str
+    base: object
+    ours: object
+    theirs: object
+
+class MergeResult(NamedTuple):
+    merged: dict               # Save dict; conflicting traits keep "ours"
+    conflicts: List[MergeConflict]
+
+def _format_value(value) -> str:
+    if value is None:
+        return "-"
+    base, new = value
+    return f"[{new}]" if base == new else f"[{base}->{new}]"
+
+# --- [HELPERS] ---
+def _as_dict(sheet) -> dict:
+    return sheet.to_dict() if isinstance(sheet, VtMCharacter) else sheet
+
+def _cells(data: dict) -> Dict[Tuple[str, str], Tuple[int, int]]:
+    """Flattens a sheet into {(category, trait): (base, new)}."""
+    cells = {}
+    for pool in TRAIT_POOLS:
+        for trait, val in data.get(pool, {}).items():
+            cells[(pool, trait)] = (val["base"], val["new"])
+    for stat in SINGLE_VALUES:
+        val = data.get(stat, {"base": 0, "new": 0})
+        cells[(stat, stat)] = (val["base"], val["new"])
+    return cells
+
+def _spent_field(data: dict) -> str:
+    return "spent_xp" if data.get("xp_mode") else "spent_freebies"
+
+def _table_key(data: dict, category: str, trait: str) -> Tuple[bool, str]:
+    """(is XP, cost key) of the table the sheet pays this trait from (XP tables once in XP mode)."""
+    cost_key = TRAIT_POOLS.get(category) or SINGLE_VALUES[category]
+    if data.get("xp_mode"):
+        return True, xp_cost_key(cost_key, trait, data.get("clan", ""))
+    return False, cost_key
+
+def _cost_table(data: dict, category: str, trait: str) -> Tuple[int, ...]:
+    is_xp, cost_key = _table_key(data, category, trait)
+    return XP_TABLES[cost_key] if is_xp else FREEBIE_TABLES[cost_key]
+
+def _cost(data: dict, category: str, trait: str, value: Optional[Tuple[int, int]]) -> int:
+    """Points spent on one trait: one cost table lookup from base to new."""
+    if value is None:
+        return 0
+    return jump_cost(_cost_table(data, category, trait), value[0], value[1])
+
+# --- [DIFF] ---
+def diff_characters(old, new) -> CharacterDiff:
+    """Reports what changed from old to new, trait by trait, in sheet order."""
+    a, b = _as_dict(old), _as_dict(new)
+    fields = [(field, a.get(field), b.get(field)) for field in META_FIELDS if a.get(field) != b.get(field)]
+
+    old_cells, new_cells = _cells(a), _cells(b)
+    changes = []
+    for key in list(old_cells) + [k for k in new_cells if k not in old_cells]:
+        before, after = old_cells.get(key), new_cells.get(key)
+        if before != after:
+            category, trait = key
+            changes.append(TraitChange(category, trait, before, after,
+                                       _cost(b, category, trait, after) - _cost(a, category, trait, before)))
+
+    return CharacterDiff(
+        fields=fields,
+        changes=changes,
+        cost_delta=sum(change.cost_delta for change in changes),
+        spent_delta=b.get(_spent_field(b), 0) - a.get(_spent_field(a), 0),
+        spent_field=_spent_field(b),
+    )
+
+# --- [MERGE] ---
+def _pick(base, ours, theirs) -> Tuple[object, bool]:
+    """Three-way choice for one value. Returns (value, conflicted)."""
+    if ours == theirs or theirs == base:
+        return ours, False
+    if ours == base:
+        return theirs, False
+    return ours, True
+
+def merge_characters(base, ours, theirs) -> MergeResult:
+    """
+    Three-way merge of two edited copies of base. A change made on one side
+    only is taken; a trait changed differently on both sides (including edited
+    on one side and removed on the other) is a conflict and keeps our value.
+    spent_freebies (spent_xp in XP mode) is re-derived so the merged trait
+    purchases stay paid for.
+
+    If one side started XP progression (which rebases every trait) while the
+    other changed traits, the two can't be priced together: that is reported as
+    an xp_mode conflict and our copy is returned unchanged.
+    """
+    b, o, t = _as_dict(base), _as_dict(ours), _as_dict(theirs)
+    conflicts = []
+    merged = {}
+
+    switched = None # The side that entered XP mode, when only one did
+    if bool(o.get("xp_mode")) != bool(t.get("xp_mode")):
+        switched, other = (o, t) if bool(o.get("xp_mode")) != bool(b.get("xp_mode")) else (t, o)
+        if _cells(other) != _cells(b):
+            conflict = MergeConflict("field", "xp_mode", b.get("xp_mode"), o.get("xp_mode"), t.get("xp_mode"))
+            return MergeResult(copy.deepcopy(o), [conflict])
+
+    for field in META_FIELDS:
+        value, conflicted = _pick(b.get(field), o.get(field), t.get(field))
+        merged[field] = value
+        if conflicted:
+            conflicts.append(MergeConflict("field", field, b.get(field), o.get(field), t.get(field)))
+
+    base_cells, our_cells, their_cells = _cells(b), _cells(o), _cells(t)
+    merged_cells = {}
+    # Our order first, then traits only they added
+    for key in list(our_cells) + [k for k in their_cells if k not in our_cells] + [k for k in base_cells]:
+        if key in merged_cells:
+            continue
+        value, conflicted = _pick(base_cells.get(key), our_cells.get(key), their_cells.get(key))
+        merged_cells[key] = value
+        if conflicted:
+            conflicts.append(MergeConflict(key[0], key[1], base_cells.get(key), our_cells.get(key), their_cells.get(key)))
+
+    for pool in TRAIT_POOLS:
+        merged[pool] = {}
+    for (category, trait), value in merged_cells.items():
+        if value is None:
+            continue
+        if category in SINGLE_VALUES:
+            merged[category] = {"base": value[0], "new": value[1]}
+        else:
+            merged[category][trait] = {"base": value[0], "new": value[1]}
+
+    if switched is not None:
+        # Only the switched side changed traits, so its purchases are the merged ones
+        merged["spent_freebies"] = switched.get("spent_freebies", 0)
+        merged["spent_xp"] = switched.get("spent_xp", 0)
+        return MergeResult(merged, conflicts)
+
+    # Same points as our copy, adjusted by what the merge bought or refunded
+    cost_change = sum(_cost(merged, c, n, merged_cells.get((c, n))) - _cost(o, c, n, our_cells.get((c, n)))
+                      for (c, n) in set(merged_cells) | set(our_cells))
+    spent = _spent_field(merged)
+    merged["spent_freebies"] = o.get("spent_freebies", 0)
+    merged["spent_xp"] = o.get("spent_xp", 0)
+    merged[spent] = o.get(spent, 0) + cost_change
+    return MergeResult(merged, conflicts)
+
+# --- [LIBRARY DIFF] ---
+class LibraryDiff(NamedTuple):
+    added: List[str]           # Filenames only in the current library
+    removed: List[str]         # Filenames only in the backup
+    changed: Dict[str, CharacterDiff]  # Filename -> diff from backup to current
+    unchanged: int
+
+class SlotIndex:
+    """Fixed (category, trait) -> column mapping shared by every sheet in a library diff."""
+
+    def __init__(self, sheets):
+        self.slots: Dict[Tuple[str, str], int] = {}
+        for data in sheets:
+            for key in _cells(data):
+                self.slots.setdefault(key, len(self.slots))
+        # Every cost table stacked into one array; table_ids() picks a row per cell
+        table_keys = [(False, key) for key in FREEBIE_TABLES] + [(True, key) for key in XP_TABLES]
+        self.tables = [XP_TABLES[key] if is_xp else FREEBIE_TABLES[key] for is_xp, key in table_keys]
+        self._table_row = {key: row for row, key in enumerate(table_keys)}
+        # (XP mode, clan) -> table row per slot; every other sheet with the same pair reuses it
+        self._slot_rows: Dict[Tuple[bool, str], List[int]] = {}
+
+    def _table_rows(self, data: dict) -> List[int]:
+        """The cost table row of every slot for one sheet. Only XP mode and clan change it."""
+        key = (True, (data.get("clan") or "").title()) if data.get("xp_mode") else (False, "")
+        rows = self._slot_rows.get(key)
+        if rows is None:
+            rows = self._slot_rows[key] = [self._table_row[_table_key(data, category, trait)]
+                                           for category, trait in self.slots]
+        return rows
+
+    def table_ids(self, sheets: list):
+        """Returns an int32 array (sheets, slots) of the cost table row each cell is priced from."""
+        return np.array([self._table_rows(data) for data in sheets], dtype=np.int32).reshape(len(sheets), len(self.slots))
+
+    def matrices(self, sheets: list):
+        """Returns (base, new) int32 arrays of shape (sheets, slots); missing traits are ABSENT."""
+        # One list of (base, new) pairs per sheet in slot order, converted in a single np.array call
+        keys, missing = list(self.slots), (ABSENT, ABSENT)
+        cells = np.array([[sheet.get(key, missing) for key in keys] for sheet in map(_cells, sheets)],
+                         dtype=np.int32).reshape(len(sheets), len(keys), 2)
+        return cells[:, :, 0], cells[:, :, 1]
+
+def _read_library(directory: str) -> Dict[str, dict]:
+    """Returns {filename: save dict} for every readable .json save in directory."""
+    sheets = {}
+    if not os.path.isdir(directory):
+        return sheets
+    with os.scandir(directory) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if not (entry.name.endswith(".json") and entry.is_file()):
+                continue
+            try:
+                with open(entry.path, "r") as f:
+                    sheets[entry.name[:-5]] = json.load(f)
+            except (OSError, ValueError):
+                continue
+    return sheets
+
+def _same_meta(a: dict, b: dict) -> bool:
+    return (all(a.get(f) == b.get(f) for f in META_FIELDS) and a.get("spent_freebies", 0) == b.get("spent_freebies", 0)
+            and a.get("spent_xp", 0) == b.get("spent_xp", 0))
+
+def diff_libraries(current_dir: str, backup_dir: str) -> LibraryDiff:
+    """
+    Diffs every save in current_dir against the same filename in backup_dir.
+    With NumPy the unchanged saves are filtered out in one vectorized compare,
+    and only the changed ones get a detailed per-trait diff.
+    """
+    current, backup = _read_library(current_dir), _read_library(backup_dir)
+    common = [name for name in current if name in backup]
+    added = [name for name in current if name not in backup]
+    removed = [name for name in backup if name not in current]
+
+    if np is not None and common:
+        old_sheets = [backup[name] for name in common]
+        new_sheets = [current[name] for name in common]
+        index = SlotIndex(old_sheets + new_sheets)
+        old_base, old_new = index.matrices(old_sheets)
+        new_base, new_new = index.matrices(new_sheets)
+        traits_changed = ((old_base != new_base) | (old_new != new_new)).any(axis=1)
+        candidates = [name for name, flag, old, new in zip(common, traits_changed, old_sheets, new_sheets)
+                      if flag or not _same_meta(old, new)]
+    else:
+        candidates = common
+
+    changed = {}
+    for name in candidates:
+        diff = diff_characters(backup[name], current[name])
+        if not diff.empty:
+            changed[name] = diff
+    return LibraryDiff(added, removed, changed, len(common) - len(changed))
+
+def library_cost_deltas(current: List[dict], backup: List[dict]) -> List[int]:
+    """
+    Cost delta per sheet pair (freebies, or XP for sheets in XP mode). Every
+    cell is priced with two gathers from the stacked cumulative cost tables,
+    so the whole library is a few array operations (NumPy).
+    """
+    if np is None:
+        return [diff_characters(old, new).cost_delta for old, new in zip(backup, current)]
+    index = SlotIndex(backup + current)
+    tables = np.array(index.tables, dtype=np.int64)
+
+    def spent(sheets):
+        ids = index.table_ids(sheets)
+        base, new = index.matrices(sheets)
+        # ABSENT cells have base == new, so clipping them to 0 prices them at 0
+        base, new = np.clip(base, 0, MAX_RATING), np.clip(new, 0, MAX_RATING)
+        return (tables[ids, new] - tables[ids, base]).sum(axis=1)
+
+    return (spent(current) - spent(backup)).tolist()
+
+# --- [MAIN] ---
+def _load_sheet(path: str) -> dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Diff or merge character sheets.")
+    parser.add_argument("files", nargs="*", help="OLD NEW to diff; BASE OURS THEIRS with --merge")
+    parser.add_argument("--merge", action="store_true", help="three-way merge BASE OURS THEIRS")
+    parser.add_argument("-o", "--output", help="write the merged sheet here (default: stdout)")
+    parser.add_argument("--library", metavar="BACKUP_DIR", help="diff a saves folder against BACKUP_DIR")
+    parser.add_argument("--saves", default="saves", help="current saves folder for --library (default: saves)")
+    args = parser.parse_args(argv)
+
+    if args.library:
+        result = diff_libraries(args.saves, args.library)
+        for name in result.added:
+            print(f"+ {name}")
+        for name in result.removed:
+            print(f"- {name}")
+        for name, diff in result.changed.items():
+            print(f"~ {name}: {len(diff.changes)} traits, {diff.cost_delta:+d} {diff.points_label}")
+        print(f"{len(result.added)} added, {len(result.removed)} removed, "
+              f"{len(result.changed)} changed, {result.unchanged} unchanged")
+        return 0
+
+    if args.merge:
+        if len(args.files) != 3:
+            parser.error("--merge needs BASE OURS THEIRS")
+        result = merge_characters(*(_load_sheet(path) for path in args.files))
+        text = json.dumps(result.merged, indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text)
+        else:
+            print(text)
+        for conflict in result.conflicts:
+            print(f"CONFLICT {conflict.category}.{conflict.trait}: base {conflict.base}, "
+                  f"ours {conflict.ours}, theirs {conflict.theirs} (kept ours)", file=sys.stderr)
+        return 1 if result.conflicts else 0
+
+    if len(args.files) != 2:
+        parser.error("diff needs OLD NEW")
+    print(diff_characters(*(_load_sheet(path) for path in args.files)).format())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+"""
+vtm_export.py
+
+Streaming multi-format sheet exporter. Each format is a set of templates
+compiled once at import time; characters are rendered one at a time from any
+iterable (e.g. a generator over the saves library) and written straight to a
+stream, so exporting the whole library is a single pass in constant memory.
+
+Formats: text, markdown, csv, html, json (Foundry/Roll20-style actor data).
+
+Command line:
+    python vtm_export.py -f markdown -o library.md           # every save
+    python vtm_export.py -f csv brujah_elder toreador_prince # selected saves to stdout
+"""
+
+import argparse
+import csv
+import html
+import io
+import json
+import os
+import sys
+from typing import Callable, Dict, Iterable, NamedTuple, TextIO
+
+from vtm_npc_logic import VtMCharacter, cached_render
+from vtm_data import ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST
+
+# --- [FORMAT TYPE] ---
+class ExportFormat(NamedTuple):
+    extension: str
+    header: str                              # Written once before the first sheet
+    separator: str                           # Written between sheets
+    footer: str                              # Written once after the last sheet
+    render: Callable[[VtMCharacter], str]    # One sheet
+
+# --- [HELPERS] ---
+def _value_str(val: dict) -> str:
+    return str(val['new']) if val['base'] == val['new'] else f"{val['base']}->{val['new']}"
+
+def _active_abilities(character: VtMCharacter) -> dict:
+    return {k: v for k, v in character.abilities.items() if v['new'] > 0}
+
+# --- [MARKDOWN] ---
+_MD_HEAD = "## {name} ({clan})\n\n*Age {age} · Generation {generation} · Freebies spent {spent}*\n"
+_MD_SECTION = "\n**{title}:** {traits}\n"
+_MD_TRAIT = "{name} {value}"
+
+def _render_markdown(character: VtMCharacter) -> str:
+    parts = [_MD_HEAD.format(name=character.name, clan=character.clan, age=character.age,
+                             generation=character.generation, spent=character.spent_freebies)]
+    sections = (
+        ("Attributes", character.attributes), ("Abilities", _active_abilities(character)),
+        ("Disciplines", character.disciplines), ("Backgrounds", character.backgrounds),
+        ("Virtues", character.virtues),
+    )
+    for title, traits in sections:
+        if traits:
+            joined = ", ".join(_MD_TRAIT.format(name=n, value=_value_str(v)) for n, v in traits.items())
+            parts.append(_MD_SECTION.format(title=title, traits=joined))
+    parts.append(_MD_SECTION.format(title="Humanity/Path", traits=character.humanity['new']))
+    parts.append(_MD_SECTION.format(title="Willpower", traits=character.willpower['new']))
+    return "".join(parts)
+
+# --- [CSV] ---
+# Fixed columns, so every row lines up with the single header written up front
+CSV_COLUMNS = (
+    ["name", "clan", "age", "generation", "is_free_mode", "spent_freebies"]
+    + ATTRIBUTES_LIST + ABILITIES_LIST + VIRTUES_LIST
+    + ["Humanity", "Willpower", "Disciplines", "Backgrounds"]
+)
+
+def _csv_line(values: list) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+    return buffer.getvalue()
+
+def _render_csv(character: VtMCharacter) -> str:
+    def new(pool, name):
+        return pool.get(name, {}).get('new', 0)
+    row = [character.name, character.clan, character.age, character.generation,
+           character.is_free_mode, character.spent_freebies]
+    row += [new(character.attributes, a) for a in ATTRIBUTES_LIST]
+    row += [new(character.abilities, a) for a in ABILITIES_LIST]
+    row += [new(character.virtues, v) for v in VIRTUES_LIST]
+    row += [character.humanity['new'], character.willpower['new']]
+    row += ["; ".join(f"{n} {v['new']}" for n, v in character.disciplines.items())]
+    row += ["; ".join(f"{n} {v['new']}" for n, v in character.backgrounds.items())]
+    return _csv_line(row).rstrip("\n")
+
+# --- [HTML] ---
+_HTML_HEAD = (
+    "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>VtM NPC Sheets</title>\n"
+    "<style>.statblock{border:1px solid #600;margin:1em;padding:.5em 1em;font-family:serif}"
+    ".statblock h2{color:#900;margin:.2em 0}.statblock dt{font-weight:bold}</style>\n"
+    "</head><body>\n"
+)
+_HTML_BLOCK = (
+    "<section class=\"statblock\">\n<h2>{name}</h2>\n"
+    "<p><em>{clan} · Age {age} · Generation {generation} · Freebies spent {spent}</em></p>\n"
+    "<dl>\n{sections}</dl>\n</section>"
+)
+_HTML_SECTION = "<dt>{title}</dt><dd>{traits}</dd>\n"
+
+def _render_html(character: VtMCharacter) -> str:
+    esc = html.escape
+    sections = []
+    for title, traits in (
+        ("Attributes", character.attributes), ("Abilities", _active_abilities(character)),
+        ("Disciplines", character.disciplines), ("Backgrounds", character.backgrounds),
+        ("Virtues", character.virtues),
+    ):
+        if traits:
+            joined = ", ".join(f"{esc(n)} {esc(_value_str(v))}" for n, v in traits.items())
+            sections.append(_HTML_SECTION.format(title=title, traits=joined))
+    sections.append(_HTML_SECTION.format(title="Humanity/Path", traits=character.humanity['new']))
+    sections.append(_HTML_SECTION.format(title="Willpower", traits=character.willpower['new']))
+    return _HTML_BLOCK.format(name=esc(character.name), clan=esc(character.clan), age=character.age,
+                              generation=character.generation, spent=character.spent_freebies,
+                              sections="".join(sections))
+
+# --- [JSON (VTT)] ---
+def _vtt_traits(pool: dict) -> dict:
+    return {name: {"value": val['new'], "base": val['base']} for name, val in pool.items()}
+
+def _render_json(character: VtMCharacter) -> str:
+    actor = {
+        "name": character.name,
+        "type": "npc",
+        "system": {
+            "clan":          character.clan,
+            "age":           character.age,
+            "generation":    character.generation,
+            "maxTrait":      character.max_trait_rating,
+            "freebiesSpent": character.spent_freebies,
+            "attributes":    _vtt_traits(character.attributes),
+            "abilities":     _vtt_traits(_active_abilities(character)),
+            "disciplines":   _vtt_traits(character.disciplines),
+            "backgrounds":   _vtt_traits(character.backgrounds),
+            "virtues":       _vtt_traits(character.virtues),
+            "humanity":      {"value": character.humanity['new']},
+            "willpower":     {"value": character.willpower['new']},
+        },
+    }
+    return json.dumps(actor, indent=2)
+
+# --- [REGISTRY] ---
+FORMATS: Dict[str, ExportFormat] = {
+    "text":     ExportFormat(".txt",  "", "\n\n", "\n", VtMCharacter._build_text_sheet),
+    "markdown": ExportFormat(".md",   "", "\n---\n\n", "", _render_markdown),
+    "csv":      ExportFormat(".csv",  _csv_line(CSV_COLUMNS), "\n", "\n", _render_csv),
+    "html":     ExportFormat(".html", _HTML_HEAD, "\n", "\n</body></html>\n", _render_html),
+    "json":     ExportFormat(".json", "[\n", ",\n", "\n]\n", _render_json),
+}
+
+def format_for_path(path: str, default: str = "text") -> str:
+    """Picks an export format from a filename's extension."""
+    ext = os.path.splitext(path)[1].lower()
+    for name, fmt in FORMATS.items():
+        if fmt.extension == ext:
+            return name
+    return default
+
+# --- [PUBLIC API] ---
+def render(character: VtMCharacter, fmt: str = "text") -> str:
+    """Renders one sheet, cached per character version."""
+    return cached_render(character, fmt, FORMATS[fmt].render)
+
+def export_stream(characters: Iterable[VtMCharacter], stream: TextIO, fmt: str = "text") -> int:
+    """
+    Writes every character from the iterable to stream in one pass.
+    Only one sheet is held in memory at a time. Returns the number written.
+    """
+    spec = FORMATS[fmt]
+    stream.write(spec.header)
+    count = 0
+    for character in characters:
+        if count:
+            stream.write(spec.separator)
+        stream.write(render(character, fmt))
+        count += 1
+    stream.write(spec.footer)
+    return count
+
+def export_file(characters: Iterable[VtMCharacter], path: str, fmt: str = None) -> tuple[bool, str]:
+    """
+    Exports characters to path (format from the extension unless given).
+    Returns (success, message).
+    """
+    fmt = fmt or format_for_path(path)
+    try:
+        with open(path, 'w', encoding="utf-8", newline="") as f:
+            count = export_stream(characters, f, fmt)
+        return True, f"Exported {count} sheet(s) as {fmt} to {path}"
+    except Exception as e:
+        return False, f"Failed to export: {str(e)}"
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    from tui.save_manager import iter_characters
+
+    parser = argparse.ArgumentParser(description="Export saved VtM NPC sheets.")
+    parser.add_argument("saves", nargs="*", help="save names to export (default: all saves)")
+    parser.add_argument("-f", "--format", choices=sorted(FORMATS), help="output format (default: from -o extension, else text)")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or (format_for_path(args.output) if args.output != "-" else "text")
+    characters = (character for _, character in iter_characters(args.saves or None))
+
+    if args.output == "-":
+        count = export_stream(characters, sys.stdout, fmt)
+        print(f"Exported {count} sheet(s) as {fmt}", file=sys.stderr)
+        return 0
+
+    success, msg = export_file(characters, args.output, fmt)
+    print(msg, file=sys.stderr)
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
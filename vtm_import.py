@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+
+"""
+vtm_import.py
+
+Reads plain-text sheets (as written by get_text_sheet() and the text export)
+back into VtMCharacter objects, and bulk-ingests folders of them into saves/.
+
+The parser is a single-pass state machine over lines, so a file holding many
+sheets (e.g. `vtm_export.py -f text` of a whole library) is read as a stream:
+each character is yielded as soon as its sheet ends. Traits are checked
+against vtm_data: unknown attribute/ability/virtue names, malformed lines and
+ratings above the generation's maximum are rejected and reported with their
+line number, while the rest of the sheet is kept.
+
+Limits of the text format: abilities at 0 are not listed (they are restored
+as 0), Free Mode is not recorded, and Humanity/Willpower show only their
+current rating (restored as base = new).
+
+Command line:
+    python vtm_import.py legacy_sheets/                    # every .txt under the folder
+    python vtm_import.py old.txt --dry-run                 # parse and report only
+    python vtm_import.py legacy_sheets/ --workers 8 --overwrite
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from vtm_data import ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST, GENERATION_DATA
+from vtm_npc_logic import VtMCharacter
+
+# --- [CONSTANTS] ---
+DEFAULT_WORKERS = os.cpu_count() or 4
+SHEET_EXTENSIONS = (".txt",)
+MAX_STAT_RATING = 10 # Humanity/Path and Willpower, regardless of generation
+
+# Section title -> character pool
+SECTIONS = {
+    "ATTRIBUTES": "attributes", "ABILITIES": "abilities", "DISCIPLINES": "disciplines",
+    "BACKGROUNDS": "backgrounds", "VIRTUES": "virtues", "OTHER": "other",
+}
+# Pools whose trait names must come from vtm_data (the others are free-form in the app)
+KNOWN_TRAITS = {
+    "attributes": frozenset(ATTRIBUTES_LIST),
+    "abilities": frozenset(ABILITIES_LIST),
+    "virtues": frozenset(VIRTUES_LIST),
+}
+OTHER_STATS = {"Humanity/Path": "humanity", "Willpower": "willpower"}
+
+_RULE = re.compile(r"^=+$")
+_NAME = re.compile(r"^NAME: (?P<name>.*) \((?P<clan>[^()]*)\)$")
+_AGE = re.compile(r"^Age: (?P<age>\d+) \| Generation: (?P<generation>\d+)(?:st|nd|rd|th)?$")
+_SPENT = re.compile(r"^Freebie Points Spent: (?P<spent>-?\d+)$")
+_XP = re.compile(r"^Experience Spent: (?P<spent>-?\d+)/(?P<total>\d+)$")
+_SECTION = re.compile(r"^--- (?P<title>[A-Z]+) ---$")
+_TRAIT = re.compile(r"^(?P<name>\S.*?)\s+\[(?P<base>\d+)(?:->(?P<new>\d+))?\]$")
+
+# --- [RESULT TYPES] ---
+class Rejected(NamedTuple):
+    source: str    # File path, or "<stream>"
+    line_no: int   # 1-based
+    line: str
+    reason: str
+
+class ParsedSheet(NamedTuple):
+    character: Optional[VtMCharacter]  # None when the header itself was unusable
+    line_no: int                       # Line of the sheet's NAME header
+    rejected: List[Rejected]
+
+# --- [STREAMING PARSER] ---
+class _SheetBuilder:
+    """Accumulates one sheet's lines; build() validates and creates the character."""
+
+    def __init__(self, source: str, line_no: int, name: str, clan: str):
+        self.source = source
+        self.line_no = line_no
+        self.name, self.clan = name, clan
+        self.age = self.generation = None
+        self.spent = 0
+        self.xp = None     # (spent, total) for sheets in XP progression
+        self.section = None
+        self.traits = []   # (line_no, line, pool, name, base, new)
+        self.rejected: List[Rejected] = []
+
+    def reject(self, line_no: int, line: str, reason: str):
+        self.rejected.append(Rejected(self.source, line_no, line, reason))
+
+    def feed(self, line_no: int, line: str):
+        if _RULE.match(line):
+            return
+        match = _SECTION.match(line)
+        if match:
+            self.section = SECTIONS.get(match["title"])
+            if self.section is None:
+                self.reject(line_no, line, f"unknown section '{match['title']}'")
+            return
+        if self.section is None:
+            match = _AGE.match(line)
+            if match:
+                self.age, self.generation = int(match["age"]), int(match["generation"])
+                return
+            match = _SPENT.match(line)
+            if match:
+                self.spent = int(match["spent"])
+                return
+            match = _XP.match(line)
+            if match:
+                self.xp = (int(match["spent"]), int(match["total"]))
+                return
+            self.reject(line_no, line, "unrecognised header line")
+            return
+
+        match = _TRAIT.match(line)
+        if not match:
+            self.reject(line_no, line, "expected 'Name [rating]' or 'Name [base->new]'")
+            return
+        base = int(match["base"])
+        new = int(match["new"]) if match["new"] is not None else base
+        self.traits.append((line_no, line, self.section, match["name"], base, new))
+
+    def build(self) -> ParsedSheet:
+        if self.age is None:
+            self.reject(self.line_no, f"NAME: {self.name} ({self.clan})", "sheet has no 'Age: .. | Generation: ..' line")
+            return ParsedSheet(None, self.line_no, self.rejected)
+        if self.generation not in GENERATION_DATA:
+            self.reject(self.line_no, f"NAME: {self.name} ({self.clan})", f"generation {self.generation} is outside 2-16")
+            return ParsedSheet(None, self.line_no, self.rejected)
+
+        character = VtMCharacter(self.name, self.clan, self.age, self.generation, _skip_clan_init=True)
+        character.abilities = {abil: {"base": 0, "new": 0} for abil in ABILITIES_LIST} # Zeros aren't listed
+        max_rating = character.max_trait_rating
+
+        for line_no, line, pool, name, base, new in self.traits:
+            if pool == "other":
+                stat = OTHER_STATS.get(name)
+                if stat is None:
+                    self.reject(line_no, line, f"unknown stat '{name}'")
+                elif new > MAX_STAT_RATING:
+                    self.reject(line_no, line, f"rating above {MAX_STAT_RATING}")
+                else:
+                    setattr(character, stat, {"base": new, "new": new}) # Only the current rating is written
+                continue
+            if pool in KNOWN_TRAITS and name not in KNOWN_TRAITS[pool]:
+                self.reject(line_no, line, f"unknown {'ability' if pool == 'abilities' else pool[:-1]} '{name}'")
+                continue
+            if max(base, new) > max_rating:
+                self.reject(line_no, line, f"rating above generation {self.generation} maximum of {max_rating}")
+                continue
+            getattr(character, pool)[name] = {"base": base, "new": new}
+
+        character.spent_freebies = self.spent
+        if self.xp is not None:
+            character.xp_mode = True
+            character.spent_xp, character.total_xp = self.xp
+        character.touch()
+        self.rejected.sort(key=lambda r: r.line_no)
+        return ParsedSheet(character, self.line_no, self.rejected)
+
+def iter_sheets(lines: Iterable[str], source: str = "<stream>") -> Iterator[ParsedSheet]:
+    """Parses sheets from an iterable of lines (e.g. an open file), yielding each as soon as it ends."""
+    builder = None
+    for line_no, raw in enumerate(lines, 1):
+        line = raw.rstrip("\r\n")
+        if not line.strip():
+            continue
+        match = _NAME.match(line)
+        if match:
+            if builder is not None:
+                yield builder.build()
+            builder = _SheetBuilder(source, line_no, match["name"], match["clan"])
+        elif builder is not None:
+            builder.feed(line_no, line)
+        elif not _RULE.match(line):
+            yield ParsedSheet(None, line_no, [Rejected(source, line_no, line, "text before the first 'NAME:' line")])
+    if builder is not None:
+        yield builder.build()
+
+def parse_file(path: str) -> Iterator[ParsedSheet]:
+    """Streams the sheets in one text file."""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from iter_sheets(f, path)
+
+# --- [BULK INGEST] ---
+class FileResult(NamedTuple):
+    path: str
+    sheets: int
+    lines: int
+    saved: List[str]                  # Save names written
+    failed: List[Tuple[str, str]]     # (character name, message)
+    rejected: List[Rejected]
+
+class IngestReport(NamedTuple):
+    files: List[FileResult]
+    seconds: float
+
+    @property
+    def sheets(self) -> int:
+        return sum(f.sheets for f in self.files)
+
+    @property
+    def lines(self) -> int:
+        return sum(f.lines for f in self.files)
+
+    def format(self) -> str:
+        saved = sum(len(f.saved) for f in self.files)
+        failed = [(f.path, name, msg) for f in self.files for name, msg in f.failed]
+        rejected = [r for f in self.files for r in f.rejected]
+        seconds = max(self.seconds, 1e-9)
+        lines = [f"{len(self.files)} file(s), {self.sheets} sheet(s), {saved} saved in {self.seconds:.2f} s "
+                 f"({self.sheets / seconds:.0f} sheets/s, {self.lines / seconds:.0f} lines/s)"]
+        for path, name, msg in failed:
+            lines.append(f"NOT SAVED {path}: {name}: {msg}")
+        for r in rejected:
+            lines.append(f"REJECTED {r.source}:{r.line_no}: {r.reason}: {r.line.strip()}")
+        return "\n".join(lines)
+
+def ingest_file(path: str, saves_dir: Optional[str] = None, overwrite: bool = False, dry_run: bool = False) -> FileResult:
+    """Parses one file and saves every character in it (worker entry point)."""
+    from tui import save_manager
+    old_dir = save_manager.SAVES_DIR
+    if saves_dir is not None:
+        save_manager.SAVES_DIR = saves_dir
+
+    sheets, saved, failed, rejected = 0, [], [], []
+    line_count = 0
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            counted = _LineCounter(f)
+            for parsed in iter_sheets(counted, path):
+                rejected.extend(parsed.rejected)
+                if parsed.character is None:
+                    continue
+                sheets += 1
+                if dry_run:
+                    continue
+                name = save_manager.default_save_name(parsed.character)
+                success, message = save_manager.save_character(parsed.character, name, force=overwrite)
+                if success:
+                    saved.append(name)
+                else:
+                    failed.append((parsed.character.name, message))
+            line_count = counted.count
+    except (OSError, UnicodeDecodeError) as e:
+        rejected.append(Rejected(path, 0, "", f"unreadable file: {e}"))
+    finally:
+        save_manager.SAVES_DIR = old_dir
+    return FileResult(path, sheets, line_count, saved, failed, rejected)
+
+class _LineCounter:
+    """Iterates a file's lines, counting them for the throughput report."""
+
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self.count = 0
+
+    def __iter__(self):
+        for line in self._lines:
+            self.count += 1
+            yield line
+
+def find_sheet_files(paths: Iterable[str]) -> List[str]:
+    """Expands folders (recursively) into their .txt files; files are kept as given."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                found.extend(os.path.join(root, name) for name in sorted(files) if name.endswith(SHEET_EXTENSIONS))
+        else:
+            found.append(path)
+    return found
+
+def ingest(paths: Iterable[str], workers: int = DEFAULT_WORKERS, saves_dir: Optional[str] = None,
+           overwrite: bool = False, dry_run: bool = False) -> IngestReport:
+    """
+    Parses and saves every sheet under paths, one file per task on a process
+    pool (parsing is CPU-bound; save_manager's file locks keep the saves safe).
+    """
+    files = find_sheet_files(paths)
+    start = time.perf_counter()
+    if workers <= 1 or len(files) <= 1:
+        results = [ingest_file(path, saves_dir, overwrite, dry_run) for path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(files) // (workers * 4))
+            results = list(pool.map(ingest_file, files, [saves_dir] * len(files), [overwrite] * len(files),
+                                    [dry_run] * len(files), chunksize=chunksize))
+    return IngestReport(results, time.perf_counter() - start)
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import plain-text sheets into the saves library.")
+    parser.add_argument("paths", nargs="+", help=".txt sheet files or folders of them")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"worker processes (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--saves", help="saves directory (default: saves)")
+    parser.add_argument("--overwrite", action="store_true", help="replace existing saves with the same name")
+    parser.add_argument("--dry-run", action="store_true", help="parse and validate only, save nothing")
+    args = parser.parse_args(argv)
+
+    report = ingest(args.paths, args.workers, args.saves, args.overwrite, args.dry_run)
+    print(report.format())
+    failed = any(f.failed or f.rejected for f in report.files)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
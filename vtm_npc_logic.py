@@ -3,20 +3,87 @@
 """ This module contains the character data and business logic for the tool. It is independent of the user interface. """
 
 # --- [IMPORTS] ---
+import bisect
+import itertools
 import sys
-from typing import Dict, List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
 
 # Import all data from the new 'vtm_data.py'
 from vtm_data import (
-    GENERATION_DATA, AGE_FREEBIE_BRACKETS, FREEBIE_COSTS,
+    GENERATION_DATA, AGE_FREEBIE_BRACKETS, FREEBIE_COSTS, XP_COSTS,
     ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST,
     CLAN_DATA, BACKGROUNDS_LIST, DISCIPLINES_LIST
 )
 
+# --- [COST TABLES] ---
+# Cost key -> cumulative cost of every rating from 0, so raising a trait from a to b
+# costs table[b] - table[a] (negative for a refund) with no per-dot loop.
+MAX_RATING = 10
+
+def _freebie_table(cost_per_dot: int) -> Tuple[int, ...]:
+    return tuple(rating * cost_per_dot for rating in range(MAX_RATING + 1))
+
+def _xp_table(first_dot: int, multiplier: int) -> Tuple[int, ...]:
+    table = [0, first_dot]
+    for rating in range(1, MAX_RATING):
+        table.append(table[-1] + rating * multiplier) # Next dot costs current rating x multiplier
+    return tuple(table)
+
+FREEBIE_TABLES: Dict[str, Tuple[int, ...]] = {key: _freebie_table(cost) for key, cost in FREEBIE_COSTS.items()}
+XP_TABLES: Dict[str, Tuple[int, ...]] = {key: _xp_table(*costs) for key, costs in XP_COSTS.items()}
+
+def xp_cost_key(category_name: str, trait_name: str, clan: str) -> str:
+    """XP_TABLES key for a trait; disciplines are priced by whether they are in-clan."""
+    if category_name != "Discipline":
+        return category_name
+    formatted_clan = clan.title()
+    if formatted_clan == "Caitiff":
+        return "Caitiff Discipline"
+    return "Discipline" if trait_name in CLAN_DATA.get(formatted_clan, ()) else "Out-of-Clan Discipline"
+
+def jump_cost(table: Tuple[int, ...], current: int, target: int) -> int:
+    """Cost of moving a trait from current to target with one cost table."""
+    return table[target] - table[current]
+
+# --- [RENDER CACHE] ---
+# (character uid, format) -> (version, rendered output). Bounded LRU.
+RENDER_CACHE_SIZE = 4096
+_render_cache: "OrderedDict[Tuple[int, str], Tuple[int, str]]" = OrderedDict()
+_render_lock = threading.Lock() # The cache is shared by the API server's worker threads
+
+def cached_render(character: "VtMCharacter", fmt: str, render: Callable[["VtMCharacter"], str]) -> str:
+    """
+    Returns render(character), reusing the previous output while the character's
+    version is unchanged. fmt names the output format (e.g. "text", "markdown").
+    """
+    key = (character.uid, fmt)
+    version = character.version
+    with _render_lock:
+        hit = _render_cache.get(key)
+        if hit is not None and hit[0] == version:
+            _render_cache.move_to_end(key)
+            return hit[1]
+
+    output = render(character)
+    with _render_lock:
+        _render_cache[key] = (version, output)
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    return output
+
 # --- [CHARACTER CLASS] ---
 class VtMCharacter:
     """Stores and manages a VtM character's progression."""
+    _uids = itertools.count(1)
+
     def __init__(self, name: str, clan: str, age: int, generation: int, is_free_mode: bool = False, _skip_clan_init: bool = False):
+        # uid never repeats within a process (unlike id()); version bumps on every mutation
+        self.uid = next(VtMCharacter._uids)
+        self.version = 0
+
         self.name = name
         self.clan = clan
         self.age = age
@@ -35,6 +102,11 @@ class VtMCharacter:
         self.total_freebies = sys.maxsize if self.is_free_mode else self._calculate_total_freebies()
         self.spent_freebies = 0
 
+        # Experience progression: once started, purchases and refunds are paid in XP
+        self.xp_mode = False
+        self.total_xp = 0
+        self.spent_xp = 0
+
         if not _skip_clan_init: # Automatically populate disciplines based on Clan (Case insensitive check)
             self._apply_clan_disciplines()
 
@@ -61,6 +133,12 @@ class VtMCharacter:
         State is one of: "normal", "empty", "free".
         Callers resolve state to a color attribute.
         """
+        if self.xp_mode:
+            if self.is_free_mode:
+                return f"Experience Spent: {self.spent_xp}", "free"
+            remaining = self.total_xp - self.spent_xp
+            return f"XP: {remaining}/{self.total_xp}", "empty" if remaining <= 0 else "normal"
+
         if self.is_free_mode:
             return f"Freebie Points Spent: {self.spent_freebies}", "free"
         
@@ -69,16 +147,22 @@ class VtMCharacter:
         state = "empty" if remaining <= 0 else "normal"
         return display, state
 
+    def touch(self):
+        """Marks the character as changed. Call after editing trait dicts directly."""
+        self.version += 1
+
     def set_initial_trait(self, category: str, trait_name: str, value: int):
         """Sets the initial base and new value for a named trait."""
         trait_dict = getattr(self, category)
         trait_dict[trait_name] = {"base": value, "new": value}
+        self.touch()
 
     def set_initial_value(self, category: str, value: int):
         """Sets the initial base and new value for a single-value stat."""
         stat = getattr(self, category)
         stat["base"] = value
         stat["new"] = value
+        self.touch()
 
     def get_trait_data(self, category_name: str, trait_name: str) -> Dict[str, int]:
         """Gets the data dictionary for a specific trait."""
@@ -89,11 +173,62 @@ class VtMCharacter:
         else:
             return getattr(self, category_name.lower())
 
+    def get_trait_limit(self, category_name: str) -> int:
+        """Returns the highest rating a trait of this category may reach."""
+        return 10 if category_name in ["Humanity", "Willpower"] else self.max_trait_rating
+
+    # --- Costs ---
+    @property
+    def points_label(self) -> str:
+        """Name of the currency trait changes are paid in."""
+        return "XP" if self.xp_mode else "Freebie Points"
+
+    @property
+    def remaining_points(self) -> int:
+        if self.xp_mode:
+            return self.total_xp - self.spent_xp
+        return self.total_freebies - self.spent_freebies
+
+    def cost_table(self, category_name: str, trait_name: str) -> Tuple[int, ...]:
+        """Cumulative cost table for a trait in the current progression mode."""
+        if self.xp_mode:
+            return XP_TABLES[xp_cost_key(category_name, trait_name, self.clan)]
+        return FREEBIE_TABLES[category_name]
+
+    def trait_cost(self, category_name: str, trait_name: str, current: int, target: int) -> int:
+        """Points needed to move a trait from current to target (negative for a refund)."""
+        return jump_cost(self.cost_table(category_name, trait_name), current, target)
+
+    def affordable_rating(self, category_name: str, trait_name: str, current: int, limit: int) -> int:
+        """Highest rating up to limit the remaining points can raise the trait to."""
+        if self.is_free_mode:
+            return limit
+        table = self.cost_table(category_name, trait_name)
+        reachable = bisect.bisect_right(table, table[current] + self.remaining_points) - 1
+        return max(current, min(limit, reachable))
+
+    def award_xp(self, amount: int) -> Tuple[bool, str]:
+        """
+        Awards amount XP. The first award ends freebie spending: every trait's
+        current rating becomes its base, so later refunds only return XP.
+        """
+        if amount <= 0:
+            return False, "Award at least 1 XP."
+        if not self.xp_mode:
+            for pool in (self.attributes, self.abilities, self.disciplines, self.backgrounds, self.virtues):
+                for data in pool.values():
+                    data["base"] = data["new"]
+            for stat in (self.humanity, self.willpower):
+                stat["base"] = stat["new"]
+            self.xp_mode = True
+        self.total_xp += amount
+        self.touch()
+        return True, f"Awarded {amount} XP ({self.total_xp - self.spent_xp} available)."
+
     # Trait modification
     def improve_trait(self, category_name: str, trait_name: str, target_value: int) -> Tuple[bool, str]:
-        """Attempts to modify a trait by spending or refunding freebie points. Returns (Success, Message)."""
-        cost_per_dot = FREEBIE_COSTS[category_name]
-        remaining_points = self.total_freebies - self.spent_freebies
+        """Attempts to modify a trait by spending or refunding freebie points (or XP). Returns (Success, Message)."""
+        remaining_points = self.remaining_points
 
         # Fetch trait data
         if category_name in ["Attribute", "Ability", "Discipline", "Background", "Virtue"]:
@@ -116,13 +251,13 @@ class VtMCharacter:
 
         # --- Generation Limit Check  ---
         # Do not increase stats above gen cap
-        limit = 10 if category_name in ["Humanity", "Willpower"] else self.max_trait_rating        
+        limit = self.get_trait_limit(category_name)
         if target_value > limit:
             return False, f"Cannot raise above generation limit ({limit})."
 
         # Calculate cost (positive) or refund (negative)
         dots_diff = target_value - current_rating
-        total_cost = dots_diff * cost_per_dot
+        total_cost = self.trait_cost(category_name, trait_name, current_rating, target_value)
 
         # If increasing, check affordability
         if total_cost > 0 and not self.is_free_mode and remaining_points < total_cost:
@@ -131,14 +266,19 @@ class VtMCharacter:
         # Apply changes
         trait_data["new"] = target_value
 
-        # Always track spent freebies unconditionally.
+        # Always track spent points unconditionally.
         # Works for both normal and free mode; negative total_cost handles refunds automatically
-        self.spent_freebies += total_cost
+        if self.xp_mode:
+            self.spent_xp += total_cost
+        else:
+            self.spent_freebies += total_cost
+        self.touch()
 
         action = "raised" if dots_diff > 0 else "lowered"
         points_label = "Cost" if dots_diff > 0 else "Refund"
-        
-        return True, f"'{trait_name}' {action} to {target_value}. {points_label}: {abs(total_cost)} points"
+        unit = "XP" if self.xp_mode else "points"
+
+        return True, f"'{trait_name}' {action} to {target_value}. {points_label}: {abs(total_cost)} {unit}"
 
     def remove_trait(self, category_name: str, trait_name: str) -> Tuple[bool, str]:
         """Removes a trait and refunds the points spent on it."""
@@ -153,25 +293,34 @@ class VtMCharacter:
         if trait_name not in target_dict:
             return False, "Trait not found."
 
-        # Calculate refund (Base + Dots)
-        data = target_dict[trait_name]
-        # Calculate how many dots were purchased (New - Base). 
+        # Refund the dots purchased (New - Base).
         # For added traits, Base is usually 0, so it refunds everything.
-        dots_purchased = data['new'] - data['base']
-        cost_per_dot = FREEBIE_COSTS.get(category_name, 0)
-        refund = dots_purchased * cost_per_dot
+        data = target_dict[trait_name]
+        refund = self.trait_cost(category_name, trait_name, data['base'], data['new'])
 
-        self.spent_freebies -= refund
+        if self.xp_mode:
+            self.spent_xp -= refund
+        else:
+            self.spent_freebies -= refund
         del target_dict[trait_name]
-        return True, f"Removed {trait_name}. Refunded {refund} points."
+        self.touch()
+        return True, f"Removed {trait_name}. Refunded {refund} {'XP' if self.xp_mode else 'points'}."
 
     def get_text_sheet(self) -> str:
-        """Generates a plain text representation of the character sheet."""
+        """
+        Generates a plain text representation of the character sheet.
+        Cached per character version (see cached_render).
+        """
+        return cached_render(self, "text", VtMCharacter._build_text_sheet)
+
+    def _build_text_sheet(self) -> str:
         lines = []
         lines.append("="*40)
         lines.append(f"NAME: {self.name} ({self.clan})")
         lines.append(f"Age: {self.age} | Generation: {self.generation}th")
         lines.append(f"Freebie Points Spent: {self.spent_freebies}")
+        if self.xp_mode:
+            lines.append(f"Experience Spent: {self.spent_xp}/{self.total_xp}")
         lines.append("="*40 + "\n")
 
         def format_section(title, data_dict):
@@ -204,6 +353,9 @@ class VtMCharacter:
             "generation":    self.generation,
             "is_free_mode":  self.is_free_mode,
             "spent_freebies": self.spent_freebies,
+            "xp_mode":       self.xp_mode,
+            "total_xp":      self.total_xp,
+            "spent_xp":      self.spent_xp,
             "attributes":    self.attributes,
             "abilities":     self.abilities,
             "disciplines":   self.disciplines,
@@ -237,5 +389,8 @@ class VtMCharacter:
         character.humanity    = data.get("humanity",    {"base": 0, "new": 0})
         character.willpower   = data.get("willpower",   {"base": 0, "new": 0})
         character.spent_freebies = data.get("spent_freebies", 0)
+        character.xp_mode  = data.get("xp_mode", False)
+        character.total_xp = data.get("total_xp", 0)
+        character.spent_xp = data.get("spent_xp", 0)
 
         return character
\ No newline at end of file
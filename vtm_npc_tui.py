@@ -9,21 +9,28 @@ user input, and uses on vtm_npc_logic.py for character management.
 
 import curses
 import sys
-import traceback
 from tui.utils import QuitApplication
 from tui.greeting_view import GreetingView
-from tui.setup_view import SetupView
-from tui.main_view import MainView
-from tui.final_view import FinalView
+from tui.save_manager import list_save_summaries, refresh_library
+from tui.runtime import AsyncRuntime, AsyncScreen
+from tui import runtime
 from tui import theme
+from tui import tracing
+
+# How often the save library index picks up files changed on disk, in seconds
+LIBRARY_REFRESH_SECONDS = 2.0
 
 # --- [TUI ORCHESTRATOR] ---
 class TUIApp:
     """Manages the overall application flow and views."""
 
     def __init__(self, stdscr):
-        self.stdscr = stdscr
+        # Views wait for keys through AsyncScreen, which keeps the event loop running
+        self.runtime = AsyncRuntime()
+        runtime.install(self.runtime)
+        self.stdscr = AsyncScreen(stdscr, self.runtime)
         self.character = None
+        self.characters = []
         
         # Hide cursor and enable keypad
         curses.curs_set(0)
@@ -35,10 +42,25 @@ class TUIApp:
 
     def run(self):
         """Main application orchestrator."""
+        try:
+            self._run_views()
+        finally:
+            runtime.install(None)
+            self.runtime.shutdown()
+
+    def _run_views(self):
+        # Only the greeting path is imported at startup; later views load on demand.
+        # Warm the save library index while the greeting screen waits for input
+        self.runtime.run_in_executor(list_save_summaries)
+
         try:
             # 0. Greeting
             greeting_view = GreetingView(self.stdscr)
-            result = greeting_view.run()
+            with tracing.span("GreetingView.run"):
+                result = greeting_view.run()
+
+            # Started after the greeting, so the loop (and asyncio import) stays off the first frame
+            self._schedule_library_refresh()
 
             if result.mode == "load":
                 # Skip SetupView entirely — character is already built
@@ -46,22 +68,41 @@ class TUIApp:
             else:
                 # 1. Setup
                 is_free_mode = result.mode == "free"
+                from tui.setup_view import SetupView
                 setup_view = SetupView(self.stdscr)
-                self.character = setup_view.run(is_free_mode=is_free_mode)
+                with tracing.span("SetupView.run", free=is_free_mode):
+                    self.character = setup_view.run(is_free_mode=is_free_mode)
                 if not self.character:
                     return
 
-            # 2. Main Interaction
+            # 2. Main Interaction (more characters can be opened as tabs)
+            from tui.main_view import MainView
             main_view = MainView(self.stdscr, self.character)
-            main_view.run()
+            try:
+                with tracing.span("MainView.run"):
+                    main_view.run()
+            finally:
+                self.characters = main_view.characters
 
         except QuitApplication:
             pass
 
-        # 3. Final Display
-        if self.character:
-            final_view = FinalView(self.stdscr, self.character)
-            final_view.show()
+        # 3. Final Display, one sheet per open character
+        from tui.final_view import FinalView
+        for character in self.characters or ([self.character] if self.character else []):
+            final_view = FinalView(self.stdscr, character)
+            with tracing.span("FinalView.show"):
+                final_view.show()
+
+    def _schedule_library_refresh(self):
+        """Keeps the save library index current on a timer; the disk scan runs on the executor."""
+        pending = None
+
+        def tick():
+            nonlocal pending
+            if pending is None or pending.done(): # Never stack scans on a slow network mount
+                pending = self.runtime.run_in_executor(refresh_library)
+        self.runtime.every(LIBRARY_REFRESH_SECONDS, tick)
 
 # --- [APP] ---
 def main(stdscr):
@@ -69,8 +110,22 @@ def main(stdscr):
     app = TUIApp(stdscr)
     app.run()
 
+def parse_args(argv=None):
+    import argparse # Only needed (and imported) when flags are given
+    parser = argparse.ArgumentParser(description="V20 NPC progression tool.")
+    parser.add_argument("--trace", nargs="?", const="1", metavar="PATH",
+                        help=f"write a span trace (default path: {tracing.DEFAULT_TRACE_PATH})")
+    parser.add_argument("--profile", metavar="PATH", help="capture a cProfile of the session to PATH")
+    parser.add_argument("--sample-ms", type=int, metavar="N", help="sample the UI call stack every N ms")
+    return parser.parse_args(argv)
+
 # --- [MAIN] ---
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        args = parse_args()
+        tracing.configure(args.trace, args.profile, args.sample_ms)
+    else:
+        tracing.configure() # Env vars only
     try:
         curses.wrapper(main)
     except QuitApplication:
@@ -78,5 +133,12 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\nExiting program. Goodbye!")
     except Exception as e:
+        import traceback
         traceback.print_exc()
-        input(f"\nAn error occurred: {e}. Press Enter to exit.")
\ No newline at end of file
+        input(f"\nAn error occurred: {e}. Press Enter to exit.")
+    finally:
+        for path in tracing.shutdown():
+            print(f"Trace written to {path}")
+        from tui.instrumentation import pop_exit_notices
+        for notice in pop_exit_notices():
+            print(notice, file=sys.stderr)
\ No newline at end of file
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+
+"""
+vtm_server.py
+
+Local HTTP JSON API for virtual tabletop integration. Exposes character
+creation, trait progression, save/load and sheet export over plain HTTP,
+using only the standard library.
+
+Requests are served by a fixed thread pool. Characters being worked on stay in
+a shared in-memory cache of hot characters (each with its own lock), so a VTT
+polling or progressing the same NPCs never touches the disk between saves.
+
+Endpoints (all bodies and responses are JSON):
+    GET  /health
+    GET  /characters                          hot ids and save filenames
+    POST /characters                          {name, clan, age, generation, is_free_mode?, archetype?, traits?}
+    POST /characters/load                     {filename}
+    GET  /characters/<id>                     full character state
+    GET  /characters/<id>/sheet?format=text   rendered sheet (any vtm_export format)
+    POST /characters/<id>/improve             {category, trait, value}
+    POST /characters/<id>/remove              {category, trait}
+    POST /characters/<id>/xp                  {amount}  starts or extends XP progression
+    POST /characters/<id>/save                {filename?, force?}  409 on a stale write
+
+Command line:
+    python vtm_server.py --port 8020 --workers 8
+"""
+
+import argparse
+import copy
+import json
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from vtm_npc_logic import (VtMCharacter, FREEBIE_COSTS, ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST,
+                           DISCIPLINES_LIST, BACKGROUNDS_LIST)
+from vtm_export import FORMATS, render
+from vtm_templates import get_template, apply_template
+from tui.save_manager import (save_character, load_character, default_save_name, find_conflict, forget_character,
+                              list_save_summaries, refresh_library, add_library_listener, remove_library_listener)
+from tui.save_watcher import DELETED
+
+# --- [CONSTANTS] ---
+# Category -> trait names create and improve accept (Humanity and Willpower take any name).
+# Disciplines and backgrounds are free-form in imports and older saves, so for those
+# any name the character already has is accepted as well.
+KNOWN_TRAITS = {
+    "Attribute": frozenset(ATTRIBUTES_LIST), "Ability": frozenset(ABILITIES_LIST),
+    "Virtue": frozenset(VIRTUES_LIST), "Discipline": frozenset(DISCIPLINES_LIST),
+    "Background": frozenset(BACKGROUNDS_LIST),
+}
+FREE_FORM_CATEGORIES = ("Discipline", "Background")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8020
+DEFAULT_WORKERS = 8
+HOT_CACHE_SIZE = 256      # Clean (saved) characters kept in memory
+MAX_BODY_BYTES = 1 << 20
+KEEPALIVE_TIMEOUT = 5     # Seconds an idle keep-alive connection may hold a worker
+WATCH_INTERVAL = 1.0      # Seconds between checks of saves/ for outside edits
+
+# Trait pools that can be seeded on creation, as in SetupView, with their improve category
+INITIAL_POOLS = {"attributes": "Attribute", "abilities": "Ability", "disciplines": "Discipline",
+                 "backgrounds": "Background", "virtues": "Virtue"}
+INITIAL_VALUES = {"humanity": "Humanity", "willpower": "Willpower"}
+
+class ApiError(Exception):
+    """Raised by handlers to send an error response with the given HTTP status."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+# --- [HOT CHARACTER CACHE] ---
+class _Entry:
+    __slots__ = ("character", "lock", "filename", "saved_version", "pins")
+
+    def __init__(self, character: VtMCharacter, filename: Optional[str]):
+        self.character = character
+        self.lock = threading.Lock()
+        self.filename = filename
+        self.saved_version = character.version if filename else None
+        self.pins = 0 # Handlers using the entry; pinned entries are never dropped
+
+    @property
+    def dirty(self) -> bool:
+        return self.saved_version != self.character.version
+
+class CharacterStore:
+    """
+    Thread-safe LRU of characters by id. Only characters whose latest version is
+    saved, and that no request is using (see checkout), are evicted; unsaved
+    work stays pinned until it is saved.
+    Ids are save filenames for loaded characters and "npc-<uid>" for new ones.
+    """
+
+    def __init__(self, capacity: int = HOT_CACHE_SIZE):
+        self.capacity = capacity
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, character: VtMCharacter, filename: str = None) -> str:
+        char_id = filename or f"npc-{character.uid}"
+        with self._lock:
+            self._entries[char_id] = _Entry(character, filename)
+            self._entries.move_to_end(char_id)
+            self._evict()
+        return char_id
+
+    @contextmanager
+    def checkout(self, char_id: str):
+        """
+        Yields the cached entry, loading saves/<char_id>.json on a miss. The
+        entry is pinned until the block ends, so it can't be evicted (and the
+        handler's change lost) while the handler is using it.
+        """
+        entry = self._pin(char_id)
+        try:
+            yield entry
+        finally:
+            with self._lock:
+                entry.pins -= 1
+
+    def _pin(self, char_id: str) -> _Entry:
+        char_id = _check_filename(char_id)
+        with self._lock:
+            entry = self._entries.get(char_id)
+            if entry is not None:
+                self._entries.move_to_end(char_id)
+                entry.pins += 1
+                return entry
+
+        success, result = load_character(char_id)
+        if not success:
+            raise ApiError(404, f"Unknown character '{char_id}'.")
+        with self._lock:
+            # Another thread may have loaded it meanwhile; keep the first copy
+            entry = self._entries.setdefault(char_id, _Entry(result, char_id))
+            self._entries.move_to_end(char_id)
+            entry.pins += 1
+            self._evict()
+        if entry.character is not result:
+            forget_character(result)
+        return entry
+
+    def ids(self) -> list:
+        with self._lock:
+            return list(self._entries)
+
+    def apply_save_events(self, events: list):
+        """
+        Drops clean cached characters whose save was deleted or rewritten by
+        someone else, so the next request reloads them. Unsaved work is kept;
+        saving it reports the conflict. Our own saves match the revision the
+        character remembers, so find_conflict() passes them over.
+        """
+        with self._lock:
+            candidates = [(event, self._entries.get(event.filename)) for event in events]
+        # Reading the saves happens outside the store lock, so requests don't wait on disk
+        stale = [(event.filename, entry) for event, entry in candidates
+                 if entry is not None and not entry.dirty
+                 and (event.kind == DELETED or find_conflict(entry.character, event.filename))]
+        with self._lock:
+            for filename, entry in stale:
+                # Still the same clean, unused entry? It may have been saved or checked out meanwhile
+                if self._entries.get(filename) is entry and not entry.dirty and not entry.pins:
+                    del self._entries[filename]
+                    forget_character(entry.character)
+
+    def _evict(self):
+        """Drops least recently used clean entries while over capacity. Caller holds _lock."""
+        excess = len(self._entries) - self.capacity
+        if excess <= 0:
+            return
+        for char_id in [cid for cid, e in self._entries.items() if not e.dirty and not e.pins][:excess]:
+            forget_character(self._entries.pop(char_id).character)
+
+# --- [HANDLERS] ---
+def _character_state(char_id: str, character: VtMCharacter) -> dict:
+    """Snapshot of a character for a response. Call with the entry lock held."""
+    remaining = None if character.is_free_mode else character.total_freebies - character.spent_freebies
+    remaining_xp = character.total_xp - character.spent_xp if character.xp_mode and not character.is_free_mode else None
+    return {"id": char_id, "version": character.version, "remaining_freebies": remaining,
+            "remaining_xp": remaining_xp, "character": copy.deepcopy(character.to_dict())}
+
+def _check_filename(filename) -> str:
+    """A save name the client may use: a plain name inside saves/, never a path."""
+    filename = str(filename)
+    separators = [sep for sep in (os.sep, os.altsep, "/") if sep]
+    if (not filename or ".." in filename or any(sep in filename for sep in separators)
+            or os.path.isabs(filename)):
+        raise ApiError(400, f"Invalid save name '{filename}'.")
+    return filename
+
+def _check_trait(character: VtMCharacter, category: str, trait) -> str:
+    """A trait name the character may use in category; raises ApiError 400 for unknown names."""
+    trait = str(trait)
+    known = KNOWN_TRAITS.get(category)
+    if known is None or trait in known:
+        return trait
+    if category in FREE_FORM_CATEGORIES and trait in getattr(character, f"{category.lower()}s"):
+        return trait
+    raise ApiError(400, f"Unknown {category.lower()} '{trait}'.")
+
+def _check_rating(character: VtMCharacter, category: str, trait: str, value) -> int:
+    """An initial rating within 0..the generation limit; raises ApiError 400 otherwise."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"Rating for '{trait}' must be an integer.")
+    limit = character.get_trait_limit(category)
+    if not 0 <= value <= limit:
+        raise ApiError(400, f"Rating for '{trait}' must be between 0 and {limit}.")
+    return value
+
+def _require(body: dict, *fields) -> list:
+    missing = [f for f in fields if f not in body]
+    if missing:
+        raise ApiError(400, f"Missing field(s): {', '.join(missing)}.")
+    return [body[f] for f in fields]
+
+def _create(store: CharacterStore, body: dict) -> dict:
+    name, clan, age, generation = _require(body, "name", "clan", "age", "generation")
+    try:
+        character = VtMCharacter(str(name), str(clan), int(age), int(generation), bool(body.get("is_free_mode", False)))
+        if body.get("archetype"):
+            template = get_template(str(body["archetype"]))
+            if template is None:
+                raise ApiError(400, f"Unknown archetype '{body['archetype']}'.")
+            apply_template(character, template) # Explicit traits below override it
+        traits = body.get("traits", {})
+        for pool, category in INITIAL_POOLS.items():
+            for trait, value in traits.get(pool, {}).items():
+                trait = _check_trait(character, category, trait)
+                character.set_initial_trait(pool, trait, _check_rating(character, category, trait, value))
+        for stat, category in INITIAL_VALUES.items():
+            if stat in traits:
+                character.set_initial_value(stat, _check_rating(character, category, stat, traits[stat]))
+    except (TypeError, ValueError, AttributeError) as e:
+        raise ApiError(400, f"Invalid character data: {e}")
+    char_id = store.add(character)
+    return {"ok": True, "message": f"Created '{character.name}'.", **_character_state(char_id, character)}
+
+def _load(store: CharacterStore, body: dict) -> dict:
+    filename, = _require(body, "filename")
+    with store.checkout(str(filename)) as entry, entry.lock:
+        return {"ok": True, "message": f"Loaded '{entry.character.name}'.", **_character_state(entry.filename, entry.character)}
+
+def _improve(entry: _Entry, char_id: str, body: dict) -> Tuple[int, dict]:
+    category, trait, value = _require(body, "category", "trait", "value")
+    if category not in FREEBIE_COSTS:
+        raise ApiError(400, f"Unknown category '{category}'.")
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, "value must be an integer.")
+    with entry.lock:
+        trait = _check_trait(entry.character, category, trait)
+        success, message = entry.character.improve_trait(category, trait, value)
+        state = _character_state(char_id, entry.character)
+    return (200 if success else 422), {"ok": success, "message": message, **state}
+
+def _remove(entry: _Entry, char_id: str, body: dict) -> Tuple[int, dict]:
+    category, trait = _require(body, "category", "trait")
+    with entry.lock:
+        success, message = entry.character.remove_trait(str(category), str(trait))
+        state = _character_state(char_id, entry.character)
+    return (200 if success else 422), {"ok": success, "message": message, **state}
+
+def _award_xp(entry: _Entry, char_id: str, body: dict) -> Tuple[int, dict]:
+    amount, = _require(body, "amount")
+    try:
+        amount = int(amount)
+    except (TypeError, ValueError):
+        raise ApiError(400, "amount must be an integer.")
+    with entry.lock:
+        success, message = entry.character.award_xp(amount)
+        state = _character_state(char_id, entry.character)
+    return (200 if success else 422), {"ok": success, "message": message, **state}
+
+def _save(entry: _Entry, char_id: str, body: dict) -> Tuple[int, dict]:
+    with entry.lock:
+        filename = _check_filename(body.get("filename") or entry.filename or default_save_name(entry.character))
+        version = entry.character.version
+        force = bool(body.get("force", False))
+        conflict = None if force else find_conflict(entry.character, filename)
+        if conflict:
+            return 409, {"ok": False, "message": f"Save conflict: {conflict}", "id": char_id, "filename": filename}
+        success, message = save_character(entry.character, filename, force)
+        if success:
+            entry.filename = filename
+            entry.saved_version = version
+    return (200 if success else 500), {"ok": success, "message": message, "id": char_id, "filename": filename}
+
+def _sheet(entry: _Entry, char_id: str, query: dict) -> dict:
+    fmt = query.get("format", ["text"])[0]
+    if fmt not in FORMATS:
+        raise ApiError(400, f"Unknown format '{fmt}'. Choose from: {', '.join(FORMATS)}.")
+    with entry.lock:
+        sheet = render(entry.character, fmt)
+    return {"ok": True, "id": char_id, "format": fmt, "sheet": sheet}
+
+# --- [ROUTING] ---
+_CHARACTER_ROUTE = re.compile(r"^/characters/([^/]+)(?:/(sheet|improve|remove|xp|save))?$")
+_CHARACTER_ACTIONS = {"improve": _improve, "remove": _remove, "xp": _award_xp, "save": _save}
+
+def dispatch(store: CharacterStore, method: str, path: str, query: dict, body: dict) -> Tuple[int, dict]:
+    """Routes one request. Returns (status, response dict); raises ApiError for client errors."""
+    if path == "/health":
+        return 200, {"ok": True}
+    if path == "/characters":
+        if method == "GET":
+            return 200, {"ok": True, "hot": store.ids(), "saves": [s.filename for s in list_save_summaries()]}
+        if method == "POST":
+            return 201, _create(store, body)
+        raise ApiError(405, "Use GET or POST.")
+    if path == "/characters/load" and method == "POST":
+        return 200, _load(store, body)
+
+    match = _CHARACTER_ROUTE.match(path)
+    if not match:
+        raise ApiError(404, f"No route for {path}.")
+    char_id, action = match.groups()
+
+    if action is None or action == "sheet":
+        if method != "GET":
+            raise ApiError(405, "Use GET.")
+        with store.checkout(char_id) as entry:
+            if action == "sheet":
+                return 200, _sheet(entry, char_id, query)
+            with entry.lock:
+                return 200, {"ok": True, **_character_state(char_id, entry.character)}
+
+    if method != "POST":
+        raise ApiError(405, "Use POST.")
+    with store.checkout(char_id) as entry:
+        return _CHARACTER_ACTIONS[action](entry, char_id, body)
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """Decodes JSON requests, dispatches them and encodes JSON responses."""
+    protocol_version = "HTTP/1.1" # Keep-alive, so VTT clients can reuse connections
+    server_version = "VtMNPC/1.0"
+    timeout = KEEPALIVE_TIMEOUT
+    disable_nagle_algorithm = True # Headers and body go out as separate small writes
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        try:
+            body = self._read_body() if method == "POST" else {}
+            status, payload = dispatch(self.server.store, method, url.path.rstrip("/") or "/", parse_qs(url.query), body)
+        except ApiError as e:
+            status, payload = e.status, {"ok": False, "message": str(e)}
+        except Exception as e:
+            status, payload = 500, {"ok": False, "message": f"Internal error: {e}"}
+        self._send(status, payload)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, "Request body too large.")
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return {}
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            raise ApiError(400, "Body is not valid JSON.")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Body must be a JSON object.")
+        return body
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+# --- [SERVER] ---
+class ApiServer(HTTPServer):
+    """HTTPServer that hands each connection to a fixed-size worker pool."""
+    daemon_threads = True
+
+    def __init__(self, address=(DEFAULT_HOST, DEFAULT_PORT), workers: int = DEFAULT_WORKERS,
+                 store: CharacterStore = None, verbose: bool = False):
+        super().__init__(address, ApiHandler)
+        self.store = store or CharacterStore()
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vtm-http")
+
+        # Watch saves/ so outside edits reach the hot cache (and /characters) without rescans
+        self._stop_watching = threading.Event()
+        list_save_summaries() # Builds the index and starts the watcher
+        add_library_listener(self.store.apply_save_events)
+        threading.Thread(target=self._watch, daemon=True, name="vtm-http-watch").start()
+
+    def _watch(self):
+        while not self._stop_watching.wait(WATCH_INTERVAL):
+            refresh_library()
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._stop_watching.set()
+        remove_library_listener(self.store.apply_save_events)
+        self.pool.shutdown(wait=True)
+
+def start_in_thread(address=(DEFAULT_HOST, 0), workers: int = DEFAULT_WORKERS) -> ApiServer:
+    """Starts a server on a background thread (port 0 picks a free port). Stop it with shutdown()."""
+    server = ApiServer(address, workers)
+    threading.Thread(target=server.serve_forever, daemon=True, name="vtm-http-accept").start()
+    return server
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the NPC progression API over HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"worker threads (default: {DEFAULT_WORKERS})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    server = ApiServer((args.host, args.port), args.workers, verbose=args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_port} with {args.workers} workers (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+"""
+vtm_snapshot.py
+
+Immutable, structurally shared snapshots of VtMCharacter state, for the
+undo/redo history behind MainView's U and R keys (one SnapshotHistory per tab).
+
+A snapshot stores each trait category as an immutable TraitTable of
+Trait(base, new) tuples. Taking a snapshot against the previous one reuses
+every table whose traits are unchanged, and inside a changed table reuses every
+unchanged Trait, so a long series of snapshots costs little more than the
+edits between them (compare to_dict() plus deepcopy, which duplicates every
+trait dict each time).
+
+Usage:
+    history = SnapshotHistory()
+    history.record(character)        # after each change
+    history.undo(character)          # rewinds character in place
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from vtm_npc_logic import VtMCharacter
+
+# --- [CONSTANTS] ---
+# Named trait pools, then single-value stats, as stored on VtMCharacter
+TRAIT_POOLS = ("attributes", "abilities", "disciplines", "backgrounds", "virtues")
+SINGLE_VALUES = ("humanity", "willpower")
+
+DEFAULT_HISTORY_LIMIT = 1000
+
+# --- [VALUE TYPES] ---
+class Trait(NamedTuple):
+    base: int
+    new: int
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"base": self.base, "new": self.new}
+
+class TraitTable(Mapping):
+    """Immutable trait name -> Trait map. "Changes" return a new table; untouched Traits are shared."""
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Trait] = None):
+        self._data = data or {}
+
+    # --- Mapping protocol ---
+    def __getitem__(self, name: str) -> Trait:
+        return self._data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"TraitTable({self._data!r})"
+
+    # --- Persistent updates ---
+    def set(self, name: str, base: int, new: int) -> "TraitTable":
+        current = self._data.get(name)
+        if current is not None and current.base == base and current.new == new:
+            return self
+        data = dict(self._data)
+        data[name] = Trait(base, new)
+        return TraitTable(data)
+
+    def remove(self, name: str) -> "TraitTable":
+        if name not in self._data:
+            return self
+        data = dict(self._data)
+        del data[name]
+        return TraitTable(data)
+
+    @classmethod
+    def from_pool(cls, pool: Dict[str, Dict[str, int]], previous: "TraitTable" = None) -> "TraitTable":
+        """
+        Builds a table from a live {name: {"base", "new"}} pool. Returns previous
+        itself when nothing differs, otherwise reuses its unchanged Traits.
+        """
+        old = previous._data if previous is not None else {}
+        data = {}
+        changed = len(pool) != len(old)
+        for name, val in pool.items():
+            trait = old.get(name)
+            if trait is None or trait.base != val["base"] or trait.new != val["new"]:
+                trait = Trait(val["base"], val["new"])
+                changed = True
+            data[name] = trait
+        if not changed and previous is not None and list(old) == list(data):
+            return previous
+        return cls(data)
+
+    def to_pool(self) -> Dict[str, Dict[str, int]]:
+        """Returns fresh mutable dicts, as VtMCharacter stores them."""
+        return {name: trait.to_dict() for name, trait in self._data.items()}
+
+# --- [SNAPSHOT] ---
+class CharacterSnapshot:
+    """Frozen character state. Compare tables with `is` to find what changed between snapshots."""
+    __slots__ = ("name", "clan", "age", "generation", "is_free_mode", "spent_freebies",
+                 "xp", "version", "tables", "values")
+
+    def __init__(self, name, clan, age, generation, is_free_mode, spent_freebies, xp: Tuple[bool, int, int],
+                 version, tables: Dict[str, TraitTable], values: Dict[str, Trait]):
+        for slot, value in (("name", name), ("clan", clan), ("age", age), ("generation", generation),
+                            ("is_free_mode", is_free_mode), ("spent_freebies", spent_freebies), ("xp", xp),
+                            ("version", version), ("tables", tables), ("values", values)):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CharacterSnapshot is immutable")
+
+    @classmethod
+    def capture(cls, character: VtMCharacter, previous: "CharacterSnapshot" = None) -> "CharacterSnapshot":
+        """Snapshots character, sharing everything unchanged with previous."""
+        prev_tables = previous.tables if previous is not None else {}
+        prev_values = previous.values if previous is not None else {}
+
+        tables = {pool: TraitTable.from_pool(getattr(character, pool), prev_tables.get(pool)) for pool in TRAIT_POOLS}
+        if previous is not None and all(tables[p] is prev_tables[p] for p in TRAIT_POOLS):
+            tables = prev_tables
+
+        values = {}
+        for stat in SINGLE_VALUES:
+            live = getattr(character, stat)
+            old = prev_values.get(stat)
+            values[stat] = old if old is not None and old == (live["base"], live["new"]) else Trait(live["base"], live["new"])
+        if previous is not None and all(values[s] is prev_values[s] for s in SINGLE_VALUES):
+            values = prev_values
+
+        xp = (character.xp_mode, character.total_xp, character.spent_xp)
+        return cls(character.name, character.clan, character.age, character.generation,
+                   character.is_free_mode, character.spent_freebies, xp, character.version, tables, values)
+
+    # --- Conversion ---
+    def to_dict(self) -> dict:
+        """Same shape as VtMCharacter.to_dict(), with fresh mutable dicts."""
+        data = {
+            "name":           self.name,
+            "clan":           self.clan,
+            "age":            self.age,
+            "generation":     self.generation,
+            "is_free_mode":   self.is_free_mode,
+            "spent_freebies": self.spent_freebies,
+            "xp_mode":        self.xp[0],
+            "total_xp":       self.xp[1],
+            "spent_xp":       self.xp[2],
+        }
+        for pool in TRAIT_POOLS:
+            data[pool] = self.tables[pool].to_pool()
+        for stat in SINGLE_VALUES:
+            data[stat] = self.values[stat].to_dict()
+        return data
+
+    def restore(self) -> VtMCharacter:
+        """Returns a new, independent character in this state."""
+        return VtMCharacter.from_dict(self.to_dict())
+
+    def apply_to(self, character: VtMCharacter):
+        """Rewinds character (same object, e.g. an open tab) to this state."""
+        for pool in TRAIT_POOLS:
+            setattr(character, pool, self.tables[pool].to_pool())
+        for stat in SINGLE_VALUES:
+            setattr(character, stat, self.values[stat].to_dict())
+        character.spent_freebies = self.spent_freebies
+        character.xp_mode, character.total_xp, character.spent_xp = self.xp
+        character.touch()
+
+    def changed_categories(self, other: "CharacterSnapshot") -> List[str]:
+        """Names of the categories that differ from other (identity check, O(categories))."""
+        changed = [pool for pool in TRAIT_POOLS if self.tables[pool] is not other.tables[pool]]
+        changed += [stat for stat in SINGLE_VALUES if self.values[stat] is not other.values[stat]]
+        return changed
+
+# --- [HISTORY] ---
+class SnapshotHistory:
+    """Bounded undo/redo timeline of snapshots for one character."""
+
+    def __init__(self, limit: int = DEFAULT_HISTORY_LIMIT):
+        self.limit = limit
+        self.snapshots: List[CharacterSnapshot] = []
+        self.position = -1        # Index of the current snapshot
+        self._live_version = None # Character version that matches the current snapshot
+
+    @property
+    def current(self) -> Optional[CharacterSnapshot]:
+        return self.snapshots[self.position] if self.snapshots else None
+
+    def record(self, character: VtMCharacter) -> CharacterSnapshot:
+        """Captures character if it changed since the current snapshot. Drops any redo branch."""
+        if self.snapshots and character.version == self._live_version:
+            return self.current
+        snapshot = CharacterSnapshot.capture(character, self.current)
+        del self.snapshots[self.position + 1:]
+        self.snapshots.append(snapshot)
+        if len(self.snapshots) > self.limit:
+            del self.snapshots[0]
+        self.position = len(self.snapshots) - 1
+        self._live_version = character.version
+        return snapshot
+
+    def undo(self, character: VtMCharacter) -> bool:
+        """Rewinds character one step. Returns False when there is nothing to undo."""
+        return self._step(character, -1)
+
+    def redo(self, character: VtMCharacter) -> bool:
+        """Re-applies an undone step. Returns False when there is nothing to redo."""
+        return self._step(character, 1)
+
+    def _step(self, character: VtMCharacter, delta: int) -> bool:
+        target = self.position + delta
+        if not 0 <= target < len(self.snapshots):
+            return False
+        self.position = target
+        # apply_to bumps the version (keeps render caches honest); remember it as in sync
+        self.current.apply_to(character)
+        self._live_version = character.version
+        return True
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""
+vtm_templates.py
+
+Archetype templates (Enforcer, Socialite, Scholar, ...) that fill in every
+starting attribute, ability, virtue, Humanity and Willpower of a new character
+in one pass, instead of one wizard prompt per trait.
+
+The ratings live in vtm_data.ARCHETYPE_DATA as dense vectors. They are zipped
+with the trait lists once at import, so applying a template is a handful of
+dict updates and a single version bump. BLANK_TEMPLATE (all zeros) is what Free
+Mode starts from.
+
+Command line (batch generator, saves to saves/):
+    python vtm_templates.py --list
+    python vtm_templates.py Enforcer --count 20 --clan Brujah --seed 7
+"""
+
+import argparse
+import random
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from vtm_data import ATTRIBUTES_LIST, ABILITIES_LIST, VIRTUES_LIST, CLAN_DATA, ARCHETYPE_DATA
+from vtm_npc_logic import VtMCharacter
+
+# --- [TEMPLATE TYPE] ---
+# Trait list each vector is aligned with, per character pool
+VECTOR_POOLS = (
+    ("attributes", ATTRIBUTES_LIST),
+    ("abilities", ABILITIES_LIST),
+    ("virtues", VIRTUES_LIST),
+)
+
+class Template(NamedTuple):
+    name: str
+    description: str
+    pools: Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], ...]  # (pool, ((trait, rating), ...))
+    humanity: int
+    willpower: int
+
+def _build_template(name: str, data: dict) -> Template:
+    pools = []
+    for pool, names in VECTOR_POOLS:
+        vector = data[pool]
+        if len(vector) != len(names):
+            raise ValueError(f"Archetype '{name}': {pool} has {len(vector)} ratings, expected {len(names)}.")
+        pools.append((pool, tuple(zip(names, vector))))
+    return Template(name, data["description"], tuple(pools), data["humanity"], data["willpower"])
+
+TEMPLATES: Dict[str, Template] = {name: _build_template(name, data) for name, data in ARCHETYPE_DATA.items()}
+
+BLANK_TEMPLATE = _build_template("Blank", {
+    "description": "Every trait at 0.",
+    "attributes": (0,) * len(ATTRIBUTES_LIST),
+    "abilities": (0,) * len(ABILITIES_LIST),
+    "virtues": (0,) * len(VIRTUES_LIST),
+    "humanity": 0, "willpower": 0,
+})
+
+def get_template(name: str) -> Optional[Template]:
+    """Case-insensitive lookup; None for unknown names (e.g. "Custom")."""
+    for template in (*TEMPLATES.values(), BLANK_TEMPLATE):
+        if template.name.lower() == name.strip().lower():
+            return template
+    return None
+
+# --- [APPLYING] ---
+def apply_template(character: VtMCharacter, template: Template):
+    """Sets every starting trait of character from template (base and new), bumping its version once."""
+    for pool, ratings in template.pools:
+        getattr(character, pool).update({trait: {"base": value, "new": value} for trait, value in ratings})
+    character.humanity = {"base": template.humanity, "new": template.humanity}
+    character.willpower = {"base": template.willpower, "new": template.willpower}
+    character.touch()
+
+# --- [BATCH GENERATOR] ---
+def generate_batch(template: Template, count: int, clan: Optional[str] = None,
+                   age_range: Tuple[int, int] = (50, 1000), generation_range: Tuple[int, int] = (8, 13),
+                   seed: Optional[int] = None) -> List[VtMCharacter]:
+    """
+    Builds count characters from one template, named "<Template> 001", ...
+    Clan (when not given), age and generation are drawn from a seeded RNG.
+    """
+    rng = random.Random(seed)
+    clans = sorted(CLAN_DATA)
+    characters = []
+    for i in range(1, count + 1):
+        character = VtMCharacter(
+            f"{template.name} {i:03d}",
+            clan or rng.choice(clans),
+            rng.randint(*age_range),
+            rng.randint(*generation_range),
+        )
+        apply_template(character, template)
+        characters.append(character)
+    return characters
+
+# --- [MAIN] ---
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate NPCs from archetype templates.")
+    parser.add_argument("archetype", nargs="?", help="template name (see --list)")
+    parser.add_argument("--list", action="store_true", help="list the templates and exit")
+    parser.add_argument("--count", type=int, default=1, help="characters to generate (default: 1)")
+    parser.add_argument("--clan", help="clan for every character (default: random)")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible batches")
+    args = parser.parse_args(argv)
+
+    if args.list or not args.archetype:
+        for template in TEMPLATES.values():
+            print(f"{template.name:<14}{template.description}")
+        return 0
+
+    template = get_template(args.archetype)
+    if template is None:
+        parser.error(f"unknown archetype '{args.archetype}' (choose from: {', '.join(TEMPLATES)})")
+
+    from tui.save_manager import save_character, default_save_name
+    failed = 0
+    for character in generate_batch(template, args.count, args.clan, seed=args.seed):
+        success, message = save_character(character, default_save_name(character))
+        print(message)
+        failed += not success
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())